@@ -51,6 +51,23 @@ LANGGRAPH_FULL_DEPS = LANGGRAPH_DEPS + [
     "pyOpenSSL>=26.0.0,<27.0.0",  # needed to avoid CVE present in earlier versions
 ]
 
+# Modules that can be compiled with mypyc. This is opt-in (set `PYAGENTSPEC_USE_MYPYC=1` at build
+# time, with mypy installed), the pure Python sources are used otherwise. When built, the compiled
+# extension modules take precedence over the Python sources at import time.
+MYPYC_MODULES = [
+    "src/pyagentspec/adapters/_utils.py",
+    "src/pyagentspec/adapters/langgraph/_agentspecconverter.py",
+]
+
+
+def get_ext_modules():
+    """Return the mypyc-compiled extension modules, if requested."""
+    if os.environ.get("PYAGENTSPEC_USE_MYPYC") != "1":
+        return []
+    from mypyc.build import mypycify
+
+    return mypycify(MYPYC_MODULES, opt_level="3")
+
 
 setup(
     name=NAME,
@@ -77,6 +94,7 @@ setup(
     keywords="NLP, text generation,code generation, LLM, Assistant, Tool, Agent",
     package_dir={"": "src"},
     packages=find_packages("src"),
+    ext_modules=get_ext_modules(),
     python_requires=">=3.10",
     install_requires=[
         # 3rd party dependencies (imported in code)
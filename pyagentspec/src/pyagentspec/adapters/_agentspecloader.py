@@ -52,7 +52,8 @@ class RuntimeToAgentSpecConverter(Protocol):
     def convert(
         self,
         runtime_component: _RuntimeComponentT,
-        referenced_objects: Optional[Dict[str, AgentSpecComponent]] = None,
+        # The keys under which converted components are referenced are specific to each adapter
+        referenced_objects: Optional[Dict[Any, AgentSpecComponent]] = None,
         **kwargs: Any,
     ) -> AgentSpecComponent:
         """Convert a runtime component into an Agent Spec component."""
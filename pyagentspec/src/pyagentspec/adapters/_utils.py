@@ -4,8 +4,11 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import re
-from typing import Any, Dict, List, Literal, Tuple, Union
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 
@@ -74,36 +77,161 @@ def render_template(template: Any, inputs: Dict[str, Any]) -> str:
     return _render_template_placeholders(template, inputs)
 
 
+def _compile_template(template: Any) -> Callable[[Dict[str, Any]], str]:
+    """Return a function rendering the given template using inputs, like ``render_template``.
+
+    The template is parsed once, so rendering it only substitutes its placeholders.
+    """
+    if not isinstance(template, str):
+        rendered_template = str(template)
+        return lambda inputs: rendered_template
+    literal_parts, placeholders = _parse_template(template)
+    if not placeholders:
+        return lambda inputs: template
+    return lambda inputs: _render_parsed_template(literal_parts, placeholders, inputs)
+
+
 def _render_template_placeholders(template: str, inputs: Dict[str, Any]) -> str:
     """Render placeholders found in the original template using the list of inputs."""
-    rendered_parts: List[str] = []
+    literal_parts, placeholders = _parse_template(template)
+    return _render_parsed_template(literal_parts, placeholders, inputs)
+
+
+@lru_cache(maxsize=512)
+def _parse_template(template: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """Split a template into its literal parts and its placeholders.
+
+    Placeholders are given by their name and their original text, including braces and inner
+    whitespace. There is one more literal part than placeholders, which come between them.
+    """
+    literal_parts: List[str] = []
+    placeholders: List[Tuple[str, str]] = []
     last_end: int = 0
 
     for match in re.finditer(TEMPLATE_PLACEHOLDER_REGEXP, template):
-        rendered_parts.append(template[last_end : match.start()])
-        # Original placeholder text as it appeared in the template, including braces and inner whitespace
-        full_placeholder = match.group(0)
-        # Only the placeholder name, extracted from inside {{ ... }}
-        input_title = match.group(1)
+        literal_parts.append(template[last_end : match.start()])
+        placeholders.append((match.group(1), match.group(0)))
+        last_end = match.end()
+
+    literal_parts.append(template[last_end:])
+    return tuple(literal_parts), tuple(placeholders)
+
+
+def _render_parsed_template(
+    literal_parts: Tuple[str, ...],
+    placeholders: Tuple[Tuple[str, str], ...],
+    inputs: Dict[str, Any],
+) -> str:
+    rendered_parts: List[str] = [literal_parts[0]]
+    for (input_title, full_placeholder), literal_part in zip(placeholders, literal_parts[1:]):
         if input_title in inputs:
             rendered_parts.append(str(inputs[input_title]))
         else:
             rendered_parts.append(full_placeholder)
-        last_end = match.end()
-
-    rendered_parts.append(template[last_end:])
+        rendered_parts.append(literal_part)
     return "".join(rendered_parts)
 
 
+# Field name, annotation, type of the default value, default value (`...` if required), description
+_FieldSpecT = Tuple[str, Any, type, Any, Optional[str]]
+
+
+def _make_field_spec(
+    name: str, annotation: Any, default: Any, description: Optional[str]
+) -> _FieldSpecT:
+    # The type of the default is part of the spec, as equal values of different types (e.g., `1`
+    # and `True`) have the same hash, but should not lead to the same model.
+    # Field names repeat across models (e.g., `messages`), interning them makes the comparisons
+    # done when looking up cached models cheap
+    return (sys.intern(name), annotation, type(default), default, description)
+
+
+def _create_model(
+    model_name: str, field_specs: Tuple[_FieldSpecT, ...], extra_forbid: bool
+) -> type[BaseModel]:
+    """
+    Create a Pydantic model with the given fields. Building a model (and its validator) is
+    expensive, so models are cached by their specification when it is hashable (i.e., when
+    annotations and defaults are), and the same model class is returned for identical specs.
+    """
+    try:
+        hash(field_specs)
+    except TypeError:
+        # Unhashable annotation or default value
+        return _create_model_uncached(model_name, field_specs, extra_forbid)
+    return _create_model_cached(model_name, field_specs, extra_forbid)
+
+
+def _create_model_uncached(
+    model_name: str, field_specs: Tuple[_FieldSpecT, ...], extra_forbid: bool
+) -> type[BaseModel]:
+    fields: Dict[str, Tuple[Any, Any]] = {
+        name: (annotation, Field(default, description=description))
+        for name, annotation, _, default, description in field_specs
+    }
+    model_kwargs: Dict[str, Any] = {}
+    if extra_forbid:
+        # Pydantic v2: pass a ConfigDict/dict into __config__
+        model_kwargs["__config__"] = ConfigDict(extra="forbid")
+    return create_model(model_name, **fields, **model_kwargs)  # type: ignore
+
+
+_create_model_cached = lru_cache(maxsize=512)(_create_model_uncached)
+
+
 class SchemaRegistry:
     def __init__(self) -> None:
         self.models: Dict[str, type[BaseModel]] = {}
+        # Types already built, by canonical JSON dump of their schema
+        self.types: Dict[str, Any] = {}
+
+
+def _get_json_schema_key(schema: Dict[str, Any]) -> str:
+    """Return a canonical string for the given JSON schema, equal for identical schemas."""
+    return json.dumps(schema, sort_keys=True, default=str)
+
+
+_PRIMITIVE_TYPES: Dict[Optional[str], Any] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "null": type(None),
+    "any": Any,
+    None: Any,
+    "": Any,
+}
+
+# Keys that make a schema more than its primitive `type`
+_COMPOSITE_SCHEMA_KEYS = ("enum", "anyOf", "oneOf", "properties", "required")
 
 
 def _build_type_from_schema(
     name: str,
     schema: Dict[str, Any],
     registry: SchemaRegistry,
+) -> Any:
+    # Most schemas are plain primitives (e.g., `{"type": "string"}`), which map directly to a type
+    t = schema.get("type")
+    if (
+        isinstance(t, str)
+        and t in _PRIMITIVE_TYPES
+        and not any(key in schema for key in _COMPOSITE_SCHEMA_KEYS)
+    ):
+        return _PRIMITIVE_TYPES[t]
+    # Identical (sub-)schemas are built only once, and share the same type (e.g., the same model)
+    schema_key = _get_json_schema_key(schema)
+    if schema_key in registry.types:
+        return registry.types[schema_key]
+    schema_type = _build_type_from_uncached_schema(name, schema, registry)
+    registry.types[schema_key] = schema_type
+    return schema_type
+
+
+def _build_type_from_uncached_schema(
+    name: str,
+    schema: Dict[str, Any],
+    registry: SchemaRegistry,
 ) -> Any:
     # Enum -> Literal[…]
     if "enum" in schema and isinstance(schema["enum"], list):
@@ -148,64 +276,81 @@ def _build_type_from_schema(
         props = schema.get("properties", {}) or {}
         required = set(schema.get("required", []))
 
-        fields: Dict[str, Tuple[Any, Any]] = {}
+        field_specs: List[_FieldSpecT] = []
         for prop_name, prop_schema in props.items():
             prop_type = _build_type_from_schema(f"{unique_name}_{prop_name}", prop_schema, registry)
             desc = prop_schema.get("description")
-            default_field = (
-                Field(..., description=desc)
-                if prop_name in required
-                else Field(None, description=desc)
+            field_specs.append(
+                _make_field_spec(prop_name, prop_type, ... if prop_name in required else None, desc)
             )
-            fields[prop_name] = (prop_type, default_field)
 
         # Enforce additionalProperties: False (extra=forbid)
         extra_forbid = schema.get("additionalProperties") is False
-        model_kwargs: Dict[str, Any] = {}
-        if extra_forbid:
-            # Pydantic v2: pass a ConfigDict/dict into __config__
-            model_kwargs["__config__"] = ConfigDict(extra="forbid")
 
-        model_cls = create_model(unique_name, **fields, **model_kwargs)  # type: ignore
+        model_cls = _create_model(unique_name, tuple(field_specs), extra_forbid)
         registry.models[unique_name] = model_cls
         return model_cls
 
     # primitives / fallback
-    mapping = {
-        "string": str,
-        "number": float,
-        "integer": int,
-        "boolean": bool,
-        "null": type(None),
-        "any": Any,
-        None: Any,
-        "": Any,
-    }
-    return mapping.get(t, Any)
+    return _PRIMITIVE_TYPES.get(t, Any)
+
+
+class _PropertiesKey:
+    """
+    Cache key of a list of properties, equal for properties with the same canonical JSON schemas.
+
+    The properties are carried along to build the model on a cache miss, but are not compared.
+    """
+
+    def __init__(self, properties: List[AgentSpecProperty]) -> None:
+        self.properties = properties
+        self.json_schema_keys = tuple(
+            _get_json_schema_key(property_.json_schema) for property_ in properties
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.json_schema_keys)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PropertiesKey) and self.json_schema_keys == other.json_schema_keys
 
 
 def create_pydantic_model_from_properties(
     model_name: str, properties: List[AgentSpecProperty]
+) -> type[BaseModel]:
+    # The JSON schema of a property holds its title, type, default and description, so tools
+    # with the same inputs (e.g., when loading the same configuration again) share the model
+    # without building the field annotations again
+    return _create_pydantic_model_from_properties_cached(model_name, _PropertiesKey(properties))
+
+
+@lru_cache(maxsize=512)
+def _create_pydantic_model_from_properties_cached(
+    model_name: str, properties_key: _PropertiesKey
+) -> type[BaseModel]:
+    return _create_pydantic_model_from_uncached_properties(model_name, properties_key.properties)
+
+
+def _create_pydantic_model_from_uncached_properties(
+    model_name: str, properties: List[AgentSpecProperty]
 ) -> type[BaseModel]:
     registry = SchemaRegistry()
-    fields: Dict[str, Tuple[Any, Any]] = {}
+    field_specs: List[_FieldSpecT] = []
 
     for property_ in properties:
         # Build the annotation from the json_schema (handles enum/array/object/etc.)
         annotation = _build_type_from_schema(property_.title, property_.json_schema, registry)
+        default = property_.default if property_.default is not _agentspec_empty_default else ...
+        field_specs.append(
+            _make_field_spec(property_.title, annotation, default, property_.description or None)
+        )
 
-        field_params: Dict[str, Any] = {}
-        if property_.description:
-            field_params["description"] = property_.description
-
-        if property_.default is not _agentspec_empty_default:
-            default_field = Field(property_.default, **field_params)
-        else:
-            default_field = Field(..., **field_params)
+    return _create_model(model_name, tuple(field_specs), extra_forbid=False)
 
-        fields[property_.title] = (annotation, default_field)
 
-    return create_model(model_name, **fields)  # type: ignore
+@lru_cache(maxsize=128)
+def _get_class_reference_prefix(cls: type) -> str:
+    return f"{cls.__name__.lower()}/"
 
 
 def _get_obj_reference(obj: Any) -> str:
@@ -213,4 +358,4 @@ def _get_obj_reference(obj: Any) -> str:
     Return a reference for the given object.
     Used in Runtime to Agent Spec converters to store converted objects in the registry.
     """
-    return f"{obj.__class__.__name__.lower()}/{id(obj)}"
+    return _get_class_reference_prefix(obj.__class__) + str(id(obj))
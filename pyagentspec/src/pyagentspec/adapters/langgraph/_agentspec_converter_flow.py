@@ -6,9 +6,11 @@
 
 
 from dataclasses import is_dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union, cast
 
 from pydantic import BaseModel, TypeAdapter, create_model
+from typing_extensions import TypeAlias
 
 from pyagentspec import Property
 from pyagentspec.adapters.langgraph._types import (
@@ -31,8 +33,14 @@ from pyagentspec.tools.servertool import ServerTool as AgentSpecServerTool
 if TYPE_CHECKING:
     from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
 
+# Converted components are registered either by the identity (`id`) of the LangGraph object
+# they were converted from, or by the name of the graph node they represent
+ReferencedObjectsT: TypeAlias = Dict[Union[int, str], AgentSpecComponent]
 
+
+@lru_cache(maxsize=1)
 def _langgraph_start_end() -> Tuple[str, str]:
+    # Resolved once, on first use, since langgraph is lazily imported
     return langgraph_graph.START, langgraph_graph.END
 
 
@@ -49,7 +57,7 @@ def _validate_conditional_edges_support(graph: LangGraphComponent) -> None:
 def _langgraph_graph_convert_to_agentspec(
     converter: "LangGraphToAgentSpecConverter",
     graph: LangGraphComponent,
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> AgentSpecFlow:
     START, END = _langgraph_start_end()
     _validate_conditional_edges_support(graph)
@@ -61,7 +69,7 @@ def _langgraph_graph_convert_to_agentspec(
         if node_name in (START, END):
             continue
         if isinstance(node.runnable, (StateGraph, CompiledStateGraph)):
-            subgraph_node = cast(AgentSpecFlow, converter.convert(node.runnable, {}))
+            subgraph_node = cast(AgentSpecFlow, converter._convert_referenced(node.runnable, {}))
             flow_node = FlowNode(
                 name=node_name,
                 subflow=subgraph_node,
@@ -126,7 +134,7 @@ def _langgraph_branch_convert_to_agentspec(
     source_node: str,
     branch_specs: Dict[str, BranchSpec],
     graph: StateGraph[Any, Any, Any, Any],
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> Tuple[List[AgentSpecNode], List[ControlFlowEdge], List[DataFlowEdge]]:
     _, END = _langgraph_start_end()
     additional_nodes: List[AgentSpecNode] = []
@@ -236,7 +244,7 @@ def _langgraph_branch_convert_to_agentspec(
 
 def _get_start_end_nodes(
     graph: StateGraph[Any, Any, Any],
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> Tuple[AgentSpecNode, AgentSpecNode]:
     START, END = _langgraph_start_end()
     if START not in referenced_objects:
@@ -330,7 +338,7 @@ def _langgraph_node_convert_to_agentspec(
     graph: StateGraph[Any, Any, Any],
     node_name: str,
     node: "StateNodeSpec[Any]",
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> AgentSpecNode:
     if node_name in referenced_objects:
         converted_node = referenced_objects[node_name]
@@ -364,7 +372,7 @@ def _langgraph_node_convert_to_agentspec(
 
 def _langgraph_edges_convert_to_agentspec_ctrl_flow(
     edge: Tuple[str, str],
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> ControlFlowEdge:
     from_, to = edge
     name = f"{from_}_to_{to}"
@@ -379,7 +387,7 @@ def _langgraph_edges_convert_to_agentspec_ctrl_flow(
 def _langgraph_edges_convert_to_agentspec_data_flow(
     graph: StateGraph[Any, Any, Any],
     edge: Tuple[str, str],
-    referenced_objects: Dict[str, AgentSpecComponent],
+    referenced_objects: ReferencedObjectsT,
 ) -> DataFlowEdge:
     START, _ = _langgraph_start_end()
     from_, to = edge
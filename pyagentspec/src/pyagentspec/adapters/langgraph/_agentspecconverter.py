@@ -4,11 +4,13 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
-import datetime
+import importlib.util
+import weakref
 from types import FunctionType, UnionType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -21,12 +23,13 @@ from typing import (
     get_origin,
 )
 
-from typing_extensions import Literal
+from typing_extensions import Literal, TypeAlias
 
 from pyagentspec import Property
-from pyagentspec.adapters._utils import _get_obj_reference
 from pyagentspec.adapters.langgraph._agentspec_converter_flow import (
+    ReferencedObjectsT,
     _langgraph_graph_convert_to_agentspec,
+    _langgraph_start_end,
 )
 from pyagentspec.adapters.langgraph._types import (
     BaseChatModel,
@@ -39,6 +42,7 @@ from pyagentspec.adapters.langgraph._types import (
     langchain_ollama,
     langchain_openai,
     langgraph_graph,
+    langgraph_swarm,
 )
 from pyagentspec.agent import Agent as AgentSpecAgent
 from pyagentspec.agenticcomponent import AgenticComponent as AgentSpecAgenticComponent
@@ -47,6 +51,7 @@ from pyagentspec.llms import LlmConfig as AgentSpecLlmConfig
 from pyagentspec.llms import OllamaConfig as AgentSpecOllamaConfig
 from pyagentspec.llms import OpenAiCompatibleConfig as AgentSpecOpenAiCompatibleConfig
 from pyagentspec.llms import OpenAiConfig as AgentSpecOpenAiConfig
+from pyagentspec.llms.ociclientconfig import OciClientConfig as AgentSpecOciClientConfig
 from pyagentspec.llms.ociclientconfig import (
     OciClientConfigWithApiKey as AgentSpecOciClientConfigWithApiKey,
 )
@@ -84,70 +89,254 @@ if TYPE_CHECKING:
         StreamableHttpConnection,
     )
 
+# Below, we use `[]` for mandatory keys and `.get` for NotRequired keys of the connection TypedDicts
+
+
+def _build_stdio_transport(
+    conn: Mapping[str, Any], session_params: SessionParameters
+) -> ClientTransport:
+    cwd = conn.get("cwd")
+    return StdioTransport(
+        name="agentspec_stdio_transport",
+        command=conn["command"],
+        args=conn["args"],
+        env=conn.get("env"),
+        cwd=str(cwd) if cwd is not None else None,
+        session_parameters=session_params,
+    )
+
+
+def _build_sse_transport(
+    conn: Mapping[str, Any], session_params: SessionParameters
+) -> ClientTransport:
+    return SSETransport(
+        name="agentspec_sse_transport",
+        url=conn["url"],
+        headers=conn.get("headers"),
+        session_parameters=session_params,
+    )
+
+
+def _build_streamable_http_transport(
+    conn: Mapping[str, Any], session_params: SessionParameters
+) -> ClientTransport:
+    return StreamableHTTPTransport(
+        name="agentspec_streamablehttp_transport",
+        url=conn["url"],
+        headers=conn.get("headers"),
+        session_parameters=session_params,
+    )
+
+
+# LangChain MCP connection transport -> builder of the equivalent Agent Spec client transport
+_TRANSPORT_BUILDERS: Dict[
+    str, Callable[[Mapping[str, Any], SessionParameters], ClientTransport]
+] = {
+    "stdio": _build_stdio_transport,
+    "sse": _build_sse_transport,
+    "streamable_http": _build_streamable_http_transport,
+}
+
+# OCI auth_type of the LangChain OCI chat model -> builder of the equivalent Agent Spec client config
+_OCI_CLIENT_CONFIG_BUILDERS: Dict[str, Callable[[Any], AgentSpecOciClientConfig]] = {
+    "INSTANCE_PRINCIPAL": lambda model: AgentSpecOciClientConfigWithInstancePrincipal(
+        name="oci_client", service_endpoint=model.service_endpoint
+    ),
+    "RESOURCE_PRINCIPAL": lambda model: AgentSpecOciClientConfigWithResourcePrincipal(
+        name="oci_client", service_endpoint=model.service_endpoint
+    ),
+    "API_KEY": lambda model: AgentSpecOciClientConfigWithApiKey(
+        name="oci_client",
+        service_endpoint=model.service_endpoint,
+        auth_profile=model.auth_profile,
+        auth_file_location=model.auth_file_location,
+    ),
+    "SECURITY_TOKEN": lambda model: AgentSpecOciClientConfigWithSecurityToken(
+        name="oci_client",
+        service_endpoint=model.service_endpoint,
+        auth_profile=model.auth_profile,
+        auth_file_location=model.auth_file_location,
+    ),
+}
+
+_LangGraphComponentShapeT: TypeAlias = Literal["swarm", "react", "graph"]
+_ConvertHandlerT: TypeAlias = Callable[[Any, ReferencedObjectsT], Optional[AgentSpecComponent]]
+
+_BaseChatModelConverterT: TypeAlias = Callable[
+    ["LangGraphToAgentSpecConverter", Any], AgentSpecLlmConfig
+]
+
+# Chat model class -> conversion method. Populated on first use, as the LangChain chat model
+# integrations are lazily imported.
+_BASECHATMODEL_CONVERTERS: Dict[type, _BaseChatModelConverterT] = {}
+# Same as above for the other chat model classes (the OCI chat model and the subclasses of the
+# supported chat models), resolved on first sight
+_RESOLVED_BASECHATMODEL_CONVERTERS: Dict[type, _BaseChatModelConverterT] = {}
+
+# Availability of the optional OCI integration is checked once, without importing it
+_LANGCHAIN_OCI_AVAILABLE = importlib.util.find_spec("langchain_oci") is not None
+_NOT_IMPORTED = object()
+_langchain_oci: Any = _NOT_IMPORTED if _LANGCHAIN_OCI_AVAILABLE else None
+
+
+def _get_langchain_oci() -> Any:
+    """Return the langchain_oci module, or None if it is not installed. The import is tried once."""
+    global _langchain_oci
+    if _langchain_oci is _NOT_IMPORTED:
+        try:
+            import langchain_oci  # type: ignore
+        except ImportError:
+            langchain_oci = None
+        _langchain_oci = langchain_oci
+    return _langchain_oci
+
+
+def _get_exact_basechatmodel_converter(model_type: type) -> Optional[_BaseChatModelConverterT]:
+    converters = _BASECHATMODEL_CONVERTERS
+    if not converters:
+        converters[langchain_ollama.ChatOllama] = (
+            LangGraphToAgentSpecConverter._chatollama_convert_to_agentspec
+        )
+        converters[langchain_openai.ChatOpenAI] = (
+            LangGraphToAgentSpecConverter._chatopenai_convert_to_agentspec
+        )
+    return converters.get(model_type)
+
+
+def _get_basechatmodel_converter(model_type: type) -> Optional[_BaseChatModelConverterT]:
+    converter = _get_exact_basechatmodel_converter(model_type)
+    if converter is not None:
+        return converter
+    converter = _RESOLVED_BASECHATMODEL_CONVERTERS.get(model_type)
+    if converter is not None:
+        return converter
+
+    # Other classes are resolved once. The OCI chat model is read from the (cached) langchain_oci
+    # module, and it takes precedence over the subclasses of the other supported chat models
+    langchain_oci = _get_langchain_oci()
+    if langchain_oci is not None and issubclass(model_type, langchain_oci.ChatOCIGenAI):
+        converter = LangGraphToAgentSpecConverter._chatocigenai_convert_to_agentspec
+    else:
+        for base_type in model_type.__mro__[1:]:
+            if base_type in _BASECHATMODEL_CONVERTERS:
+                converter = _BASECHATMODEL_CONVERTERS[base_type]
+                break
+    if converter is not None:
+        _RESOLVED_BASECHATMODEL_CONVERTERS[model_type] = converter
+    return converter
+
 
 class LangGraphToAgentSpecConverter:
 
     def __init__(self) -> None:
         # Dictionary of Agent Tool Node object ID -> set of tool names to ignore used by conversion
         self._tools_to_ignore: Dict[int, Set[str]] = {}
+        # Memoized shape (swarm, ReAct agent or generic graph) of the LangGraph builders
+        self._shape_cache: "weakref.WeakKeyDictionary[Any, _LangGraphComponentShapeT]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Chat model and system prompt extracted from the closure of a model node function, by id
+        self._model_and_prompt_cache: Dict[int, Tuple[Optional[BaseChatModel], str]] = {}
+        # Compiled swarm and its drawable graph, by id of the converted swarm component
+        self._compiled_swarm_cache: Dict[int, Tuple[CompiledStateGraph[Any, Any, Any], Any]] = {}
+        # Agent names parsed from swarm active agent annotations, by id of the annotation
+        self._agent_names_cache: Dict[int, List[str]] = {}
+        # Objects whose id is used as key in `referenced_objects` or in the caches above.
+        # The caches are scoped to a single top-level `convert` call, and so is this list unless
+        # the caller owns `referenced_objects`
+        self._keepalive: List[Any] = []
+        # Conversion handler by concrete class of the runtime component, see `_convert`
+        self._convert_handlers: Dict[type, _ConvertHandlerT] = {}
 
     def convert(
         self,
         runtime_component: LangGraphRuntimeComponent,
-        referenced_objects: Optional[Dict[str, AgentSpecComponent]] = None,
+        referenced_objects: Optional[ReferencedObjectsT] = None,
         **kwargs: Any,
     ) -> AgentSpecComponent:
         """Convert the given LangGraph component object into the corresponding PyAgentSpec component"""
+        owns_referenced_objects = referenced_objects is None
         if referenced_objects is None:
             referenced_objects = {}
-
+        try:
+            return self._convert_referenced(runtime_component, referenced_objects)
+        finally:
+            # The id-keyed caches are only valid during this conversion: components may be
+            # mutated or garbage collected afterwards
+            self._model_and_prompt_cache.clear()
+            self._compiled_swarm_cache.clear()
+            self._agent_names_cache.clear()
+            if owns_referenced_objects:
+                # Otherwise, the ids in the caller's `referenced_objects` must not be recycled
+                self._keepalive.clear()
+
+    def _convert_referenced(
+        self,
+        runtime_component: LangGraphRuntimeComponent,
+        referenced_objects: ReferencedObjectsT,
+    ) -> AgentSpecComponent:
         # Reuse the same object multiple times in order to exploit the referencing system
-        object_reference = _get_obj_reference(runtime_component)
-        if object_reference in referenced_objects:
-            return referenced_objects[object_reference]
-
-        referenced_objects[object_reference] = self._convert(
+        object_reference = id(runtime_component)
+        agentspec_component = referenced_objects.get(object_reference)
+        if agentspec_component is not None:
+            return agentspec_component
+
+        # Keep the component alive so that its id cannot be recycled while it is referenced
+        self._keepalive.append(runtime_component)
+        agentspec_component = self._convert(
             langgraph_component=runtime_component,
             referenced_objects=referenced_objects,
         )
-        return referenced_objects[object_reference]
+        referenced_objects[object_reference] = agentspec_component
+        return agentspec_component
 
     def _convert(
         self,
         langgraph_component: LangGraphRuntimeComponent,
-        referenced_objects: Dict[str, AgentSpecComponent],
+        referenced_objects: ReferencedObjectsT,
     ) -> AgentSpecComponent:
-        agentspec_component: Optional[AgentSpecComponent] = None
-        if isinstance(langgraph_component, StructuredTool):
-            agentspec_component = self._langgraph_any_tool_to_agentspec_tool(langgraph_component)
-        elif isinstance(langgraph_component, BaseChatModel):
-            agentspec_component = self._basechatmodel_convert_to_agentspec(langgraph_component)
-        elif self._is_swarm(langgraph_component):
-            agentspec_component = self._langgraph_swarm_convert_to_agentspec(
-                langgraph_component, referenced_objects
-            )
-        elif self._is_react_agent(langgraph_component):
-            agentspec_component = self._langgraph_agent_convert_to_agentspec(
-                langgraph_component, referenced_objects
-            )
-        else:
-            agentspec_component = _langgraph_graph_convert_to_agentspec(
-                self, langgraph_component, referenced_objects
-            )
+        # The handler is resolved once per concrete class of the component, through the (lazy)
+        # isinstance checks, then looked up by type
+        component_type = type(langgraph_component)
+        convert_handlers = self._convert_handlers
+        convert_handler = convert_handlers.get(component_type)
+        if convert_handler is None:
+            convert_handler = self._resolve_convert_handler(langgraph_component)
+            convert_handlers[component_type] = convert_handler
+        agentspec_component = convert_handler(langgraph_component, referenced_objects)
         if agentspec_component is None:
             raise NotImplementedError(f"Conversion for {langgraph_component} not implemented yet")
         return agentspec_component
 
-    def _is_react_agent(
+    def _resolve_convert_handler(
+        self, langgraph_component: LangGraphRuntimeComponent
+    ) -> _ConvertHandlerT:
+        if isinstance(langgraph_component, StructuredTool):
+            return lambda component, _: self._langgraph_any_tool_to_agentspec_tool(component)
+        if isinstance(langgraph_component, BaseChatModel):
+            return lambda component, _: self._basechatmodel_convert_to_agentspec(component)
+        return self._langgraph_component_convert_to_agentspec
+
+    def _langgraph_component_convert_to_agentspec(
         self,
         langgraph_component: LangGraphComponent,
-    ) -> bool:
-        if isinstance(langgraph_component, CompiledStateGraph):
-            langgraph_component = langgraph_component.builder
-        node = langgraph_component.nodes.get("model")
-        return node is not None and hasattr(node.runnable, "get_graph")
+        referenced_objects: ReferencedObjectsT,
+    ) -> Optional[AgentSpecComponent]:
+        shape = self._get_langgraph_component_shape(langgraph_component)
+        if shape == "swarm":
+            return self._langgraph_swarm_convert_to_agentspec(
+                langgraph_component, referenced_objects
+            )
+        if shape == "react":
+            return self._langgraph_agent_convert_to_agentspec(
+                langgraph_component, referenced_objects
+            )
+        return _langgraph_graph_convert_to_agentspec(self, langgraph_component, referenced_objects)
 
-    def _is_swarm(self, langgraph_component: LangGraphComponent) -> bool:
+    def _get_langgraph_component_shape(
+        self, langgraph_component: LangGraphComponent
+    ) -> _LangGraphComponentShapeT:
+        """Classify the component as a swarm, a ReAct agent or a generic graph, once per builder."""
         # Normalize the component so we can inspect the builder regardless of whether it has
         # already been compiled into a state graph or is still a builder instance.
         builder = (
@@ -155,7 +344,41 @@ class LangGraphToAgentSpecConverter:
             if isinstance(langgraph_component, CompiledStateGraph)
             else langgraph_component
         )
+        try:
+            return self._shape_cache[builder]
+        except KeyError:
+            pass
+        except TypeError:
+            # Builders that cannot be weakly referenced are probed every time
+            return self._probe_langgraph_component_shape(builder)
+        shape = self._probe_langgraph_component_shape(builder)
+        self._shape_cache[builder] = shape
+        return shape
+
+    @classmethod
+    def _probe_langgraph_component_shape(cls, builder: Any) -> _LangGraphComponentShapeT:
+        if cls._probe_swarm(builder):
+            return "swarm"
+        if cls._probe_react_agent(builder):
+            return "react"
+        return "graph"
+
+    def _is_react_agent(
+        self,
+        langgraph_component: LangGraphComponent,
+    ) -> bool:
+        return self._get_langgraph_component_shape(langgraph_component) == "react"
+
+    @staticmethod
+    def _probe_react_agent(builder: Any) -> bool:
+        node = builder.nodes.get("model")
+        return node is not None and hasattr(node.runnable, "get_graph")
 
+    def _is_swarm(self, langgraph_component: LangGraphComponent) -> bool:
+        return self._get_langgraph_component_shape(langgraph_component) == "swarm"
+
+    @staticmethod
+    def _probe_swarm(builder: Any) -> bool:
         # LangGraph swarms expose a `branches` mapping and a state schema describing swarm
         # bookkeeping state. If either is missing, we can immediately rule out the swarm shape.
         branches = getattr(builder, "branches", None)
@@ -164,13 +387,21 @@ class LangGraphToAgentSpecConverter:
         if not branches or not state_schema:
             return False
 
+        # Fast path: swarms created with the default state schema of langgraph_swarm. That schema is
+        # a TypedDict, which does not support subclass checks, so we compare identities
+        try:
+            if state_schema is langgraph_swarm.SwarmState:
+                return True
+        except ImportError:
+            pass
+
         # Swarms track which agent is currently active via an `active_agent` field on the
         # state schema. Without that annotation the structure cannot be a swarm.
         annotations = getattr(state_schema, "__annotations__", {}) or {}
         if "active_agent" not in annotations:
             return False
 
-        start_branches = branches.get(langgraph_graph.START, {})
+        start_branches = branches.get(_langgraph_start_end()[0], {})
         if not isinstance(start_branches, dict):
             return False
 
@@ -185,112 +416,148 @@ class LangGraphToAgentSpecConverter:
 
         return False
 
-    def _get_closure_cells(self, model_node: StateNodeSpec[Any, Any]) -> list[Any]:
-        """Extract and return the cell contents from the function's closure, or raise if invalid."""
+    def _get_closure_function(self, model_node: StateNodeSpec[Any, Any]) -> FunctionType:
+        """Return the function wrapped by the model node, or raise if its shape is unsupported."""
         runnable = getattr(model_node, "runnable", None)
         func = getattr(runnable, "func", None)
         if not isinstance(func, FunctionType) or func.__closure__ is None:
             raise ValueError("Unsupported runnable shape when extracting from closure")
-        return [cl.cell_contents for cl in func.__closure__]
+        return func
+
+    def _scan_model_node_closure(
+        self, model_node: StateNodeSpec[Any, Any]
+    ) -> Tuple[Optional[BaseChatModel], str]:
+        """
+        Find the chat model (if any) and the system prompt in the closure of a ReAct agent model
+        node, walking the closure cells only once.
+        """
+        func = self._get_closure_function(model_node)
+        func_id = id(func)
+        if func_id in self._model_and_prompt_cache:
+            return self._model_and_prompt_cache[func_id]
+
+        model: Optional[BaseChatModel] = None
+        system_message: Optional[SystemMessage] = None
+        for cell in func.__closure__ or ():
+            # Cell contents are read one at a time, and only until both values are found
+            try:
+                cell_contents = cell.cell_contents
+            except ValueError:
+                # Empty cell (variable not bound yet), it cannot hold the model nor the prompt
+                continue
+            if model is None and isinstance(cell_contents, BaseChatModel):
+                model = cell_contents
+            elif system_message is None and isinstance(cell_contents, SystemMessage):
+                system_message = cell_contents
+            else:
+                continue
+            if model is not None and system_message is not None:
+                break
+
+        model_and_prompt = (
+            model,
+            str(system_message.content) if system_message is not None else "",
+        )
+        self._keepalive.append(func)
+        self._model_and_prompt_cache[func_id] = model_and_prompt
+        return model_and_prompt
+
+    def _extract_model_and_prompt(
+        self, model_node: StateNodeSpec[Any, Any]
+    ) -> Tuple[BaseChatModel, str]:
+        model, system_prompt = self._scan_model_node_closure(model_node)
+        if model is None:
+            raise ValueError("No chat model found in the closure of the model node")
+        return model, system_prompt
 
     def _extract_basechatmodel_from_model_node(
         self, model_node: StateNodeSpec[Any, Any]
     ) -> BaseChatModel:
-        cells = self._get_closure_cells(model_node)
-        return next(cl for cl in cells if isinstance(cl, BaseChatModel))
+        return self._extract_model_and_prompt(model_node)[0]
 
     def _extract_prompt_from_model_node(self, model_node: StateNodeSpec[Any, Any]) -> str:
+        # The prompt does not depend on the presence of a chat model in the closure
         try:
-            cells = self._get_closure_cells(model_node)
-            system_message = next(cl for cl in cells if isinstance(cl, SystemMessage))
-            return str(system_message.content)
-        except (ValueError, StopIteration):
+            return self._scan_model_node_closure(model_node)[1]
+        except ValueError:
             return ""
 
     def _langgraph_server_tool_to_agentspec_tool(self, tool: StructuredTool) -> AgentSpecTool:
+        # `args` is computed from the tool schema at every access, so we read it only once
+        tool_args = tool.args
         return ServerTool(
             name=tool.name,
             description=tool.description,
-            inputs=[
-                Property(json_schema=property_json_schema, title=property_title)
-                for property_title, property_json_schema in tool.args.items()
-            ],
+            inputs=(
+                [
+                    Property(json_schema=property_json_schema, title=property_title)
+                    for property_title, property_json_schema in tool_args.items()
+                ]
+                if tool_args
+                else []
+            ),
         )
 
     def _basechatmodel_convert_to_agentspec(self, model: BaseChatModel) -> AgentSpecLlmConfig:
         """
         Convert a LangChain BaseChatModel into the closest Agent Spec LLM config.
         """
-        try:
-            from langchain_oci import ChatOCIGenAI as _ChatOCIGenAI  # type: ignore
-        except ImportError:
-            _ChatOCIGenAI = None
-
-        if _ChatOCIGenAI is not None and isinstance(model, _ChatOCIGenAI):
-            auth_type = model.auth_type
-            service_endpoint = model.service_endpoint
-            if auth_type == "INSTANCE_PRINCIPAL":
-                client_cfg: Any = AgentSpecOciClientConfigWithInstancePrincipal(
-                    name="oci_client", service_endpoint=service_endpoint
-                )
-            elif auth_type == "RESOURCE_PRINCIPAL":
-                client_cfg = AgentSpecOciClientConfigWithResourcePrincipal(
-                    name="oci_client", service_endpoint=service_endpoint
-                )
-            elif auth_type == "API_KEY":
-                client_cfg = AgentSpecOciClientConfigWithApiKey(
-                    name="oci_client",
-                    service_endpoint=service_endpoint,
-                    auth_profile=model.auth_profile,
-                    auth_file_location=model.auth_file_location,
-                )
-            elif auth_type == "SECURITY_TOKEN":
-                client_cfg = AgentSpecOciClientConfigWithSecurityToken(
-                    name="oci_client",
-                    service_endpoint=service_endpoint,
-                    auth_profile=model.auth_profile,
-                    auth_file_location=model.auth_file_location,
-                )
-            else:
-                raise ValueError(f"Unsupported OCI auth_type: {auth_type}")
-
-            return AgentSpecOciGenAiConfig(
-                name="oci",
-                model_id=model.model_id,
-                compartment_id=model.compartment_id,
-                client_config=client_cfg,
-                provider=AgentSpecModelProvider(model.provider.upper()) if model.provider else None,
-                api_type=AgentSpecOciAPIType.OCI,
+        converter = _get_basechatmodel_converter(type(model))
+        if converter is None:
+            raise ValueError(
+                f"The LLM instance provided is of an unsupported type `{type(model)}`."
             )
-        if isinstance(model, langchain_ollama.ChatOllama):
-            return AgentSpecOllamaConfig(
-                name=model.model,
-                url=model.base_url or "",
-                model_id=model.model,
+        return converter(self, model)
+
+    def _chatocigenai_convert_to_agentspec(self, model: Any) -> AgentSpecLlmConfig:
+        auth_type = model.auth_type
+        client_config_builder = _OCI_CLIENT_CONFIG_BUILDERS.get(auth_type)
+        if client_config_builder is None:
+            raise ValueError(f"Unsupported OCI auth_type: {auth_type}")
+        client_cfg = client_config_builder(model)
+
+        return AgentSpecOciGenAiConfig(
+            name="oci",
+            model_id=model.model_id,
+            compartment_id=model.compartment_id,
+            client_config=client_cfg,
+            provider=AgentSpecModelProvider(model.provider.upper()) if model.provider else None,
+            api_type=AgentSpecOciAPIType.OCI,
+        )
+
+    def _chatollama_convert_to_agentspec(
+        self, model: "langchain_ollama.ChatOllama"
+    ) -> AgentSpecLlmConfig:
+        return AgentSpecOllamaConfig(
+            name=model.model,
+            url=model.base_url or "",
+            model_id=model.model,
+        )
+
+    def _chatopenai_convert_to_agentspec(
+        self, model: "langchain_openai.ChatOpenAI"
+    ) -> AgentSpecLlmConfig:
+        api_type = (
+            AgentSpecOpenAIAPIType.RESPONSES
+            if model.use_responses_api
+            else AgentSpecOpenAIAPIType.CHAT_COMPLETIONS
+        )
+        retry_policy = self._chat_openai_retry_policy_convert_to_agentspec(model)
+        if (model.openai_api_base or "").startswith("https://api.openai.com"):
+            return AgentSpecOpenAiConfig(
+                name=model.model_name,
+                model_id=model.model_name,
+                api_type=api_type,
+                retry_policy=retry_policy,
             )
-        if isinstance(model, langchain_openai.ChatOpenAI):
-            api_type = (
-                AgentSpecOpenAIAPIType.RESPONSES
-                if model.use_responses_api
-                else AgentSpecOpenAIAPIType.CHAT_COMPLETIONS
+        else:
+            return AgentSpecOpenAiCompatibleConfig(
+                name=model.model_name,
+                url=model.openai_api_base or "",
+                model_id=model.model_name,
+                api_type=api_type,
+                retry_policy=retry_policy,
             )
-            retry_policy = self._chat_openai_retry_policy_convert_to_agentspec(model)
-            if (model.openai_api_base or "").startswith("https://api.openai.com"):
-                return AgentSpecOpenAiConfig(
-                    name=model.model_name,
-                    model_id=model.model_name,
-                    api_type=api_type,
-                    retry_policy=retry_policy,
-                )
-            else:
-                return AgentSpecOpenAiCompatibleConfig(
-                    name=model.model_name,
-                    url=model.openai_api_base or "",
-                    model_id=model.model_name,
-                    api_type=api_type,
-                    retry_policy=retry_policy,
-                )
-        raise ValueError(f"The LLM instance provided is of an unsupported type `{type(model)}`.")
 
     def _chat_openai_retry_policy_convert_to_agentspec(
         self, model: "langchain_openai.ChatOpenAI"
@@ -326,45 +593,41 @@ class LangGraphToAgentSpecConverter:
     def _langgraph_agent_convert_to_agentspec(
         self,
         langgraph_component: LangGraphComponent,
-        referenced_objects: Dict[str, AgentSpecComponent],
+        referenced_objects: ReferencedObjectsT,
     ) -> AgentSpecAgent:
         if isinstance(langgraph_component, CompiledStateGraph):
             agent_name = langgraph_component.get_name()
+            builder = langgraph_component.builder
         else:
             agent_name = "LangGraph Agent"
-        if isinstance(langgraph_component, CompiledStateGraph):
-            langgraph_component = langgraph_component.builder
-        model_node = langgraph_component.nodes["model"]
-        basechatmodel = self._extract_basechatmodel_from_model_node(model_node)
-        if "tools" in langgraph_component.nodes:
-            tool_node = langgraph_component.nodes["tools"]
+            builder = langgraph_component
+        builder_nodes = builder.nodes
+        model_node = builder_nodes["model"]
+        basechatmodel, system_prompt = self._extract_model_and_prompt(model_node)
+        tool_node = builder_nodes.get("tools")
+        if tool_node is not None:
             tools = self._extract_tools_from_react_agent(tool_node)
         else:
             tools = []
         return AgentSpecAgent(
             name=agent_name,
-            llm_config=cast(AgentSpecLlmConfig, self.convert(basechatmodel, referenced_objects)),
-            system_prompt=self._extract_prompt_from_model_node(model_node),
+            llm_config=cast(
+                AgentSpecLlmConfig, self._convert_referenced(basechatmodel, referenced_objects)
+            ),
+            system_prompt=system_prompt,
             tools=tools,
         )
 
     def _langgraph_swarm_convert_to_agentspec(
         self,
         langgraph_component: LangGraphComponent,
-        referenced_objects: Dict[str, AgentSpecComponent],
+        referenced_objects: ReferencedObjectsT,
     ) -> AgentSpecSwarm:
-        # Compiled swarms already expose their compiled graph; otherwise we compile the builder
-        # to obtain the graph structure and reuse it for agent extraction.
-        if isinstance(langgraph_component, CompiledStateGraph):
-            compiled_swarm = langgraph_component
-            graph = langgraph_component.get_graph()
-        else:
-            compiled_swarm = langgraph_component.compile()
-            graph = compiled_swarm.get_graph()
+        compiled_swarm, graph = self._get_compiled_swarm_and_graph(langgraph_component)
 
         # Every swarm graph should start from the synthetic `__start__` node that dispatches to
         # the first agent. If it is missing, the graph shape is unexpected and unsupported.
-        if "__start__" not in graph.nodes:
+        if _langgraph_start_end()[0] not in graph.nodes:
             raise ValueError("LangGraph swarm graph does not contain a start node")
 
         # The state schema includes an annotation describing the set of possible active agents.
@@ -381,7 +644,12 @@ class LangGraphToAgentSpecConverter:
         if not agent_names:
             raise ValueError("No agent names detected in LangGraph swarm")
 
-        agents: Dict[str, AgentSpecAgenticComponent] = {}
+        # Names of the handoff tools added by the swarm to its agents, see below
+        handoff_tool_names = {f"transfer_to_{a}" for a in agent_names}
+        # First, collect the agent graphs and register the handoff tools to ignore for all of them,
+        # so that the conversions of the agents below are independent of each other
+        agent_graphs: Dict[str, CompiledStateGraph[Any, Any, Any]] = {}
+        tool_node_ids: List[int] = []
         for agent_name in agent_names:
             node = graph.nodes.get(agent_name)
             if node is None:
@@ -390,32 +658,38 @@ class LangGraphToAgentSpecConverter:
             agent_graph = getattr(node, "data", None)
             if not isinstance(agent_graph, CompiledStateGraph):
                 raise ValueError(f"Swarm node '{agent_name}' is not a CompiledStateGraph")
+            agent_graphs[agent_name] = agent_graph
 
+        for agent_graph in agent_graphs.values():
             # Swarm adds tools for the handoff that we should not translate
             # The name of these tools is `transfer_to_{agent_name}`, we tell the converter
             # to ignore them by adding an attribute`_tools_to_ignore` containing all the
             # tool names with this type of format that should be ignored
             agent_graph_builder = agent_graph.builder
             if "tools" in agent_graph_builder.nodes:
-                tool_node = agent_graph_builder.nodes["tools"]
-                tool_node_id = id(tool_node)
+                tool_node_id = id(agent_graph_builder.nodes["tools"])
                 if tool_node_id not in self._tools_to_ignore:
                     self._tools_to_ignore[tool_node_id] = set()
-                self._tools_to_ignore[tool_node_id].update(f"transfer_to_{a}" for a in agent_names)
+                self._tools_to_ignore[tool_node_id].update(handoff_tool_names)
+                tool_node_ids.append(tool_node_id)
 
-            # Recursively convert each agent graph so the resulting Swarm references the same
-            # AgentSpec components as standalone conversions.
-            agents[agent_name] = self.convert(agent_graph, referenced_objects)  # type: ignore
-            # Agent is converted, we can remove the entry, if any
-            if "tools" in agent_graph_builder.nodes:
+        agents: Dict[str, AgentSpecAgenticComponent] = {}
+        try:
+            for agent_name, agent_graph in agent_graphs.items():
+                # Recursively convert each agent graph so the resulting Swarm references the same
+                # AgentSpec components as standalone conversions.
+                agents[agent_name] = self._convert_referenced(agent_graph, referenced_objects)  # type: ignore
+        finally:
+            # Agents are converted (or conversion failed), we can remove the entries, if any
+            for tool_node_id in tool_node_ids:
                 self._tools_to_ignore.pop(tool_node_id, None)
 
         # Build the relationship edges by walking the compiled graph edges originating from
         # each agent node. Only real agent targets (not internal helpers) are recorded.
         relationships: List[Tuple[AgentSpecAgenticComponent, AgentSpecAgenticComponent]] = []
+        destinations_by_source = self._extract_handoff_destinations(graph)
         for agent_name in agent_names:
-            destinations = self._extract_handoff_destinations(graph, agent_name)
-            for destination in destinations:
+            for destination in destinations_by_source.get(agent_name, ()):
                 if destination not in agents:
                     continue
                 relationships.append((agents[agent_name], agents[destination]))
@@ -442,6 +716,23 @@ class LangGraphToAgentSpecConverter:
             handoff=AgentSpecHandoffMode.OPTIONAL,
         )
 
+    def _get_compiled_swarm_and_graph(
+        self, langgraph_component: LangGraphComponent
+    ) -> Tuple[CompiledStateGraph[Any, Any, Any], Any]:
+        component_id = id(langgraph_component)
+        if component_id in self._compiled_swarm_cache:
+            return self._compiled_swarm_cache[component_id]
+        # Compiled swarms already expose their compiled graph; otherwise we compile the builder
+        # to obtain the graph structure and reuse it for agent extraction.
+        if isinstance(langgraph_component, CompiledStateGraph):
+            compiled_swarm = langgraph_component
+        else:
+            compiled_swarm = langgraph_component.compile()
+        compiled_swarm_and_graph = (compiled_swarm, compiled_swarm.get_graph())
+        self._keepalive.append(langgraph_component)
+        self._compiled_swarm_cache[component_id] = compiled_swarm_and_graph
+        return compiled_swarm_and_graph
+
     def _extract_first_agent_name_from_swarm(
         self,
         compiled_swarm: CompiledStateGraph[Any, Any, Any],
@@ -457,7 +748,7 @@ class LangGraphToAgentSpecConverter:
         """
         builder = compiled_swarm.builder
         branches = getattr(builder, "branches", {})
-        start_branches = branches.get(langgraph_graph.START, {})
+        start_branches = branches.get(_langgraph_start_end()[0], {})
         for branch_spec in start_branches.values():
             path = getattr(branch_spec, "path", None)
             func = getattr(path, "func", None)
@@ -477,52 +768,63 @@ class LangGraphToAgentSpecConverter:
         # LangGraph encodes the "active agent" field in the swarm state schema as a type annotation.
         # That annotation acts as the canonical source of truth for which agent names are valid,
         # so we parse it instead of relying on graph node names (which also include internal helpers).
-        origin = get_origin(annotation)
-
-        if origin in {Union, UnionType}:
-            # Common shape: Optional[Literal["a", "b"]] which is a Union[Literal[...], NoneType].
-            # We flatten the union to a single list of concrete agent names while discarding None.
-            names: List[str] = []
-            for arg in get_args(annotation):
-                if arg is type(None):
-                    continue
-                names.extend(self._extract_agent_names_from_annotation(arg))
-            return names
-
-        if origin is Literal:
-            # Literal values are the actual agent identifiers used as node keys inside the compiled
-            # swarm graph; validating they are strings ensures we don't silently accept enums/ints.
-            names = []
-            for arg in get_args(annotation):
-                if arg is type(None):
-                    continue
-                if not isinstance(arg, str):
-                    raise ValueError(
-                        "Unsupported Literal value for swarm conversion. Expected string agent name."
-                    )
-                names.append(arg)
-            return names
-
-        if isinstance(annotation, str):
-            # Some runtimes may preserve forward-referenced annotations as raw strings; treat them
-            # as a single agent name so conversion still succeeds in minimally-typed environments.
-            return [annotation]
-
-        # We don't know how to translate the remaining cases, therefore we raise an exception
-        raise ValueError("Unsupported active agent annotation for swarm conversion")
-
-    def _extract_handoff_destinations(self, graph: Any, agent_name: str) -> List[str]:
-        # Reconstruct swarm "handoff" relationships by scanning the compiled graph edges that
-        # originate from a given agent node. LangGraph includes synthetic nodes (e.g. __end__),
+        # Nested annotations are flattened with an explicit stack, in declaration order.
+        annotation_id = id(annotation)
+        if annotation_id in self._agent_names_cache:
+            return list(self._agent_names_cache[annotation_id])
+        self._keepalive.append(annotation)
+
+        names: List[str] = []
+        pending_annotations = [annotation]
+        while pending_annotations:
+            annotation = pending_annotations.pop()
+            origin = get_origin(annotation)
+
+            if origin in {Union, UnionType}:
+                # Common shape: Optional[Literal["a", "b"]] which is a Union[Literal[...], NoneType].
+                # We flatten the union to a single list of concrete agent names while discarding None.
+                pending_annotations.extend(
+                    arg for arg in reversed(get_args(annotation)) if arg is not type(None)
+                )
+
+            elif origin is Literal:
+                # Literal values are the actual agent identifiers used as node keys inside the
+                # compiled swarm graph; validating they are strings ensures we don't silently
+                # accept enums/ints.
+                for arg in get_args(annotation):
+                    if arg is type(None):
+                        continue
+                    if not isinstance(arg, str):
+                        raise ValueError(
+                            "Unsupported Literal value for swarm conversion. Expected string agent name."
+                        )
+                    names.append(arg)
+
+            elif isinstance(annotation, str):
+                # Some runtimes may preserve forward-referenced annotations as raw strings; treat
+                # them as a single agent name so conversion still succeeds in minimally-typed
+                # environments.
+                names.append(annotation)
+
+            else:
+                # We don't know how to translate the remaining cases, therefore we raise an exception
+                raise ValueError("Unsupported active agent annotation for swarm conversion")
+
+        self._agent_names_cache[annotation_id] = names
+        return list(names)
+
+    def _extract_handoff_destinations(self, graph: Any) -> Dict[str, List[str]]:
+        # Reconstruct swarm "handoff" relationships by indexing, in a single pass, the compiled graph
+        # edges by the node they originate from. LangGraph includes synthetic nodes (e.g. __end__),
         # which are part of orchestration and should not become Agent Spec edges.
         edges = getattr(graph, "edges", [])
-        destinations: List[str] = []
+        destinations_by_source: Dict[str, List[str]] = {}
         for edge in edges:
-            if getattr(edge, "source", None) == agent_name:
-                target = getattr(edge, "target", None)
-                if isinstance(target, str) and not target.startswith("__"):
-                    destinations.append(target)
-        return destinations
+            source = getattr(edge, "source", None)
+            target = getattr(edge, "target", None)
+            if isinstance(source, str) and isinstance(target, str) and not target.startswith("__"):
+                destinations_by_source.setdefault(source, []).append(target)
+        return destinations_by_source
 
     def _extract_tools_from_react_agent(
         self, langgraph_component: StateNodeSpec[Any, Any]
@@ -545,11 +847,16 @@ class LangGraphToAgentSpecConverter:
             return agentspec_server_tool
         if not coroutine.__closure__:
             return agentspec_server_tool
-        closures_by_name = {
-            name: cell.cell_contents
-            for name, cell in zip(coroutine.__code__.co_freevars, coroutine.__closure__)
-        }
-        connection_dict = closures_by_name.get("connection")
+        # Only the `connection` free variable matters to detect MCP tools
+        try:
+            connection_index = coroutine.__code__.co_freevars.index("connection")
+        except ValueError:
+            return agentspec_server_tool
+        try:
+            connection_dict = coroutine.__closure__[connection_index].cell_contents
+        except ValueError:
+            # Empty cell, there is no connection to convert
+            return agentspec_server_tool
         if not isinstance(connection_dict, dict) or "transport" not in connection_dict:
             return agentspec_server_tool
         # Cast to the expected TypedDict union for type checking
@@ -606,49 +913,30 @@ class LangGraphToAgentSpecConverter:
                 "Conversion from langchain MCP connections with arbitrary httpx client factory objects is not yet implemented"
             )
 
-        session_params = self._build_session_parameters(conn)
-
-        # Below, we use `[]` for mandatory keys and `.get` for NotRequired keys, where c is a TypedDict
-
-        if conn["transport"] == "stdio":
-            cwd_str = str(conn.get("cwd"))
-            return StdioTransport(
-                name="agentspec_stdio_transport",
-                command=conn["command"],
-                args=conn["args"],
-                env=conn.get("env"),
-                cwd=cwd_str,
-                session_parameters=session_params,
-            )
-
-        if conn["transport"] == "sse":
-            return SSETransport(
-                name="agentspec_sse_transport",
-                url=conn["url"],
-                headers=conn.get("headers"),
-                session_parameters=session_params,
-            )
-
-        if conn["transport"] == "streamable_http":
-            return StreamableHTTPTransport(
-                name="agentspec_streamablehttp_transport",
-                url=conn["url"],
-                headers=conn.get("headers"),
-                session_parameters=session_params,
-            )
-
-        raise ValueError(f'Unsupported transport: {conn["transport"]}')
+        transport_kind = conn["transport"]
+        transport_builder = _TRANSPORT_BUILDERS.get(transport_kind)
+        if transport_builder is None:
+            raise ValueError(f"Unsupported transport: {transport_kind}")
+        return transport_builder(conn, self._build_session_parameters(conn))
 
     @staticmethod
     def _build_session_parameters(conn: Mapping[str, Any]) -> SessionParameters:
         session_kwargs = conn.get("session_kwargs", {}) or {}
         raw = session_kwargs.get("read_timeout_seconds")
 
-        if isinstance(raw, datetime.timedelta):
-            rts = raw.total_seconds()
-        elif isinstance(raw, (int, float)):
-            rts = float(raw)
+        # SessionParameters is a mutable model that ends up attached to the transport, so a fresh
+        # instance is built every time instead of sharing a default one
+        if raw is None:
+            return SessionParameters()
+
+        # Timeouts are either durations (e.g., `datetime.timedelta`) or numbers of seconds
+        total_seconds = getattr(raw, "total_seconds", None)
+        if total_seconds is not None:
+            rts = total_seconds()
         else:
-            rts = None
+            try:
+                rts = float(raw)
+            except (TypeError, ValueError):
+                return SessionParameters()
 
-        return SessionParameters() if rts is None else SessionParameters(read_timeout_seconds=rts)
+        return SessionParameters(read_timeout_seconds=rts)
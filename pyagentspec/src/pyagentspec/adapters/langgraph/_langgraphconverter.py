@@ -5,9 +5,17 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
 
+import asyncio
+import datetime
+import importlib.util
 import inspect
+import json
 import logging
 import sys
+import types
+import weakref
+from collections import defaultdict
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,28 +24,46 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Hashable,
     List,
+    NamedTuple,
     Optional,
+    Set,
     Tuple,
     TypeGuard,
     Union,
     cast,
     overload,
 )
+from urllib.parse import urlparse, urlunparse
 from uuid import uuid4
 
 from pydantic import BaseModel, SecretStr
-from typing_extensions import NotRequired, Required, TypedDict
+from typing_extensions import NotRequired, Required, TypeAlias, TypedDict
 
 from pyagentspec import Component as AgentSpecComponent
 from pyagentspec.adapters._tools_common import _create_remote_tool_func
 from pyagentspec.adapters._utils import (
     SchemaRegistry,
     _build_type_from_schema,
+    _get_json_schema_key,
+    _PropertiesKey,
     create_pydantic_model_from_properties,
 )
 from pyagentspec.adapters.langgraph._node_execution import (
+    AgentNodeExecutor,
+    ApiNodeExecutor,
+    BranchingNodeExecutor,
+    CatchExceptionNodeExecutor,
+    EndNodeExecutor,
+    FlowNodeExecutor,
+    InputMessageNodeExecutor,
+    LlmNodeExecutor,
+    MapNodeExecutor,
     NodeExecutor,
+    OutputMessageNodeExecutor,
+    StartNodeExecutor,
+    ToolNodeExecutor,
     extract_outputs_from_invoke_result,
 )
 from pyagentspec.adapters.langgraph._types import (
@@ -53,6 +79,7 @@ from pyagentspec.adapters.langgraph._types import (
     FlowStateSchema,
     LangGraphTool,
     RunnableConfig,
+    RunnableLambda,
     StateGraph,
     StructuredTool,
     interrupt,
@@ -103,6 +130,7 @@ from pyagentspec.llms.openaicompatibleconfig import (
 from pyagentspec.llms.openaiconfig import OpenAiConfig
 from pyagentspec.llms.vllmconfig import VllmConfig
 from pyagentspec.mcp.clienttransport import ClientTransport as AgentSpecClientTransport
+from pyagentspec.mcp.clienttransport import SessionParameters as AgentSpecSessionParameters
 from pyagentspec.mcp.clienttransport import SSEmTLSTransport as AgentSpecSSEmTLSTransport
 from pyagentspec.mcp.clienttransport import SSETransport as AgentSpecSSETransport
 from pyagentspec.mcp.clienttransport import StdioTransport as AgentSpecStdioTransport
@@ -119,7 +147,7 @@ from pyagentspec.property import ListProperty as AgentSpecListProperty
 from pyagentspec.property import Property as AgentSpecProperty
 from pyagentspec.property import StringProperty as AgentSpecStringProperty
 from pyagentspec.property import _empty_default as _agentspec_empty_default
-from pyagentspec.property import json_schemas_have_same_type
+from pyagentspec.property import _json_schema_type_signature, json_schemas_have_same_type
 from pyagentspec.retrypolicy import RetryPolicy
 from pyagentspec.swarm import HandoffMode as AgentSpecHandoffMode
 from pyagentspec.swarm import Swarm as AgentSpecSwarm
@@ -134,6 +162,8 @@ from pyagentspec.tracing.events import FlowExecutionEnd as AgentSpecFlowExecutio
 from pyagentspec.tracing.events import FlowExecutionStart as AgentSpecFlowExecutionStart
 from pyagentspec.tracing.spans import AgentExecutionSpan as AgentSpecAgentExecutionSpan
 from pyagentspec.tracing.spans import FlowExecutionSpan as AgentSpecFlowExecutionSpan
+from pyagentspec.tracing.spans import Span as AgentSpecSpan
+from pyagentspec.tracing.trace import get_trace
 
 if TYPE_CHECKING:
     from langchain_mcp_adapters.sessions import (
@@ -141,14 +171,122 @@ if TYPE_CHECKING:
         StdioConnection,
         StreamableHttpConnection,
     )
+    from langchain_ollama import ChatOllama
+    from langchain_openai import ChatOpenAI
 
 
-def _mcp_available() -> bool:
-    import importlib.util
+@lru_cache(maxsize=1)
+def _get_chat_openai_class() -> "type[ChatOpenAI]":
+    # The provider packages are optional and heavy, they are imported on first use only and the
+    # resolved class is reused by every following LLM conversion
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI
+
+
+@lru_cache(maxsize=1)
+def _get_chat_ollama_class() -> "type[ChatOllama]":
+    from langchain_ollama import ChatOllama
+
+    return ChatOllama
+
+
+@lru_cache(maxsize=1)
+def _get_structured_tool_class() -> "type[StructuredTool]":
+    from langchain_core.tools import StructuredTool as LangChainStructuredTool
+
+    return LangChainStructuredTool
+
+
+def _is_structured_tool(x: Any) -> TypeGuard[StructuredTool]:
+    # Checks against the lazy `StructuredTool` proxy go through its metaclass, so we check against
+    # the actual class, starting with its exact type which is the common case
+    structured_tool_class = _get_structured_tool_class()
+    return type(x) is structured_tool_class or isinstance(x, structured_tool_class)
+
+
+# Tool callback handlers, by id of their Agent Spec tool. The handler keeps its tool alive, so the
+# id cannot be reused by another tool as long as the entry exists
+_TOOL_CALLBACK_HANDLERS: "weakref.WeakValueDictionary[int, AgentSpecToolCallbackHandler]" = (
+    weakref.WeakValueDictionary()
+)
+
 
+def _get_tool_callback_handler(tool: AgentSpecTool) -> AgentSpecToolCallbackHandler:
+    """Return the tracing callback handler of a tool, shared by all its conversions.
+
+    Handlers only hold per-run state keyed by run id, so the same Agent Spec tool converted
+    several times (e.g., when loading a configuration again) can use a single handler.
+    """
+    handler = _TOOL_CALLBACK_HANDLERS.get(id(tool))
+    if handler is None:
+        handler = AgentSpecToolCallbackHandler(tool=tool)
+        _TOOL_CALLBACK_HANDLERS[id(tool)] = handler
+    return handler
+
+
+def _add_tool_callback_handler(tool: BaseTool, handler: BaseCallbackHandler) -> None:
+    """Append a callback handler to the callbacks of a LangChain tool."""
+    callbacks = tool.callbacks
+    if not callbacks:
+        tool.callbacks = [handler]
+    elif isinstance(callbacks, list):
+        # Tools loaded from MCP servers come with a list of callbacks (or none), so the check
+        # against the lazy `BaseCallbackHandler` proxy below is only done for other tools
+        callbacks.append(handler)
+    elif isinstance(callbacks, BaseCallbackHandler):
+        tool.callbacks = [callbacks, handler]
+    else:
+        # A callback manager
+        callbacks.add_handler(handler)
+
+
+@lru_cache(maxsize=1)
+def _get_default_httpx_client_factory() -> _HttpxClientFactory:
+    # The factory is immutable once built, so the one verifying servers against the default
+    # certificate authorities is shared by all transports instead of loading them every time
+    return _HttpxClientFactory(verify=True)
+
+
+@lru_cache(maxsize=1)
+def _mcp_available() -> bool:
+    # Installed packages do not change during the process lifetime, the import system is
+    # only searched once
     return importlib.util.find_spec("langchain_mcp_adapters") is not None
 
 
+@lru_cache(maxsize=1)
+def _get_mcp_connection_classes() -> (
+    "Tuple[type[StdioConnection], type[SSEConnection], type[StreamableHttpConnection]]"
+):
+    from langchain_mcp_adapters.sessions import (
+        SSEConnection,
+        StdioConnection,
+        StreamableHttpConnection,
+    )
+
+    return StdioConnection, SSEConnection, StreamableHttpConnection
+
+
+@lru_cache(maxsize=1)
+def _get_load_mcp_tools() -> "Callable[..., Awaitable[List[BaseTool]]]":
+    from langchain_mcp_adapters.tools import load_mcp_tools
+
+    return load_mcp_tools
+
+
+# Maximum number of MCP servers whose tools are loaded at the same time, each load opens its own
+# session, so the number of simultaneous connections and subprocesses remains bounded
+_MAX_CONCURRENT_MCP_TOOLS_LOADS = 8
+
+# Session parameters passed to the MCP session as they are, the read timeout is converted
+_SESSION_PARAMETERS_FIELDS = tuple(
+    field_name
+    for field_name in AgentSpecSessionParameters.model_fields
+    if field_name != "read_timeout_seconds"
+)
+
+
 def _ensure_mcp_dependency_installed() -> None:
     if not _mcp_available():
         raise RuntimeError(
@@ -157,6 +295,74 @@ def _ensure_mcp_dependency_installed() -> None:
         )
 
 
+def _has_span_listeners() -> bool:
+    """Return whether the spans started in the current context reach some span processor."""
+    trace = get_trace()
+    return trace is not None and len(trace.span_processors) > 0
+
+
+# Span methods whose asynchronous variant raised NotImplementedError, with the span type and the
+# types of the span processors of the trace. Support for asynchronous tracing depends on those, so
+# for the same span and processor types we directly call the synchronous method instead
+_SYNC_ONLY_SPAN_METHODS: Set[Tuple[type, Tuple[type, ...], str]] = set()
+
+
+async def _call_span_method_async(span: AgentSpecSpan, method_name: str, *args: Any) -> None:
+    """Call the asynchronous variant of a span method, or the synchronous one when unsupported."""
+    trace = get_trace()
+    span_processor_types = tuple(map(type, trace.span_processors)) if trace is not None else ()
+    sync_only_key = (type(span), span_processor_types, method_name)
+    if sync_only_key not in _SYNC_ONLY_SPAN_METHODS:
+        try:
+            await getattr(span, f"{method_name}_async")(*args)
+            return
+        except NotImplementedError:
+            _SYNC_ONLY_SPAN_METHODS.add(sync_only_key)
+    getattr(span, method_name)(*args)
+
+
+def _get_stream_result(last_chunk: Any) -> Dict[str, Any]:
+    """Return the graph state carried by the last chunk streamed by a graph, if any.
+
+    ``(a)invoke`` stream ``(stream_mode, payload)`` tuples, and the last one holds the final state.
+    Only the last chunk is inspected, so that streaming does not pay a check for every chunk.
+    """
+    if isinstance(last_chunk, tuple):
+        result = last_chunk[1]
+        if isinstance(result, dict):
+            return result
+    return {}
+
+
+def _get_values_stream_result(last_chunk: Any) -> Dict[str, Any]:
+    """Return the graph state streamed last by a graph in ``"values"`` stream mode, if any."""
+    return last_chunk if isinstance(last_chunk, dict) else {}
+
+
+def _get_stream_result_getter(
+    stream_kwargs: Dict[str, Any], default_stream_mode: Any
+) -> Callable[[Any], Dict[str, Any]]:
+    """Return how to get the graph state from the last chunk of a stream with the given arguments.
+
+    Graphs streamed directly in ``"values"`` mode yield the full state as plain dictionaries, in
+    any other case we look for the ``(stream_mode, payload)`` tuples streamed by ``(a)invoke``.
+    The choice is made once per stream, the chunks themselves are never inspected.
+    """
+    stream_mode = stream_kwargs.get("stream_mode") or default_stream_mode
+    if (
+        stream_mode == "values"
+        and not stream_kwargs.get("subgraphs", False)
+        and stream_kwargs.get("version", "v1") == "v1"
+    ):
+        return _get_values_stream_result
+    return _get_stream_result
+
+
+def _get_branch(state: "FlowStateSchema") -> str:
+    """Return the branch taken by the node that was just executed in a flow."""
+    return state["node_execution_details"].get("branch", AgentSpecNode.DEFAULT_NEXT_BRANCH)
+
+
 def _create_agent_state_typed_dict(
     model_name: str,
     inputs: List[AgentSpecProperty],
@@ -167,9 +373,18 @@ def _create_agent_state_typed_dict(
     optional `structured_response`) by adding our input properties and a
     required `remaining_steps` field. Required/optional inputs are expressed
     using PEP 655 `Required`/`NotRequired`.
+
+    Creating a class is expensive, so agents whose inputs have the same canonical JSON schemas
+    (which hold their titles and default values) share the same TypedDict.
     """
-    import types
+    return _create_agent_state_typed_dict_cached(model_name, _PropertiesKey(inputs))
 
+
+@lru_cache(maxsize=256)
+def _create_agent_state_typed_dict_cached(
+    model_name: str, inputs_key: _PropertiesKey
+) -> "type[AgentState[BaseModel]]":
+    inputs = inputs_key.properties
     registry = SchemaRegistry()
 
     annotations: Dict[str, Any] = {
@@ -187,15 +402,142 @@ def _create_agent_state_typed_dict(
         ns["__annotations__"] = annotations
 
     # total=False => unspecified fields are optional unless wrapped with Required
-    return types.new_class(
+    agent_state_typed_dict: "type[AgentState[BaseModel]]" = types.new_class(
         model_name,
         (AgentState[BaseModel],),
         {"total": False},
         _exec_body,
     )
+    return agent_state_typed_dict
+
+
+class _FlowConversionPlan(NamedTuple):
+    """Parts of the conversion of a flow that only depend on its topology"""
+
+    data_flow_connections: List[AgentSpecDataFlowEdge]
+    control_flow: "ControlFlow"
+
+
+# Conversion plans by id of the flow, with a weak reference to the flow and its topology key.
+# Entries are removed when the flow is garbage collected
+_FLOW_CONVERSION_PLANS: Dict[
+    int, Tuple["weakref.ReferenceType[AgentSpecFlow]", Hashable, _FlowConversionPlan]
+] = {}
+
+
+def _get_flow_topology_key(flow: AgentSpecFlow) -> Hashable:
+    """Return a key that changes whenever the conversion plan of the flow would change."""
+    return (
+        tuple(
+            (
+                id(node),
+                node.id,
+                node.name,
+                tuple(property_.title for property_ in node.inputs or []),
+                tuple(property_.title for property_ in node.outputs or []),
+            )
+            for node in flow.nodes
+        ),
+        (
+            None
+            if flow.data_flow_connections is None
+            else tuple(id(data_flow_edge) for data_flow_edge in flow.data_flow_connections)
+        ),
+        tuple(
+            (
+                control_flow_edge.from_node.id,
+                control_flow_edge.from_branch,
+                control_flow_edge.to_node.id,
+            )
+            for control_flow_edge in flow.control_flow_connections
+        ),
+    )
+
+
+class _FlowStreamTracer:
+    """Wraps the ``stream`` method of a compiled flow to emit flow execution traces."""
+
+    def __init__(
+        self, flow: AgentSpecFlow, original_stream: Callable[..., Any], default_stream_mode: Any
+    ) -> None:
+        self.flow = flow
+        self.original_stream = original_stream
+        self.default_stream_mode = default_stream_mode
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Generator[Any, Any, None]:
+        flow = self.flow
+        span_name = f"FlowExecution[{flow.name}]"
+        inputs = kwargs.get("input", {})
+        if not isinstance(inputs, dict):
+            inputs = {}
+        with AgentSpecFlowExecutionSpan(name=span_name, flow=flow) as span:
+            # Events are only built when some span processor will receive them
+            if span.is_enabled:
+                span.add_event(AgentSpecFlowExecutionStart(flow=flow, inputs=inputs))
+            last_chunk: Any = None
+            # This is going to patch stream and astream, that return iterators and yield chunks
+            for last_chunk in self.original_stream(*args, **kwargs):
+                yield last_chunk
+            if span.is_enabled:
+                result = _get_stream_result_getter(kwargs, self.default_stream_mode)(last_chunk)
+                span.add_event(
+                    AgentSpecFlowExecutionEnd(
+                        flow=flow,
+                        outputs=result.get("outputs", {}),
+                        branch_selected=result.get("node_execution_details", {}).get("branch", ""),
+                    )
+                )
+
+
+class _FlowAsyncStreamTracer:
+    """Wraps the ``astream`` method of a compiled flow to emit flow execution traces."""
+
+    def __init__(
+        self, flow: AgentSpecFlow, original_astream: Callable[..., Any], default_stream_mode: Any
+    ) -> None:
+        self.flow = flow
+        self.original_astream = original_astream
+        self.default_stream_mode = default_stream_mode
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Any, Any]:
+        flow = self.flow
+        span_name = f"FlowExecution[{flow.name}]"
+        inputs = kwargs.get("input", {})
+        if not isinstance(inputs, dict):
+            inputs = {}
+        span = AgentSpecFlowExecutionSpan(name=span_name, flow=flow)
+        await _call_span_method_async(span, "start")
+        try:
+            # Events are only built when some span processor will receive them
+            if span.is_enabled:
+                await _call_span_method_async(
+                    span,
+                    "add_event",
+                    AgentSpecFlowExecutionStart(flow=flow, inputs=inputs),
+                )
+            last_chunk: Any = None
+            # This is going to patch stream and astream, that return iterators and yield chunks
+            async for last_chunk in self.original_astream(*args, **kwargs):
+                yield last_chunk
+            if span.is_enabled:
+                result = _get_stream_result_getter(kwargs, self.default_stream_mode)(last_chunk)
+                span_end_event = AgentSpecFlowExecutionEnd(
+                    flow=flow,
+                    outputs=result.get("outputs", {}),
+                    branch_selected=result.get("node_execution_details", {}).get("branch", ""),
+                )
+                await _call_span_method_async(span, "add_event", span_end_event)
+        finally:
+            await _call_span_method_async(span, "end")
 
 
 class AgentSpecToLangGraphConverter:
+
+    def __init__(self) -> None:
+        # MCP tools loaded into a tool registry by id of the registry and connection prefix, with
+        # their unprefixed names, so that we do not scan the whole registry for every MCP tool
+        self._session_tools_cache: Dict[Tuple[int, str], Dict[str, BaseTool]] = {}
+
     def convert(
         self,
         agentspec_component: AgentSpecComponent,
@@ -227,24 +569,28 @@ class AgentSpecToLangGraphConverter:
             outermost middleware. When ``None`` or an empty list, the ``middleware``
             keyword is omitted entirely from the ``create_agent`` call.
         """
-        middleware_list: List[Any] = list(middleware or [])
         if converted_components is None:
             converted_components = {}
+        elif agentspec_component.id in converted_components:
+            # Components shared by several parents (e.g., one LLM used by many nodes) are converted
+            # once, so we return them before normalizing the conversion arguments
+            return converted_components[agentspec_component.id]
+        middleware_list: List[Any] = list(middleware or [])
         if config is None:
             if checkpointer is not None:
                 config = RunnableConfig({"configurable": {"thread_id": str(uuid4())}})
             else:
                 config = RunnableConfig({})
-        if agentspec_component.id not in converted_components:
-            converted_components[agentspec_component.id] = self._convert(
-                agentspec_component,
-                tool_registry,
-                converted_components,
-                checkpointer,
-                config,
-                middleware_list,
-            )
-        return converted_components[agentspec_component.id]
+        converted_component = self._convert(
+            agentspec_component,
+            tool_registry,
+            converted_components,
+            checkpointer,
+            config,
+            middleware_list,
+        )
+        converted_components[agentspec_component.id] = converted_component
+        return converted_component
 
     def _convert(
         self,
@@ -255,81 +601,30 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> Any:
-        if isinstance(agentspec_component, AgentSpecAgent):
-            return self._agent_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(agentspec_component, AgentSpecSwarm):
-            return self._swarm_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(agentspec_component, AgentSpecLlmConfig):
-            return self._llm_convert_to_langgraph(agentspec_component, config=config)
-        elif isinstance(agentspec_component, AgentSpecClientTransport):
-            return self._client_transport_convert_to_langgraph(agentspec_component)
-        elif isinstance(agentspec_component, AgentSpecMCPTool):
-            _ensure_mcp_dependency_installed()
-            _ensure_checkpointer_and_valid_tool_config(agentspec_component, checkpointer)
-            return self._mcp_tool_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-            )
-        elif isinstance(agentspec_component, AgentSpecMCPToolBox):
-            _ensure_mcp_dependency_installed()
-            return self._mcp_toolbox_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-            )
-        elif isinstance(agentspec_component, AgentSpecServerTool):
-            _ensure_checkpointer_and_valid_tool_config(agentspec_component, checkpointer)
-            return self._server_tool_convert_to_langgraph(
-                agentspec_component, tool_registry, config=config
-            )
-        elif isinstance(agentspec_component, AgentSpecClientTool):
-            _ensure_checkpointer_and_valid_tool_config(agentspec_component, checkpointer)
-            return self._client_tool_convert_to_langgraph(agentspec_component)
-        elif isinstance(agentspec_component, AgentSpecRemoteTool):
-            _ensure_checkpointer_and_valid_tool_config(agentspec_component, checkpointer)
-            return self._remote_tool_convert_to_langgraph(agentspec_component, config=config)
-        elif isinstance(agentspec_component, AgentSpecFlow):
-            return self._flow_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(agentspec_component, AgentSpecNode):
-            return self._node_convert_to_langgraph(
-                agentspec_component,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(agentspec_component, AgentSpecComponent):
-            raise NotImplementedError(
-                f"The Agent Spec type '{agentspec_component.__class__.__name__}' is not yet supported for conversion."
-            )
-        else:
+        convert_handler = _resolve_conversion_handler(
+            type(agentspec_component),
+            _COMPONENT_CONVERTERS,
+            _RESOLVED_COMPONENT_CONVERTERS,
+            _COMPONENT_CLASSES,
+        )
+        if convert_handler is None:
+            if isinstance(agentspec_component, AgentSpecComponent):
+                raise NotImplementedError(
+                    f"The Agent Spec type '{agentspec_component.__class__.__name__}' is not yet supported for conversion."
+                )
             raise TypeError(
                 f"Expected object of type 'pyagentspec.component.Component',"
                 f" but got {type(agentspec_component)} instead"
             )
+        return convert_handler(
+            self,
+            agentspec_component,
+            tool_registry=tool_registry,
+            converted_components=converted_components,
+            checkpointer=checkpointer,
+            config=config,
+            middleware=middleware,
+        )
 
     def _create_control_flow(
         self, control_flow_connections: List[AgentSpecControlFlowEdge]
@@ -340,7 +635,10 @@ class AgentSpecToLangGraphConverter:
             if source_node_id not in control_flow:
                 control_flow[source_node_id] = {}
 
-            branch_name = control_flow_edge.from_branch or AgentSpecNode.DEFAULT_NEXT_BRANCH
+            # Branch names are few and repeated across nodes, intern them for cheap lookups
+            branch_name = sys.intern(
+                control_flow_edge.from_branch or AgentSpecNode.DEFAULT_NEXT_BRANCH
+            )
             control_flow[source_node_id][branch_name] = control_flow_edge.to_node.id
 
         return control_flow
@@ -351,13 +649,65 @@ class AgentSpecToLangGraphConverter:
         graph_builder: StateGraph["FlowStateSchema", None, "FlowInputSchema", "FlowOutputSchema"],
     ) -> None:
         for source_node_id, control_flow_mapping in control_flow.items():
+            graph_builder.add_conditional_edges(source_node_id, _get_branch, control_flow_mapping)
 
-            def get_branch(state: "FlowStateSchema") -> str:
-                return state["node_execution_details"].get(
-                    "branch", AgentSpecNode.DEFAULT_NEXT_BRANCH
-                )
+    def _get_flow_conversion_plan(self, flow: AgentSpecFlow) -> "_FlowConversionPlan":
+        """
+        Return the data flow connections and the control flow of a flow.
 
-            graph_builder.add_conditional_edges(source_node_id, get_branch, control_flow_mapping)
+        They only depend on the flow topology, and are reused across conversions of the same
+        flow object as long as its topology does not change.
+        """
+        flow_topology_key = _get_flow_topology_key(flow)
+        cached_flow_conversion_plan = _FLOW_CONVERSION_PLANS.get(id(flow))
+        if cached_flow_conversion_plan is not None:
+            flow_ref, cached_flow_topology_key, flow_conversion_plan = cached_flow_conversion_plan
+            if flow_ref() is flow and cached_flow_topology_key == flow_topology_key:
+                return flow_conversion_plan
+
+        flow_conversion_plan = _FlowConversionPlan(
+            data_flow_connections=self._get_data_flow_connections(flow),
+            control_flow=self._create_control_flow(flow.control_flow_connections),
+        )
+        flow_id = id(flow)
+        _FLOW_CONVERSION_PLANS[flow_id] = (
+            weakref.ref(flow, lambda _: _FLOW_CONVERSION_PLANS.pop(flow_id, None)),
+            flow_topology_key,
+            flow_conversion_plan,
+        )
+        return flow_conversion_plan
+
+    def _get_data_flow_connections(self, flow: AgentSpecFlow) -> List[AgentSpecDataFlowEdge]:
+        if flow.data_flow_connections is None:
+            # We manually create data flow connections if they are not given in the flow
+            # This is the conversion recommended in the Agent Spec language specification:
+            # every output is connected to every input with the same title, so we index the
+            # outputs by title once and join the inputs against that index
+            outputs_by_title: Dict[str, List[Tuple[AgentSpecNode, AgentSpecProperty]]] = (
+                defaultdict(list)
+            )
+            for source_node in flow.nodes:
+                for source_output in source_node.outputs or []:
+                    outputs_by_title[sys.intern(source_output.title)].append(
+                        (source_node, source_output)
+                    )
+            get_outputs_with_title = outputs_by_title.get
+            return [
+                AgentSpecDataFlowEdge(
+                    name=f"{source_node.name}-{destination_node.name}-{source_output.title}",
+                    source_node=source_node,
+                    source_output=source_output.title,
+                    destination_node=destination_node,
+                    destination_input=destination_input.title,
+                )
+                for destination_node in flow.nodes
+                for destination_input in destination_node.inputs or []
+                for source_node, source_output in get_outputs_with_title(
+                    sys.intern(destination_input.title), ()
+                )
+            ]
+        else:
+            return flow.data_flow_connections
 
     def _flow_convert_to_langgraph(
         self,
@@ -376,8 +726,12 @@ class AgentSpecToLangGraphConverter:
 
         graph_builder.add_edge(langgraph_graph.START, flow.start_node.id)
 
-        node_executors = {
-            node.id: self.convert(
+        # Nodes are converted and added to the graph in a single pass, which also sets the flow
+        # outputs on EndNodes and collects the MapNodes that need some more configuration
+        node_executors: Dict[str, Any] = {}
+        map_nodes: List[AgentSpecMapNode] = []
+        for node in flow.nodes:
+            node_executor = self.convert(
                 node,
                 tool_registry=tool_registry,
                 converted_components=converted_components,
@@ -385,74 +739,84 @@ class AgentSpecToLangGraphConverter:
                 config=config,
                 middleware=middleware,
             )
-            for node in flow.nodes
-        }
-
-        def _find_property(properties: List[AgentSpecProperty], name: str) -> AgentSpecProperty:
-            return next((property_ for property_ in properties if property_.title == name))
-
-        # We tell the MapNodes which inputs they should iterate over
-        # Based on the type of the outputs they are connected to
-        for agentspec_node in flow.nodes:
-            if isinstance(agentspec_node, AgentSpecMapNode):
-                inputs_to_iterate = []
-                for data_flow_edge in flow.data_flow_connections or []:
-                    if data_flow_edge.destination_node is agentspec_node:
-                        source_property = _find_property(
-                            data_flow_edge.source_node.outputs or [],
-                            data_flow_edge.source_output,
-                        )
-                        inner_flow_input_property = _find_property(
-                            agentspec_node.subflow.inputs or [],
-                            data_flow_edge.destination_input.replace("iterated_", "", 1),
-                        )
-                        if json_schemas_have_same_type(
-                            source_property.json_schema,
-                            AgentSpecListProperty(item_type=inner_flow_input_property).json_schema,
-                        ):
-                            inputs_to_iterate.append(data_flow_edge.destination_input)
-                node_executors[agentspec_node.id].set_inputs_to_iterate(inputs_to_iterate)
-            elif isinstance(agentspec_node, AgentSpecEndNode):
-                node_executors[agentspec_node.id].set_flow_outputs(flow.outputs)
-
-        from pyagentspec.adapters.langgraph._types import RunnableLambda
-
-        for node_id, node_executor in node_executors.items():
+            node_executors[node.id] = node_executor
             # Provide both sync and async entrypoints natively. LangGraph will use
             # the appropriate one based on invoke/stream vs ainvoke/astream.
             runnable = RunnableLambda(
                 func=node_executor,
                 afunc=node_executor.__acall__,
-                name=node_id,
+                name=node.id,
             )
-            graph_builder.add_node(node_id, runnable)
+            graph_builder.add_node(node.id, runnable)
+            if isinstance(node, AgentSpecMapNode):
+                map_nodes.append(node)
+            elif isinstance(node, AgentSpecEndNode):
+                node_executor.set_flow_outputs(flow.outputs)
+
+        # Outputs of the nodes by title, and data flow edges by destination node id.
+        # Only needed by MapNodes
+        outputs_by_node_id: Dict[str, Dict[str, AgentSpecProperty]] = {}
+        data_flow_edges_by_destination_id: Dict[str, List[AgentSpecDataFlowEdge]] = {}
+        if map_nodes:
+            for data_flow_edge in flow.data_flow_connections or []:
+                source_node = data_flow_edge.source_node
+                if source_node.id not in outputs_by_node_id:
+                    outputs_by_node_id[source_node.id] = {
+                        property_.title: property_ for property_ in source_node.outputs or []
+                    }
+                data_flow_edges_by_destination_id.setdefault(
+                    data_flow_edge.destination_node.id, []
+                ).append(data_flow_edge)
+        # Type signatures of the source outputs, by source node id and output title
+        source_type_signatures: Dict[Tuple[str, str], Optional[Hashable]] = {}
 
-        data_flow_connections: List[AgentSpecDataFlowEdge] = []
-        if flow.data_flow_connections is None:
-            # We manually create data flow connections if they are not given in the flow
-            # This is the conversion recommended in the Agent Spec language specification
-            for source_node in flow.nodes:
-                for destination_node in flow.nodes:
-                    for source_output in source_node.outputs or []:
-                        for destination_input in destination_node.inputs or []:
-                            if source_output.title == destination_input.title:
-                                data_flow_connections.append(
-                                    AgentSpecDataFlowEdge(
-                                        name=f"{source_node.name}-{destination_node.name}-{source_output.title}",
-                                        source_node=source_node,
-                                        source_output=source_output.title,
-                                        destination_node=destination_node,
-                                        destination_input=destination_input.title,
-                                    )
-                                )
-        else:
-            data_flow_connections = flow.data_flow_connections
-
-        for data_flow_edge in data_flow_connections:
+        # We tell the MapNodes which inputs they should iterate over
+        # Based on the type of the outputs they are connected to
+        for agentspec_node in map_nodes:
+            inner_flow_inputs_by_title = {
+                property_.title: property_ for property_ in agentspec_node.subflow.inputs or []
+            }
+            inputs_to_iterate = []
+            for data_flow_edge in data_flow_edges_by_destination_id.get(agentspec_node.id, []):
+                if data_flow_edge.destination_node is agentspec_node:
+                    source_property = outputs_by_node_id[data_flow_edge.source_node.id][
+                        data_flow_edge.source_output
+                    ]
+                    inner_flow_input_property = inner_flow_inputs_by_title[
+                        data_flow_edge.destination_input.removeprefix("iterated_")
+                    ]
+                    # Only the type of the schemas is compared, so we can use the schema
+                    # of a list of the inner input without validating a new ListProperty
+                    iterated_input_json_schema = (
+                        AgentSpecListProperty._get_json_schema_specific_type(
+                            {"item_type": inner_flow_input_property}
+                        )
+                    )
+                    source_key = (data_flow_edge.source_node.id, data_flow_edge.source_output)
+                    if source_key not in source_type_signatures:
+                        source_type_signatures[source_key] = _json_schema_type_signature(
+                            source_property.json_schema
+                        )
+                    source_type_signature = source_type_signatures[source_key]
+                    iterated_input_type_signature = _json_schema_type_signature(
+                        iterated_input_json_schema
+                    )
+                    if source_type_signature is None or iterated_input_type_signature is None:
+                        # Unions are only supported by the full comparison
+                        have_same_type = json_schemas_have_same_type(
+                            source_property.json_schema, iterated_input_json_schema
+                        )
+                    else:
+                        have_same_type = source_type_signature == iterated_input_type_signature
+                    if have_same_type:
+                        inputs_to_iterate.append(data_flow_edge.destination_input)
+            node_executors[agentspec_node.id].set_inputs_to_iterate(inputs_to_iterate)
+
+        flow_conversion_plan = self._get_flow_conversion_plan(flow)
+        for data_flow_edge in flow_conversion_plan.data_flow_connections:
             node_executors[data_flow_edge.source_node.id].attach_edge(data_flow_edge)
 
-        control_flow: "ControlFlow" = self._create_control_flow(flow.control_flow_connections)
-        self._add_conditional_edges_to_graph(control_flow, graph_builder)
+        self._add_conditional_edges_to_graph(flow_conversion_plan.control_flow, graph_builder)
         compiled_graph = graph_builder.compile(checkpointer=checkpointer)
 
         # Warn users on Python < 3.11 about async interrupts potentially failing.
@@ -476,85 +840,14 @@ class AgentSpecToLangGraphConverter:
 
         # To enable flow execution traces monkey patch all the functions that invoke the compiled graph
 
-        original_stream = compiled_graph.stream
-
-        def patch_with_flow_execution_span(*args: Any, **kwargs: Any) -> Generator[Any, Any, None]:
-            span_name = f"FlowExecution[{flow.name}]"
-            inputs = kwargs.get("input", {})
-            if not isinstance(inputs, dict):
-                inputs = {}
-            with AgentSpecFlowExecutionSpan(name=span_name, flow=flow) as span:
-                span.add_event(AgentSpecFlowExecutionStart(flow=flow, inputs=inputs))
-                original_result: dict[str, Any] | Any = {}
-                result: dict[str, Any]
-                # This is going to patch stream and astream, that return iterators and yield chunks
-                for chunk in original_stream(*args, **kwargs):
-                    yield chunk
-                    if isinstance(chunk, tuple):
-                        original_result = chunk[1]
-                if not isinstance(original_result, dict):
-                    result = {}
-                else:
-                    result = original_result
-                span.add_event(
-                    AgentSpecFlowExecutionEnd(
-                        flow=flow,
-                        outputs=result.get("outputs", {}),
-                        branch_selected=result.get("node_execution_details", {}).get("branch", ""),
-                    )
-                )
-
-        original_astream = compiled_graph.astream
-
-        async def patch_async_with_flow_execution_span(
-            *args: Any, **kwargs: Any
-        ) -> AsyncGenerator[Any, Any]:
-            span_name = f"FlowExecution[{flow.name}]"
-            inputs = kwargs.get("input", {})
-            if not isinstance(inputs, dict):
-                inputs = {}
-            span = AgentSpecFlowExecutionSpan(name=span_name, flow=flow)
-            try:
-                await span.start_async()
-            except NotImplementedError:
-                span.start()
-            try:
-                try:
-                    await span.add_event_async(
-                        AgentSpecFlowExecutionStart(flow=flow, inputs=inputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecFlowExecutionStart(flow=flow, inputs=inputs))
-                original_result: dict[str, Any] | Any = {}
-                result: dict[str, Any]
-                # This is going to patch stream and astream, that return iterators and yield chunks
-                async for chunk in original_astream(*args, **kwargs):
-                    yield chunk
-                    if isinstance(chunk, tuple):
-                        original_result = chunk[1]
-                if not isinstance(original_result, dict):
-                    result = {}
-                else:
-                    result = original_result
-                span_end_event = AgentSpecFlowExecutionEnd(
-                    flow=flow,
-                    outputs=result.get("outputs", {}),
-                    branch_selected=result.get("node_execution_details", {}).get("branch", ""),
-                )
-                try:
-                    await span.add_event_async(span_end_event)
-                except NotImplementedError:
-                    span.add_event(span_end_event)
-            finally:
-                try:
-                    await span.end_async()
-                except NotImplementedError:
-                    span.end()
-
         # Monkey patch invocation functions to inject tracing
         # No need to patch `(a)invoke` as the internally use `(a)stream`
-        compiled_graph.stream = patch_with_flow_execution_span  # type: ignore
-        compiled_graph.astream = patch_async_with_flow_execution_span  # type: ignore
+        compiled_graph.stream = _FlowStreamTracer(  # type: ignore
+            flow, compiled_graph.stream, compiled_graph.stream_mode
+        )
+        compiled_graph.astream = _FlowAsyncStreamTracer(  # type: ignore
+            flow, compiled_graph.astream, compiled_graph.stream_mode
+        )
         return compiled_graph
 
     def _node_convert_to_langgraph(
@@ -566,82 +859,30 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> "NodeExecutor":
-        if isinstance(node, AgentSpecStartNode):
-            return self._start_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecEndNode):
-            return self._end_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecToolNode):
-            return self._tool_node_convert_to_langgraph(
-                node,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-            )
-        elif isinstance(node, AgentSpecLlmNode):
-            return self._llm_node_convert_to_langgraph(
-                node,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-            )
-        elif isinstance(node, AgentSpecAgentNode):
-            return self._agent_node_convert_to_langgraph(
-                node,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(node, AgentSpecBranchingNode):
-            return self._branching_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecApiNode):
-            return self._api_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecFlowNode):
-            return self._flow_node_convert_to_langgraph(
-                node,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
-            )
-        elif isinstance(node, AgentSpecCatchExceptionNode):
-            return self._catch_exception_node_convert_to_langgraph(
-                node,
-                tool_registry=tool_registry,
-                converted_components=converted_components,
-                checkpointer=checkpointer,
-                config=config,
-                middleware=middleware,
+        convert_handler = _resolve_conversion_handler(
+            type(node), _NODE_CONVERTERS, _RESOLVED_NODE_CONVERTERS, _NODE_CLASSES
+        )
+        if convert_handler is None:
+            raise NotImplementedError(
+                f"The AgentSpec component of type {type(node)} is not yet supported for conversion"
             )
-        elif isinstance(node, AgentSpecInputMessageNode):
-            return self._input_message_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecOutputMessageNode):
-            return self._output_message_node_convert_to_langgraph(node)
-        elif isinstance(node, AgentSpecMapNode):
-            return self._map_node_convert_to_langgraph(
+        return cast(
+            "NodeExecutor",
+            convert_handler(
+                self,
                 node,
                 tool_registry=tool_registry,
                 converted_components=converted_components,
                 checkpointer=checkpointer,
                 config=config,
                 middleware=middleware,
-            )
-        else:
-            raise NotImplementedError(
-                f"The AgentSpec component of type {type(node)} is not yet supported for conversion"
-            )
+            ),
+        )
 
     def _input_message_node_convert_to_langgraph(
         self,
         node: AgentSpecInputMessageNode,
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import (
-            InputMessageNodeExecutor,
-        )
 
         return InputMessageNodeExecutor(node)
 
@@ -649,9 +890,6 @@ class AgentSpecToLangGraphConverter:
         self,
         node: AgentSpecOutputMessageNode,
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import (
-            OutputMessageNodeExecutor,
-        )
 
         return OutputMessageNodeExecutor(node)
 
@@ -664,7 +902,6 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import MapNodeExecutor
 
         subflow = self.convert(
             map_node.subflow,
@@ -688,7 +925,6 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import FlowNodeExecutor
 
         subflow = self.convert(
             flow_node.subflow,
@@ -716,9 +952,6 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import (
-            CatchExceptionNodeExecutor,
-        )
 
         subflow = self.convert(
             catch_node.subflow,
@@ -741,14 +974,12 @@ class AgentSpecToLangGraphConverter:
         )
 
     def _api_node_convert_to_langgraph(self, api_node: AgentSpecApiNode) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import ApiNodeExecutor
 
         return ApiNodeExecutor(api_node)
 
     def _branching_node_convert_to_langgraph(
         self, branching_node: AgentSpecBranchingNode
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import BranchingNodeExecutor
 
         return BranchingNodeExecutor(branching_node)
 
@@ -761,7 +992,6 @@ class AgentSpecToLangGraphConverter:
         config: RunnableConfig,
         middleware: List[Any],
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import AgentNodeExecutor
 
         return AgentNodeExecutor(
             agent_node,
@@ -780,7 +1010,6 @@ class AgentSpecToLangGraphConverter:
         checkpointer: Optional[Checkpointer],
         config: RunnableConfig,
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import LlmNodeExecutor
 
         llm: BaseChatModel = self.convert(
             llm_node.llm_config,
@@ -799,7 +1028,6 @@ class AgentSpecToLangGraphConverter:
         checkpointer: Optional[Checkpointer],
         config: RunnableConfig,
     ) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import ToolNodeExecutor
 
         tool = self.convert(
             tool_node.tool,
@@ -812,12 +1040,10 @@ class AgentSpecToLangGraphConverter:
         return ToolNodeExecutor(tool_node, tool)
 
     def _end_node_convert_to_langgraph(self, end_node: AgentSpecEndNode) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import EndNodeExecutor
 
         return EndNodeExecutor(end_node)
 
     def _start_node_convert_to_langgraph(self, start_node: AgentSpecStartNode) -> "NodeExecutor":
-        from pyagentspec.adapters.langgraph._node_execution import StartNodeExecutor
 
         return StartNodeExecutor(start_node)
 
@@ -847,7 +1073,7 @@ class AgentSpecToLangGraphConverter:
             func=_remote_tool,
             coroutine=_as_structured_tool_coroutine(_remote_tool),
             callbacks=[
-                AgentSpecToolCallbackHandler(tool=remote_tool),
+                _get_tool_callback_handler(remote_tool),
             ],
         )
         return structured_tool
@@ -858,9 +1084,6 @@ class AgentSpecToLangGraphConverter:
         tool_registry: Dict[str, LangGraphTool],
         config: RunnableConfig,
     ) -> StructuredTool:
-        def _is_structured_tool(x: Any) -> TypeGuard[StructuredTool]:
-            return isinstance(x, StructuredTool)
-
         if agentspec_server_tool.name not in tool_registry:
             raise ValueError(
                 f"The Agent Spec representation includes a tool '{agentspec_server_tool.name}' "
@@ -928,7 +1151,7 @@ class AgentSpecToLangGraphConverter:
             description=structured_tool_description,
             args_schema=args_schema,
             callbacks=[
-                AgentSpecToolCallbackHandler(tool=agentspec_server_tool),
+                _get_tool_callback_handler(agentspec_server_tool),
             ],
             **tool_callable_kwargs,
         )
@@ -947,6 +1170,7 @@ class AgentSpecToLangGraphConverter:
         tool_description = agentspec_client_tool.description or ""
         requires_confirmation = agentspec_client_tool.requires_confirmation
 
+        # A closure rather than a `functools.partial`, see `_confirm_then`
         def client_tool(*args: Any, **kwargs: Any) -> Any:
             if requires_confirmation:
                 if args:
@@ -992,17 +1216,23 @@ class AgentSpecToLangGraphConverter:
         tool_registry: Dict[str, LangGraphTool],
         converted_components: Dict[str, Any],
     ) -> BaseTool:
+        client_transport = agentspec_mcp_tool.client_transport
         connection = self.convert(
-            agentspec_mcp_tool.client_transport,
+            client_transport,
             tool_registry=tool_registry,
             converted_components=converted_components,
         )
         exposed_tools = self._get_or_create_langgraph_mcp_tools(
-            client_transport=agentspec_mcp_tool.client_transport,
+            client_transport=client_transport,
             langgraph_connection=connection,
-            connection_key=agentspec_mcp_tool.client_transport.id,
+            connection_key=client_transport.id,
             tool_registry=tool_registry,
         )
+        if agentspec_mcp_tool.name not in exposed_tools:
+            raise ValueError(
+                f"The MCP server of client transport '{client_transport.name}' does not "
+                f"expose a tool named '{agentspec_mcp_tool.name}'."
+            )
         return exposed_tools[agentspec_mcp_tool.name]
 
     def _mcp_toolbox_convert_to_langgraph(
@@ -1024,21 +1254,23 @@ class AgentSpecToLangGraphConverter:
         )
         # Below is logic to filter tools based on the tool_filter attribute of the toolbox
         # Normalize filter to {name: ToolSpec|None} (where None is when the filter is a string)
-        filter_map = {
-            (filter if isinstance(filter, str) else filter.name): (
-                None if isinstance(filter, str) else filter
-            )
-            for filter in (agentspec_mcp_toolbox.tool_filter or [])
-        }
+        filter_map: Dict[str, Optional[AgentSpecMCPToolSpec]] = {}
+        for tool_filter in agentspec_mcp_toolbox.tool_filter or []:
+            if isinstance(tool_filter, str):
+                filter_map[tool_filter] = None
+            else:
+                filter_map[tool_filter.name] = tool_filter
         # If no filter provided, return all tools
         if not filter_map:
             filtered_tools = list(remote_tools.values())
         else:
-            # Find missing by name first
-            missing = sorted(name for name in filter_map if name not in remote_tools)
+            # Find missing by name first, they are only sorted for the error message
+            missing = [name for name in filter_map if name not in remote_tools]
             if missing:
+                missing.sort()
                 raise ValueError("Missing tools: " + ", ".join(missing))
-            # Validate specs (when provided) and collect tools
+            # Validate specs (when provided) and collect tools in the same pass
+            filtered_tools = []
             for name, spec in filter_map.items():
                 tool = remote_tools[name]
                 if spec is not None and not _are_mcp_tool_spec_and_langchain_schemas_equal(
@@ -1048,7 +1280,7 @@ class AgentSpecToLangGraphConverter:
                         "Input descriptors mismatch for tool '%s'.\nLocal: %s\nRemote: %s"
                         % (spec.name, spec, getattr(tool, "args_schema", None))
                     )
-            filtered_tools = [remote_tools[name] for name in filter_map]
+                filtered_tools.append(tool)
         return filtered_tools
 
     def _swarm_convert_to_langgraph(
@@ -1147,30 +1379,37 @@ class AgentSpecToLangGraphConverter:
             checkpointer=checkpointer,
             config=config,
         )
-        langgraph_tools = (
-            (additional_langgraph_tools or [])
-            + [
+        self._preload_langgraph_mcp_tools(
+            [
+                tool_or_toolbox.client_transport
+                for tool_or_toolbox in [*tools, *toolboxes]
+                if isinstance(tool_or_toolbox, (AgentSpecMCPTool, AgentSpecMCPToolBox))
+            ],
+            tool_registry=tool_registry,
+            converted_components=converted_components,
+        )
+        # Tools are collected in a single list, without building and concatenating partial lists
+        langgraph_tools = list(additional_langgraph_tools or [])
+        langgraph_tools.extend(
+            self.convert(
+                t,
+                tool_registry=tool_registry,
+                converted_components=converted_components,
+                checkpointer=checkpointer,
+                config=config,
+            )
+            for t in tools
+        )
+        for tb in toolboxes:
+            langgraph_tools.extend(
                 self.convert(
-                    t,
-                    tool_registry=tool_registry,
-                    converted_components=converted_components,
-                    checkpointer=checkpointer,
-                    config=config,
-                )
-                for t in tools
-            ]
-            + [
-                t
-                for tb in toolboxes
-                for t in self.convert(
                     tb,
                     tool_registry=tool_registry,
                     converted_components=converted_components,
                     checkpointer=checkpointer,
                     config=config,
                 )
-            ]
-        )
+            )
         output_model: Optional[type[BaseModel]] = None
         state_schema: Optional[Any] = None
 
@@ -1200,25 +1439,25 @@ class AgentSpecToLangGraphConverter:
         # To enable flow execution traces monkey patch all the functions that invoke the compiled graph
 
         original_stream = compiled_graph.stream
+        default_stream_mode = compiled_graph.stream_mode
 
         def patch_with_agent_execution_span(*args: Any, **kwargs: Any) -> Generator[Any, Any, Any]:
+            if not _has_span_listeners():
+                # Nobody receives the span nor its events, we just stream the agent
+                yield from original_stream(*args, **kwargs)
+                return
             span_name = f"AgentExecution[{agent.name}]"
             inputs = kwargs.get("input", {})
             if not isinstance(inputs, dict):
                 inputs = {}
             with AgentSpecAgentExecutionSpan(name=span_name, agent=agent) as span:
                 span.add_event(AgentSpecAgentExecutionStart(agent=agent, inputs=inputs))
-                original_result: dict[str, Any] | Any = {}
-                result: dict[str, Any]
+                get_stream_result = _get_stream_result_getter(kwargs, default_stream_mode)
+                last_chunk: Any = None
                 # This is going to patch stream and astream, that return iterators and yield chunks
-                for chunk in original_stream(*args, **kwargs):
-                    yield chunk
-                    if isinstance(chunk, tuple):
-                        original_result = chunk[1]
-                if not isinstance(original_result, dict):
-                    result = {}
-                else:
-                    result = original_result
+                for last_chunk in original_stream(*args, **kwargs):
+                    yield last_chunk
+                result = get_stream_result(last_chunk)
                 outputs = extract_outputs_from_invoke_result(result, agent.outputs or [])
                 span.add_event(AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs))
 
@@ -1227,46 +1466,38 @@ class AgentSpecToLangGraphConverter:
         async def patch_async_with_agent_execution_span(
             *args: Any, **kwargs: Any
         ) -> AsyncGenerator[Any, Any]:
+            if not _has_span_listeners():
+                # Nobody receives the span nor its events, we just stream the agent
+                async for chunk in original_astream(*args, **kwargs):
+                    yield chunk
+                return
             span_name = f"AgentExecution[{agent.name}]"
             inputs = kwargs.get("input", {})
             if not isinstance(inputs, dict):
                 inputs = {}
             span = AgentSpecAgentExecutionSpan(name=span_name, agent=agent)
+            await _call_span_method_async(span, "start")
             try:
-                await span.start_async()
-            except NotImplementedError:
-                span.start()
-            try:
-                try:
-                    await span.add_event_async(
-                        AgentSpecAgentExecutionStart(agent=agent, inputs=inputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecAgentExecutionStart(agent=agent, inputs=inputs))
-                original_result: dict[str, Any] | Any = {}
-                result: dict[str, Any]
+                await _call_span_method_async(
+                    span,
+                    "add_event",
+                    AgentSpecAgentExecutionStart(agent=agent, inputs=inputs),
+                )
+                get_stream_result = _get_stream_result_getter(kwargs, default_stream_mode)
+                last_chunk: Any = None
                 # This is going to patch stream and astream, that return iterators and yield chunks
-                async for chunk in original_astream(*args, **kwargs):
-                    yield chunk
-                    if isinstance(chunk, tuple):
-                        original_result = chunk[1]
-                if not isinstance(original_result, dict):
-                    result = {}
-                else:
-                    result = original_result
+                async for last_chunk in original_astream(*args, **kwargs):
+                    yield last_chunk
+                result = get_stream_result(last_chunk)
 
                 outputs = extract_outputs_from_invoke_result(result, agent.outputs or [])
-                try:
-                    await span.add_event_async(
-                        AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs)
-                    )
-                except NotImplementedError:
-                    span.add_event(AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs))
+                await _call_span_method_async(
+                    span,
+                    "add_event",
+                    AgentSpecAgentExecutionEnd(agent=agent, outputs=outputs),
+                )
             finally:
-                try:
-                    await span.end_async()
-                except NotImplementedError:
-                    span.end()
+                await _call_span_method_async(span, "end")
 
         # Monkey patch invocation functions to inject tracing
         # No need to patch `(a)invoke` as they internally use `(a)stream`
@@ -1315,106 +1546,134 @@ class AgentSpecToLangGraphConverter:
             AgentSpecLlmCallbackHandler(llm_config=llm_config),
         ]
 
-        if isinstance(llm_config, VllmConfig):
-            # if llm_config.api_key is None, ChatOpenAI constructor will attempt to read from the env
-            # OPENAI_API_KEY and raise an error if missing
-            # as local vLLM servers are not typically set up with API keys, we use the "EMPTY" as the default
-            # for ease of use
-            return _create_chat_openai_model(
-                model_id=llm_config.model_id,
-                base_url=_prepare_openai_compatible_url(llm_config.url),
-                api_key=llm_config.api_key if llm_config.api_key is not None else "EMPTY",
-                use_responses_api=use_responses_api,
-                callbacks=callbacks,
-                generation_config=generation_config,
-                retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
+        convert_handler = _resolve_conversion_handler(
+            type(llm_config), _LLM_CONVERTERS, _RESOLVED_LLM_CONVERTERS, _LLM_CLASSES
+        )
+        if convert_handler is None:
+            raise NotImplementedError(
+                f"The Agent Spec type '{llm_config.__class__.__name__}' is not yet supported for conversion."
             )
-        elif isinstance(llm_config, OllamaConfig):
-            if llm_config.retry_policy is not None:
-                raise NotImplementedError(
-                    "LangGraph ChatOllama conversion does not support `RetryPolicy`."
-                )
+        return cast(
+            BaseChatModel,
+            convert_handler(self, llm_config, generation_config, use_responses_api, callbacks),
+        )
 
-            from langchain_ollama import ChatOllama
+    def _ollama_config_convert_to_langgraph(
+        self,
+        llm_config: OllamaConfig,
+        generation_config: "_GenerationConfig",
+        use_responses_api: bool,
+        callbacks: List[BaseCallbackHandler],
+    ) -> BaseChatModel:
+        if llm_config.retry_policy is not None:
+            raise NotImplementedError(
+                "LangGraph ChatOllama conversion does not support `RetryPolicy`."
+            )
 
-            return ChatOllama(
-                base_url=llm_config.url,
-                model=llm_config.model_id,
-                callbacks=callbacks,
-                temperature=generation_config.get("temperature"),
-                num_predict=generation_config.get("max_tokens"),
-                top_p=generation_config.get("top_p"),
+        ChatOllama = _get_chat_ollama_class()
+        return ChatOllama(
+            base_url=llm_config.url,
+            model=llm_config.model_id,
+            callbacks=callbacks,
+            temperature=generation_config.get("temperature"),
+            num_predict=generation_config.get("max_tokens"),
+            top_p=generation_config.get("top_p"),
+        )
+
+    def _openai_config_convert_to_langgraph(
+        self,
+        llm_config: OpenAiConfig,
+        generation_config: "_GenerationConfig",
+        use_responses_api: bool,
+        callbacks: List[BaseCallbackHandler],
+    ) -> BaseChatModel:
+        return _create_chat_openai_model(
+            model_id=llm_config.model_id,
+            api_key=llm_config.api_key,
+            use_responses_api=use_responses_api,
+            callbacks=callbacks,
+            generation_config=generation_config,
+            retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
+        )
+
+    def _openai_compatible_config_convert_to_langgraph(
+        self,
+        llm_config: OpenAiCompatibleConfig,
+        generation_config: "_GenerationConfig",
+        use_responses_api: bool,
+        callbacks: List[BaseCallbackHandler],
+        default_api_key: Optional[str] = None,
+    ) -> BaseChatModel:
+        return _create_chat_openai_model(
+            model_id=llm_config.model_id,
+            base_url=_prepare_openai_compatible_url(llm_config.url),
+            api_key=llm_config.api_key if llm_config.api_key is not None else default_api_key,
+            use_responses_api=use_responses_api,
+            callbacks=callbacks,
+            generation_config=generation_config,
+            retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
+        )
+
+    def _oci_genai_config_convert_to_langgraph(
+        self,
+        llm_config: OciGenAiConfig,
+        generation_config: "_GenerationConfig",
+        use_responses_api: bool,
+        callbacks: List[BaseCallbackHandler],
+    ) -> BaseChatModel:
+        if use_responses_api:
+            raise NotImplementedError(
+                "OCI GenAI models with OpenAI Responses API is not yet supported"
             )
-        elif isinstance(llm_config, OpenAiConfig):
-            return _create_chat_openai_model(
-                model_id=llm_config.model_id,
-                api_key=llm_config.api_key,
-                use_responses_api=use_responses_api,
-                callbacks=callbacks,
-                generation_config=generation_config,
-                retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
+
+        if llm_config.retry_policy is not None:
+            raise NotImplementedError(
+                "LangGraph OCI GenAI conversion does not support `RetryPolicy`."
             )
-        elif isinstance(llm_config, OpenAiCompatibleConfig):
+
+        from langchain_oci import ChatOCIGenAI  # type: ignore
+
+        oci_model_kwargs: dict[str, int | float] = {}
+        if "temperature" in generation_config:
+            oci_model_kwargs["temperature"] = generation_config["temperature"]
+        if "top_p" in generation_config:
+            oci_model_kwargs["top_p"] = generation_config["top_p"]
+        max_tokens = generation_config.get("max_tokens")
+        if max_tokens is not None:
+            token_key = "max_completion_tokens" if "openai" in llm_config.model_id else "max_tokens"
+            oci_model_kwargs[token_key] = max_tokens
+
+        return ChatOCIGenAI(  # type: ignore
+            model_id=llm_config.model_id,
+            compartment_id=llm_config.compartment_id,
+            model_kwargs=oci_model_kwargs,
+            **self._oci_client_config_to_langgraph(llm_config.client_config),
+        )
+
+    def _generic_llm_config_convert_to_langgraph(
+        self,
+        llm_config: AgentSpecLlmConfig,
+        generation_config: "_GenerationConfig",
+        use_responses_api: bool,
+        callbacks: List[BaseCallbackHandler],
+    ) -> BaseChatModel:
+        # Bare LlmConfig — dispatch on api_provider string
+        if llm_config.api_provider == "openai":
             return _create_chat_openai_model(
                 model_id=llm_config.model_id,
-                base_url=_prepare_openai_compatible_url(llm_config.url),
+                base_url=(
+                    _ensure_url_has_scheme(llm_config.url) if llm_config.url is not None else None
+                ),
                 api_key=llm_config.api_key,
-                use_responses_api=use_responses_api,
+                use_responses_api=llm_config.api_type == "responses",
                 callbacks=callbacks,
                 generation_config=generation_config,
                 retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
             )
-        elif isinstance(llm_config, OciGenAiConfig):
-            if use_responses_api:
-                raise NotImplementedError(
-                    "OCI GenAI models with OpenAI Responses API is not yet supported"
-                )
-
-            if llm_config.retry_policy is not None:
-                raise NotImplementedError(
-                    "LangGraph OCI GenAI conversion does not support `RetryPolicy`."
-                )
-
-            from langchain_oci import ChatOCIGenAI  # type: ignore
-
-            oci_model_kwargs: dict[str, int | float] = {}
-            if "temperature" in generation_config:
-                oci_model_kwargs["temperature"] = generation_config["temperature"]
-            if "top_p" in generation_config:
-                oci_model_kwargs["top_p"] = generation_config["top_p"]
-            max_tokens = generation_config.get("max_tokens")
-            if max_tokens is not None:
-                token_key = (
-                    "max_completion_tokens" if "openai" in llm_config.model_id else "max_tokens"
-                )
-                oci_model_kwargs[token_key] = max_tokens
-
-            return ChatOCIGenAI(  # type: ignore
-                model_id=llm_config.model_id,
-                compartment_id=llm_config.compartment_id,
-                model_kwargs=oci_model_kwargs,
-                **self._oci_client_config_to_langgraph(llm_config.client_config),
-            )
-        else:
-            # Bare LlmConfig — dispatch on api_provider string
-            if llm_config.api_provider == "openai":
-                return _create_chat_openai_model(
-                    model_id=llm_config.model_id,
-                    base_url=(
-                        _ensure_url_has_scheme(llm_config.url)
-                        if llm_config.url is not None
-                        else None
-                    ),
-                    api_key=llm_config.api_key,
-                    use_responses_api=llm_config.api_type == "responses",
-                    callbacks=callbacks,
-                    generation_config=generation_config,
-                    retry_config=self._retry_policy_convert_to_langgraph(llm_config.retry_policy),
-                )
-            raise NotImplementedError(
-                f"LlmConfig with api_provider='{llm_config.api_provider}' is not yet supported "
-                f"in langgraph. Consider using a specific LlmConfig subclass instead."
-            )
+        raise NotImplementedError(
+            f"LlmConfig with api_provider='{llm_config.api_provider}' is not yet supported "
+            f"in langgraph. Consider using a specific LlmConfig subclass instead."
+        )
 
     def _retry_policy_convert_to_langgraph(
         self, retry_policy: Optional[RetryPolicy]
@@ -1453,63 +1712,92 @@ class AgentSpecToLangGraphConverter:
     def _client_transport_convert_to_langgraph(
         self, agentspec_component: AgentSpecClientTransport
     ) -> "Union[StdioConnection, SSEConnection, StreamableHttpConnection]":
-        import datetime
-
-        from langchain_mcp_adapters.sessions import (
-            SSEConnection,
-            StdioConnection,
-            StreamableHttpConnection,
-        )
-
-        sesh = agentspec_component.session_parameters.model_dump()
-        sesh["read_timeout_seconds"] = datetime.timedelta(seconds=sesh["read_timeout_seconds"])
-        if isinstance(agentspec_component, AgentSpecStdioTransport):
-            return StdioConnection(
-                transport="stdio",
-                command=agentspec_component.command,
-                args=agentspec_component.args,
-                env=agentspec_component.env,
-                cwd=agentspec_component.cwd,
-                session_kwargs=sesh,
-            )
-        if isinstance(agentspec_component, AgentSpecSSEmTLSTransport):
-            return SSEConnection(
-                transport="sse",
-                url=agentspec_component.url,
-                headers=agentspec_component.headers,
-                httpx_client_factory=_HttpxClientFactory(
-                    key_file=agentspec_component.key_file,
-                    cert_file=agentspec_component.cert_file,
-                    ssl_ca_cert=agentspec_component.ca_file,
-                ),
-            )
-        if isinstance(agentspec_component, AgentSpecSSETransport):
-            return SSEConnection(
-                transport="sse",
-                url=agentspec_component.url,
-                headers=agentspec_component.headers,
-                httpx_client_factory=_HttpxClientFactory(verify=True),
-            )
-        if isinstance(agentspec_component, AgentSpecStreamableHTTPmTLSTransport):
-            return StreamableHttpConnection(
-                transport="streamable_http",
-                url=agentspec_component.url,
-                headers=agentspec_component.headers,
-                httpx_client_factory=_HttpxClientFactory(
-                    key_file=agentspec_component.key_file,
-                    cert_file=agentspec_component.cert_file,
-                    ssl_ca_cert=agentspec_component.ca_file,
-                ),
-            )
-        if isinstance(agentspec_component, AgentSpecStreamableHTTPTransport):
-            return StreamableHttpConnection(
-                transport="streamable_http",
-                url=agentspec_component.url,
-                headers=agentspec_component.headers,
-                httpx_client_factory=_HttpxClientFactory(verify=True),
+        convert_handler = _resolve_conversion_handler(
+            type(agentspec_component),
+            _TRANSPORT_CONVERTERS,
+            _RESOLVED_TRANSPORT_CONVERTERS,
+            _TRANSPORT_CLASSES,
+        )
+        if convert_handler is None:
+            raise ValueError(
+                f"Agent Spec ClientTransport '{agentspec_component.__class__.__name__}' is not supported yet."
             )
-        raise ValueError(
-            f"Agent Spec ClientTransport '{agentspec_component.__class__.__name__}' is not supported yet."
+        return cast(
+            "Union[StdioConnection, SSEConnection, StreamableHttpConnection]",
+            convert_handler(self, agentspec_component),
+        )
+
+    def _stdio_transport_convert_to_langgraph(
+        self, agentspec_component: AgentSpecStdioTransport
+    ) -> "StdioConnection":
+        StdioConnection, _, _ = _get_mcp_connection_classes()
+        session_parameters = agentspec_component.session_parameters
+        sesh: Dict[str, Any] = {
+            field_name: getattr(session_parameters, field_name)
+            for field_name in _SESSION_PARAMETERS_FIELDS
+        }
+        sesh["read_timeout_seconds"] = datetime.timedelta(
+            seconds=session_parameters.read_timeout_seconds
+        )
+        return StdioConnection(
+            transport="stdio",
+            command=agentspec_component.command,
+            args=agentspec_component.args,
+            env=agentspec_component.env,
+            cwd=agentspec_component.cwd,
+            session_kwargs=sesh,
+        )
+
+    def _sse_mtls_transport_convert_to_langgraph(
+        self, agentspec_component: AgentSpecSSEmTLSTransport
+    ) -> "SSEConnection":
+        _, SSEConnection, _ = _get_mcp_connection_classes()
+        return SSEConnection(
+            transport="sse",
+            url=agentspec_component.url,
+            headers=agentspec_component.headers,
+            httpx_client_factory=_HttpxClientFactory(
+                key_file=agentspec_component.key_file,
+                cert_file=agentspec_component.cert_file,
+                ssl_ca_cert=agentspec_component.ca_file,
+            ),
+        )
+
+    def _sse_transport_convert_to_langgraph(
+        self, agentspec_component: AgentSpecSSETransport
+    ) -> "SSEConnection":
+        _, SSEConnection, _ = _get_mcp_connection_classes()
+        return SSEConnection(
+            transport="sse",
+            url=agentspec_component.url,
+            headers=agentspec_component.headers,
+            httpx_client_factory=_get_default_httpx_client_factory(),
+        )
+
+    def _streamable_http_mtls_transport_convert_to_langgraph(
+        self, agentspec_component: AgentSpecStreamableHTTPmTLSTransport
+    ) -> "StreamableHttpConnection":
+        _, _, StreamableHttpConnection = _get_mcp_connection_classes()
+        return StreamableHttpConnection(
+            transport="streamable_http",
+            url=agentspec_component.url,
+            headers=agentspec_component.headers,
+            httpx_client_factory=_HttpxClientFactory(
+                key_file=agentspec_component.key_file,
+                cert_file=agentspec_component.cert_file,
+                ssl_ca_cert=agentspec_component.ca_file,
+            ),
+        )
+
+    def _streamable_http_transport_convert_to_langgraph(
+        self, agentspec_component: AgentSpecStreamableHTTPTransport
+    ) -> "StreamableHttpConnection":
+        _, _, StreamableHttpConnection = _get_mcp_connection_classes()
+        return StreamableHttpConnection(
+            transport="streamable_http",
+            url=agentspec_component.url,
+            headers=agentspec_component.headers,
+            httpx_client_factory=_get_default_httpx_client_factory(),
         )
 
     def _get_or_create_langgraph_mcp_tools(
@@ -1528,41 +1816,136 @@ class AgentSpecToLangGraphConverter:
         without reloading.
         - Otherwise, loads tools and inserts them atomically into the registry.
         """
-        from langchain_mcp_adapters.tools import load_mcp_tools
-
         conn_prefix = f"{connection_key}::"
-        existing = _get_session_tools_from_tool_registry(tool_registry, conn_prefix)
+        existing = self._get_session_tools(tool_registry, conn_prefix)
         if existing:
             return existing
 
-        async def load_all_mcp_tools() -> List[BaseTool]:
-            # Note: langchain supports session-specific MCP tools but we don't support that
-            return await load_mcp_tools(session=None, connection=langgraph_connection)
+        tools = run_async_in_sync(
+            self._aload_langgraph_mcp_tools,
+            client_transport,
+            langgraph_connection,
+            method_name="load_mcp_tools",
+        )
+        return self._add_session_tools(tool_registry, tools, conn_prefix)
 
-        tools = run_async_in_sync(load_all_mcp_tools, method_name="load_mcp_tools")
-        # We add callbacks to the tool for proper tracing
-        for tool in tools:
-            # Since we might not have the tool definition (e.g., in toolboxes)
-            # we create the tool on-the-fly
-            agentspec_tool = AgentSpecMCPTool(
-                name=tool.name,
-                description=tool.description,
-                client_transport=client_transport,
-                inputs=[
-                    AgentSpecProperty(title=arg_name, json_schema=arg_json_schema)
-                    for arg_name, arg_json_schema in tool.args.items()
-                ],
-                outputs=[AgentSpecStringProperty(title="tool_output")],
+    def _get_session_tools(
+        self, tool_registry: Dict[str, LangGraphTool], conn_prefix: str
+    ) -> Dict[str, BaseTool]:
+        """Return the MCP tools of a connection found in the tool_registry, by unprefixed name."""
+        return self._get_sessions_tools(tool_registry, [conn_prefix])[conn_prefix]
+
+    def _get_sessions_tools(
+        self, tool_registry: Dict[str, LangGraphTool], conn_prefixes: List[str]
+    ) -> Dict[str, Dict[str, BaseTool]]:
+        """Return the MCP tools of several connections found in the tool_registry, by prefix.
+
+        Connections whose tools are not memoized are looked up with a single pass over the
+        registry, whatever their number.
+        """
+        sessions_tools: Dict[str, Dict[str, BaseTool]] = {}
+        conn_prefixes_to_scan: List[str] = []
+        for conn_prefix in conn_prefixes:
+            session_tools = self._session_tools_cache.get((id(tool_registry), conn_prefix))
+            # The registry may have been changed since, so we check that the tools are still there
+            if session_tools is not None and all(
+                tool_registry.get(f"{conn_prefix}{tool_name}") is tool
+                for tool_name, tool in session_tools.items()
+            ):
+                sessions_tools[conn_prefix] = dict(session_tools)
+            else:
+                conn_prefixes_to_scan.append(conn_prefix)
+        if conn_prefixes_to_scan:
+            scanned_sessions_tools = _get_session_tools_from_tool_registry(
+                tool_registry, conn_prefixes_to_scan
             )
-            if not tool.callbacks:
-                tool.callbacks = []
-            if isinstance(tool.callbacks, BaseCallbackHandler):
-                tool.callbacks = [tool.callbacks]
-            tool.callbacks.append(AgentSpecToolCallbackHandler(tool=agentspec_tool))  # type: ignore
+            for conn_prefix, session_tools in scanned_sessions_tools.items():
+                if session_tools:
+                    self._session_tools_cache[(id(tool_registry), conn_prefix)] = session_tools
+                sessions_tools[conn_prefix] = dict(session_tools)
+        return sessions_tools
+
+    def _add_session_tools(
+        self, tool_registry: Dict[str, LangGraphTool], tools: List[BaseTool], conn_prefix: str
+    ) -> Dict[str, BaseTool]:
+        """Add the MCP tools of a connection to the tool_registry, and return them by name."""
+        session_tools = _add_session_tools_to_registry(tool_registry, tools, conn_prefix)
+        self._session_tools_cache[(id(tool_registry), conn_prefix)] = session_tools
+        return dict(session_tools)
 
-        _add_session_tools_to_registry(tool_registry, tools, conn_prefix)
+    def _preload_langgraph_mcp_tools(
+        self,
+        client_transports: List[AgentSpecClientTransport],
+        tool_registry: Dict[str, LangGraphTool],
+        converted_components: Dict[str, Any],
+    ) -> None:
+        """
+        Load the MCP tools of several client transports concurrently into the tool_registry.
 
-        return _get_session_tools_from_tool_registry(tool_registry, conn_prefix)
+        Loading is dominated by the round-trips to the MCP servers, so when an agent uses tools
+        from several servers we wait for all of them at once instead of one after the other.
+        Transports whose tools are already in the registry are skipped, and so is a single one,
+        as it is loaded on conversion of its tools in the same way.
+        """
+        sessions_tools = self._get_sessions_tools(
+            tool_registry,
+            [f"{client_transport.id}::" for client_transport in client_transports],
+        )
+        client_transports_to_load = {
+            client_transport.id: client_transport
+            for client_transport in client_transports
+            if not sessions_tools[f"{client_transport.id}::"]
+        }
+        if len(client_transports_to_load) < 2:
+            return
+        _ensure_mcp_dependency_installed()
+        connections = [
+            (
+                client_transport,
+                self.convert(
+                    client_transport,
+                    tool_registry=tool_registry,
+                    converted_components=converted_components,
+                ),
+            )
+            for client_transport in client_transports_to_load.values()
+        ]
+
+        async def load_all_mcp_tools() -> List[List[BaseTool]]:
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_MCP_TOOLS_LOADS)
+
+            async def load_mcp_tools(
+                client_transport: AgentSpecClientTransport,
+                connection: "Union[StdioConnection, SSEConnection, StreamableHttpConnection]",
+            ) -> List[BaseTool]:
+                async with semaphore:
+                    return await self._aload_langgraph_mcp_tools(client_transport, connection)
+
+            return await asyncio.gather(
+                *(
+                    load_mcp_tools(client_transport, connection)
+                    for client_transport, connection in connections
+                )
+            )
+
+        all_tools = run_async_in_sync(load_all_mcp_tools, method_name="load_mcp_tools")
+        for (client_transport, _), tools in zip(connections, all_tools):
+            self._add_session_tools(tool_registry, tools, f"{client_transport.id}::")
+
+    async def _aload_langgraph_mcp_tools(
+        self,
+        client_transport: AgentSpecClientTransport,
+        langgraph_connection: "Union[StdioConnection, SSEConnection, StreamableHttpConnection]",
+    ) -> List[BaseTool]:
+        """Load the MCP tools exposed through a connection, with their tracing callbacks."""
+        load_mcp_tools = _get_load_mcp_tools()
+        # Note: langchain supports session-specific MCP tools but we don't support that
+        tools = await load_mcp_tools(session=None, connection=langgraph_connection)
+        # We add callbacks to the tool for proper tracing
+        for tool in tools:
+            agentspec_tool = _get_loaded_mcp_tool_spec(client_transport, tool)
+            _add_tool_callback_handler(tool, _get_tool_callback_handler(agentspec_tool))
+        return tools
 
     def _oci_client_config_to_langgraph(
         self, client_config: OciClientConfig
@@ -1598,40 +1981,56 @@ class AgentSpecToLangGraphConverter:
 
 
 def _get_session_tools_from_tool_registry(
-    tool_registry: Dict[str, LangGraphTool], conn_prefix: str
-) -> Dict[str, BaseTool]:
-    return {
-        key.replace(conn_prefix, ""): cast(BaseTool, tool)
-        for key, tool in tool_registry.items()
-        if key.startswith(conn_prefix)
+    tool_registry: Dict[str, LangGraphTool], conn_prefixes: List[str]
+) -> Dict[str, Dict[str, BaseTool]]:
+    # Session tools are registered as f"{conn_prefix}{tool_name}" where the prefix ends with "::",
+    # so each key is bucketed by looking up its parts up to a "::" among the prefixes, instead of
+    # checking it against every prefix
+    sessions_tools: Dict[str, Dict[str, BaseTool]] = {
+        conn_prefix: {} for conn_prefix in conn_prefixes
     }
+    for key, tool in tool_registry.items():
+        separator_index = key.find("::")
+        while separator_index != -1:
+            prefix_end = separator_index + 2
+            session_tools = sessions_tools.get(key[:prefix_end])
+            if session_tools is not None:
+                session_tools[sys.intern(key[prefix_end:])] = cast(BaseTool, tool)
+            separator_index = key.find("::", separator_index + 1)
+    return sessions_tools
+
+
+def _get_session_tool_name(tool: BaseTool) -> str:
+    # Derive a name: prefer .name, fallback to __name__ for callables
+    tool_name = getattr(tool, "name", None)
+    if not tool_name and callable(tool):
+        tool_name = getattr(tool, "__name__", None)
+    if not tool_name:
+        raise ValueError("Loaded a tool without a name attribute or __name__.")
+    return str(tool_name)
 
 
 def _add_session_tools_to_registry(
     tool_registry: Dict[str, LangGraphTool], tools: List[BaseTool], conn_prefix: str
-) -> None:
-    # Prepare a staged mapping so we can insert all-or-nothing
-    staged: Dict[str, BaseTool] = {}
-    for tool in tools:
-        # Derive a name: prefer .name, fallback to __name__ for callables
-        tool_name = getattr(tool, "name", None)
-        if not tool_name and callable(tool):
-            tool_name = getattr(tool, "__name__", None)
-        if not tool_name:
-            raise ValueError("Loaded a tool without a name attribute or __name__.")
-
-        key = f"{conn_prefix}{tool_name}"
-        # Do not overwrite an existing entry if present
-        if key not in tool_registry:
-            staged[key] = tool
-        else:
-            raise ValueError(
-                "Trying to add the same tool twice; this might happen "
-                "when the tool is declared as both a standalone MCPTool and part of a MCPToolBox"
-            )
+) -> Dict[str, BaseTool]:
+    # Prepare a staged mapping so we can insert all-or-nothing. Names and keys are interned, so
+    # that the registries and memos of the converters share them, whatever the number of loads
+    session_tools = {sys.intern(_get_session_tool_name(tool)): tool for tool in tools}
+    staged = {
+        sys.intern(f"{conn_prefix}{tool_name}"): tool for tool_name, tool in session_tools.items()
+    }
+    # Do not overwrite existing entries
+    duplicated_keys = staged.keys() & tool_registry.keys()
+    if duplicated_keys:
+        raise ValueError(
+            "Trying to add the same tool twice; this might happen "
+            "when the tool is declared as both a standalone MCPTool and part of a MCPToolBox. "
+            f"Tools already registered: {', '.join(sorted(duplicated_keys))}"
+        )
 
     # Commit staged entries
     tool_registry.update(staged)
+    return session_tools
 
 
 def _generation_config_from_agentspec(
@@ -1665,7 +2064,7 @@ def _create_chat_openai_model(
     and results in a model without a sync client. Only pass `api_key` when it is explicitly
     specified in the Agent Spec config.
     """
-    from langchain_openai import ChatOpenAI
+    ChatOpenAI = _get_chat_openai_class()
 
     optional_kwargs: _ChatOpenAIOptionalKwargs = {}
     max_retries = retry_config.get("max_retries")
@@ -1730,6 +2129,8 @@ def _ensure_url_has_scheme(url: str) -> str:
     return url
 
 
+# Pure function called on every LLM conversion with URLs from a few configurations
+@lru_cache(maxsize=128)
 def _prepare_openai_compatible_url(url: str) -> str:
     """
     Correctly formats a URL for an OpenAI-compatible server.
@@ -1744,8 +2145,6 @@ def _prepare_openai_compatible_url(url: str) -> str:
         - "https://api.example.com"   -> "https://api.example.com/v1"
         - "http://my-host/api/v2"   -> "http://my-host/v1"
     """
-    from urllib.parse import urlparse, urlunparse
-
     url = _ensure_url_has_scheme(url)
     parsed_url = urlparse(url)
     # parsed_url is a namedtuple object, and it has the _replace method
@@ -1756,6 +2155,64 @@ def _prepare_openai_compatible_url(url: str) -> str:
     return str(final_url)
 
 
+# Output of the specs of the tools loaded from MCP servers, traced with their textual output
+_MCP_TOOL_OUTPUT_PROPERTY = AgentSpecStringProperty(title="tool_output")
+
+
+def _get_mcp_tool_args_key(tool_args: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Return the names and canonical JSON schemas of the arguments of a tool, in order."""
+    return tuple(
+        (arg_name, _get_json_schema_key(arg_json_schema))
+        for arg_name, arg_json_schema in tool_args.items()
+    )
+
+
+@lru_cache(maxsize=512)
+def _get_mcp_tool_inputs(
+    tool_args_key: Tuple[Tuple[str, str], ...],
+) -> Tuple[AgentSpecProperty, ...]:
+    """Return the Agent Spec inputs of a tool loaded from an MCP server, given its arguments.
+
+    The servers expose the same tools every time they are loaded, so the properties are shared.
+    """
+    return tuple(
+        AgentSpecProperty(title=arg_name, json_schema=json.loads(arg_json_schema_key))
+        for arg_name, arg_json_schema_key in tool_args_key
+    )
+
+
+# Specs of the tools loaded from MCP servers, by id of their client transport, name, description
+# and arguments. The spec keeps its transport alive, so the id cannot be reused as long as the
+# entry exists, which is as long as the tracing callback of some loaded tool holds the spec
+_LoadedMCPToolSpecKey = Tuple[int, str, str, Tuple[Tuple[str, str], ...]]
+_LOADED_MCP_TOOL_SPECS: "weakref.WeakValueDictionary[_LoadedMCPToolSpecKey, AgentSpecMCPTool]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_loaded_mcp_tool_spec(
+    client_transport: AgentSpecClientTransport, tool: BaseTool
+) -> AgentSpecMCPTool:
+    """Return the Agent Spec tool used to trace a tool loaded from an MCP server.
+
+    Since we might not have the tool definition (e.g., in toolboxes), the spec is created
+    on-the-fly, once for all the loads of the same tool through the same client transport.
+    """
+    tool_args_key = _get_mcp_tool_args_key(tool.args)
+    cache_key = (id(client_transport), tool.name, tool.description, tool_args_key)
+    agentspec_tool = _LOADED_MCP_TOOL_SPECS.get(cache_key)
+    if agentspec_tool is None:
+        agentspec_tool = AgentSpecMCPTool(
+            name=tool.name,
+            description=tool.description,
+            client_transport=client_transport,
+            inputs=list(_get_mcp_tool_inputs(tool_args_key)),
+            outputs=[_MCP_TOOL_OUTPUT_PROPERTY],
+        )
+        _LOADED_MCP_TOOL_SPECS[cache_key] = agentspec_tool
+    return agentspec_tool
+
+
 def _are_mcp_tool_spec_and_langchain_schemas_equal(
     mcp_spec: AgentSpecMCPToolSpec, langchain_schema: BaseTool
 ) -> bool:
@@ -1764,26 +2221,54 @@ def _are_mcp_tool_spec_and_langchain_schemas_equal(
             f"Expected Langchain StructuredTool.args_schema to be a dict but got {type(langchain_schema.args_schema)}"
         )
     agentspec_json_schemas = {
-        inp.json_schema["title"]: _normalize_title(inp.json_schema)
-        for inp in (mcp_spec.inputs or [])
-    }
-    langchain_json_schemas = {
-        k: _normalize_title(v) for k, v in langchain_schema.args_schema["properties"].items()
+        inp.json_schema["title"]: inp.json_schema for inp in (mcp_spec.inputs or [])
     }
-    return json_schemas_have_same_type(agentspec_json_schemas, langchain_json_schemas)
+    langchain_json_schemas = langchain_schema.args_schema["properties"]
+    return _json_schemas_of_keys_have_same_type(
+        _get_json_schema_key(agentspec_json_schemas),
+        _get_json_schema_key(langchain_json_schemas),
+    )
+
+
+@lru_cache(maxsize=512)
+def _json_schemas_of_keys_have_same_type(json_schemas_key_a: str, json_schemas_key_b: str) -> bool:
+    """Compare the types of the schemas of properties given by their canonical JSON form.
+
+    Results only depend on the content of the schemas, so changes to the specs are accounted for,
+    and the schemas are only normalized when they were never compared.
+    """
+    # Schemas with the same canonical form define the same types, without walking them
+    if json_schemas_key_a == json_schemas_key_b:
+        return True
+    return json_schemas_have_same_type(
+        {k: _normalize_title(v) for k, v in json.loads(json_schemas_key_a).items()},
+        {k: _normalize_title(v) for k, v in json.loads(json_schemas_key_b).items()},
+    )
 
 
 def _normalize_title(d: Dict[str, Any]) -> Dict[str, Any]:
-    """If `title`, then lowercase."""
-    out = dict(d)  # shallow copy
-    if isinstance(out.get("title"), str):
-        out["title"] = out["title"].lower()
-    return out
+    """If `title`, then lowercase. The schema is only copied when its title changes."""
+    title = d.get("title")
+    if not isinstance(title, str):
+        return d
+    lowercase_title = title.lower()
+    if lowercase_title == title:
+        return d
+    return {**d, "title": lowercase_title}
+
+
+# aligned with https://docs.langchain.com/oss/python/langchain/human-in-the-loop#responding-to-interrupts
+_ALLOWED_DECISIONS: Tuple[str, ...] = ("approve", "reject")
+
+
+_REVIEW_CONFIG_DESCRIPTION = (
+    'Please resume with {"decisions": [{"type": "approve"}]}  # or "reject" '
+    'with an optional "reason" for rejected tool calls.'
+)
 
 
 def _confirm_tool_use(tool_name: str, **tool_arguments: Any) -> Tuple[bool, str]:
-    # aligned with https://docs.langchain.com/oss/python/langchain/human-in-the-loop#responding-to-interrupts
-    ALLOWED_DECISIONS = ["approve", "reject"]
+    # The payload is built from scratch at every call, as it is handed over to the caller
     confirmation_payload = {
         "action_requests": [
             {
@@ -1795,14 +2280,13 @@ def _confirm_tool_use(tool_name: str, **tool_arguments: Any) -> Tuple[bool, str]
         "review_configs": [
             {
                 "action_name": tool_name,
-                "allowed_decisions": ALLOWED_DECISIONS,
-                "description": (
-                    'Please resume with {"decisions": [{"type": "approve"}]}  # or "reject" '
-                    'with an optional "reason" for rejected tool calls.'
-                ),
+                "allowed_decisions": list(_ALLOWED_DECISIONS),
+                "description": _REVIEW_CONFIG_DESCRIPTION,
             }
         ],
     }
+    # `interrupt` does not wait for the user: it raises to suspend the graph until it is resumed,
+    # and returns the resume value when the tool is called again. So async wrappers can call it too
     response = interrupt(confirmation_payload)
     if not isinstance(response, dict) or "decisions" not in response:
         raise ValueError(
@@ -1816,15 +2300,22 @@ def _confirm_tool_use(tool_name: str, **tool_arguments: Any) -> Tuple[bool, str]
             f"should be of length 1, was of length {len(decision_list)}"
         )
     decision = decision_list[0]
-    if "type" not in decision or decision["type"] not in ALLOWED_DECISIONS:
+    if "type" not in decision or decision["type"] not in _ALLOWED_DECISIONS:
         raise ValueError(
             f"Tool confirmation result for tool {tool_name} is not valid, "
-            f"decision should be in {ALLOWED_DECISIONS}, was {decision}."
+            f"decision should be in {list(_ALLOWED_DECISIONS)}, was {decision}."
         )
 
     return (decision["type"] == "approve"), decision.get("reason", "No reason was provided.")
 
 
+# Confirmation wrappers, by id of their wrapped callable and tool name. The wrapper keeps its
+# callable alive, so the id cannot be reused by another callable as long as the entry exists
+_CONFIRMATION_WRAPPERS: "weakref.WeakValueDictionary[Tuple[int, str], Callable[..., Any]]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 @overload
 def _confirm_then(
     func: Callable[..., Awaitable[Any]],
@@ -1850,6 +2341,18 @@ def _confirm_then(
     if not requires_confirmation:
         return func
 
+    wrapper_key = (id(func), tool_name)
+    wrapper = _CONFIRMATION_WRAPPERS.get(wrapper_key)
+    if wrapper is None:
+        wrapper = _create_confirmation_wrapper(func, tool_name)
+        _CONFIRMATION_WRAPPERS[wrapper_key] = wrapper
+    return wrapper
+
+
+def _create_confirmation_wrapper(func: Callable[..., Any], tool_name: str) -> Callable[..., Any]:
+    # The wrappers must stay plain functions: LangGraph's ToolNode reads the type hints of tool
+    # callables with `typing.get_type_hints`, which rejects `functools.partial` objects
+
     if _is_async_callable(func):
 
         async def _wrapped_async(*args: Any, **kwargs: Any) -> Any:
@@ -1953,10 +2456,203 @@ def _get_structured_tool_callable_kwargs(
 def _ensure_checkpointer_and_valid_tool_config(
     agentspec_tool: AgentSpecTool, checkpointer: Optional[Checkpointer]
 ) -> None:
+    # Both checks are about tools used without checkpointer, so tools converted with one are done
+    if checkpointer is not None:
+        return
     tool_name = agentspec_tool.name
-    if agentspec_tool.requires_confirmation and checkpointer is None:
+    if agentspec_tool.requires_confirmation:
         raise ValueError(
             f"A Checkpointer is required for tool '{tool_name}' because requires_confirmation=True"
         )
-    elif isinstance(agentspec_tool, AgentSpecClientTool) and checkpointer is None:
+    elif isinstance(agentspec_tool, AgentSpecClientTool):
         raise ValueError(f"A Checkpointer is required when using ClientTool '{tool_name}'.")
+
+
+def _check_tool_config_then(
+    convert: Callable[..., Any],
+) -> Callable[..., Any]:
+    def _convert_tool(
+        converter: AgentSpecToLangGraphConverter,
+        agentspec_tool: AgentSpecTool,
+        *,
+        checkpointer: Optional[Checkpointer],
+        **context: Any,
+    ) -> Any:
+        _ensure_checkpointer_and_valid_tool_config(agentspec_tool, checkpointer)
+        return convert(converter, agentspec_tool, checkpointer=checkpointer, **context)
+
+    return _convert_tool
+
+
+def _requires_mcp_then(convert: Callable[..., Any]) -> Callable[..., Any]:
+    def _convert_mcp_component(
+        converter: AgentSpecToLangGraphConverter, component: AgentSpecComponent, **context: Any
+    ) -> Any:
+        _ensure_mcp_dependency_installed()
+        return convert(converter, component, **context)
+
+    return _convert_mcp_component
+
+
+# Conversion handlers are called as ``handler(converter, component, **context)``, where the
+# context holds ``tool_registry``, ``converted_components``, ``checkpointer``, ``config`` and
+# ``middleware``. Each handler forwards only what its converter method accepts.
+_ConversionHandlerT: TypeAlias = Callable[..., Any]
+
+_COMPONENT_CONVERTERS: Dict[type, _ConversionHandlerT] = {
+    AgentSpecAgent: lambda converter, component, **context: (
+        converter._agent_convert_to_langgraph(component, **context)
+    ),
+    AgentSpecSwarm: lambda converter, component, **context: (
+        converter._swarm_convert_to_langgraph(component, **context)
+    ),
+    AgentSpecLlmConfig: lambda converter, component, config, **_: (
+        converter._llm_convert_to_langgraph(component, config=config)
+    ),
+    AgentSpecClientTransport: lambda converter, component, **_: (
+        converter._client_transport_convert_to_langgraph(component)
+    ),
+    AgentSpecMCPTool: _requires_mcp_then(
+        _check_tool_config_then(
+            lambda converter, component, tool_registry, converted_components, **_: (
+                converter._mcp_tool_convert_to_langgraph(
+                    component,
+                    tool_registry=tool_registry,
+                    converted_components=converted_components,
+                )
+            )
+        )
+    ),
+    AgentSpecMCPToolBox: _requires_mcp_then(
+        lambda converter, component, tool_registry, converted_components, **_: (
+            converter._mcp_toolbox_convert_to_langgraph(
+                component,
+                tool_registry=tool_registry,
+                converted_components=converted_components,
+            )
+        )
+    ),
+    AgentSpecServerTool: _check_tool_config_then(
+        lambda converter, component, tool_registry, config, **_: (
+            converter._server_tool_convert_to_langgraph(component, tool_registry, config=config)
+        )
+    ),
+    AgentSpecClientTool: _check_tool_config_then(
+        lambda converter, component, **_: converter._client_tool_convert_to_langgraph(component)
+    ),
+    AgentSpecRemoteTool: _check_tool_config_then(
+        lambda converter, component, config, **_: (
+            converter._remote_tool_convert_to_langgraph(component, config=config)
+        )
+    ),
+    AgentSpecFlow: lambda converter, component, **context: (
+        converter._flow_convert_to_langgraph(component, **context)
+    ),
+    AgentSpecNode: lambda converter, component, **context: (
+        converter._node_convert_to_langgraph(component, **context)
+    ),
+}
+
+_NODE_CONVERTERS: Dict[type, _ConversionHandlerT] = {
+    AgentSpecStartNode: lambda converter, node, **_: converter._start_node_convert_to_langgraph(
+        node
+    ),
+    AgentSpecEndNode: lambda converter, node, **_: converter._end_node_convert_to_langgraph(node),
+    AgentSpecToolNode: lambda converter, node, middleware, **context: (
+        converter._tool_node_convert_to_langgraph(node, **context)
+    ),
+    AgentSpecLlmNode: lambda converter, node, middleware, **context: (
+        converter._llm_node_convert_to_langgraph(node, **context)
+    ),
+    AgentSpecAgentNode: lambda converter, node, **context: (
+        converter._agent_node_convert_to_langgraph(node, **context)
+    ),
+    AgentSpecBranchingNode: lambda converter, node, **_: (
+        converter._branching_node_convert_to_langgraph(node)
+    ),
+    AgentSpecApiNode: lambda converter, node, **_: converter._api_node_convert_to_langgraph(node),
+    AgentSpecFlowNode: lambda converter, node, **context: (
+        converter._flow_node_convert_to_langgraph(node, **context)
+    ),
+    AgentSpecCatchExceptionNode: lambda converter, node, **context: (
+        converter._catch_exception_node_convert_to_langgraph(node, **context)
+    ),
+    AgentSpecInputMessageNode: lambda converter, node, **_: (
+        converter._input_message_node_convert_to_langgraph(node)
+    ),
+    AgentSpecOutputMessageNode: lambda converter, node, **_: (
+        converter._output_message_node_convert_to_langgraph(node)
+    ),
+    AgentSpecMapNode: lambda converter, node, **context: (
+        converter._map_node_convert_to_langgraph(node, **context)
+    ),
+}
+
+# Handlers by concrete (sub)class, seeded with the registered classes and filled lazily by
+# ``_resolve_conversion_handler``, so that known types are resolved with a single lookup
+_RESOLVED_COMPONENT_CONVERTERS: Dict[type, _ConversionHandlerT] = dict(_COMPONENT_CONVERTERS)
+_RESOLVED_NODE_CONVERTERS: Dict[type, _ConversionHandlerT] = dict(_NODE_CONVERTERS)
+
+# Registered classes, to reject unsupported types with a single ``issubclass`` check
+_COMPONENT_CLASSES = tuple(_COMPONENT_CONVERTERS)
+_NODE_CLASSES = tuple(_NODE_CONVERTERS)
+
+
+_LLM_CONVERTERS: Dict[type, _ConversionHandlerT] = {
+    # if llm_config.api_key is None, ChatOpenAI constructor will attempt to read from the env
+    # OPENAI_API_KEY and raise an error if missing
+    # as local vLLM servers are not typically set up with API keys, we use the "EMPTY" as the default
+    # for ease of use
+    VllmConfig: partial(
+        AgentSpecToLangGraphConverter._openai_compatible_config_convert_to_langgraph,
+        default_api_key="EMPTY",
+    ),
+    OllamaConfig: AgentSpecToLangGraphConverter._ollama_config_convert_to_langgraph,
+    OpenAiConfig: AgentSpecToLangGraphConverter._openai_config_convert_to_langgraph,
+    OpenAiCompatibleConfig: (
+        AgentSpecToLangGraphConverter._openai_compatible_config_convert_to_langgraph
+    ),
+    OciGenAiConfig: AgentSpecToLangGraphConverter._oci_genai_config_convert_to_langgraph,
+    # Every other LlmConfig is converted based on its api_provider
+    AgentSpecLlmConfig: AgentSpecToLangGraphConverter._generic_llm_config_convert_to_langgraph,
+}
+_RESOLVED_LLM_CONVERTERS: Dict[type, _ConversionHandlerT] = dict(_LLM_CONVERTERS)
+_LLM_CLASSES = tuple(_LLM_CONVERTERS)
+
+# The mTLS transports subclass their plain counterparts, the MRO lookup of
+# ``_resolve_conversion_handler`` keeps subclasses on the most specific builder
+_TRANSPORT_CONVERTERS: Dict[type, _ConversionHandlerT] = {
+    AgentSpecStdioTransport: AgentSpecToLangGraphConverter._stdio_transport_convert_to_langgraph,
+    AgentSpecSSEmTLSTransport: (
+        AgentSpecToLangGraphConverter._sse_mtls_transport_convert_to_langgraph
+    ),
+    AgentSpecSSETransport: AgentSpecToLangGraphConverter._sse_transport_convert_to_langgraph,
+    AgentSpecStreamableHTTPmTLSTransport: (
+        AgentSpecToLangGraphConverter._streamable_http_mtls_transport_convert_to_langgraph
+    ),
+    AgentSpecStreamableHTTPTransport: (
+        AgentSpecToLangGraphConverter._streamable_http_transport_convert_to_langgraph
+    ),
+}
+_RESOLVED_TRANSPORT_CONVERTERS: Dict[type, _ConversionHandlerT] = dict(_TRANSPORT_CONVERTERS)
+_TRANSPORT_CLASSES = tuple(_TRANSPORT_CONVERTERS)
+
+
+def _resolve_conversion_handler(
+    component_type: type,
+    converters: Dict[type, _ConversionHandlerT],
+    resolved_converters: Dict[type, _ConversionHandlerT],
+    supported_classes: Tuple[type, ...],
+) -> Optional[_ConversionHandlerT]:
+    """Return the conversion handler for the given type, following its MRO on a miss."""
+    convert_handler = resolved_converters.get(component_type)
+    if convert_handler is not None:
+        return convert_handler
+    if not issubclass(component_type, supported_classes):
+        return None
+    for base_type in component_type.__mro__[1:]:
+        convert_handler = converters.get(base_type)
+        if convert_handler is not None:
+            resolved_converters[component_type] = convert_handler
+            return convert_handler
+    return None
@@ -6,8 +6,10 @@
 
 import json
 import logging
+import traceback
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import anyio
 
@@ -16,7 +18,11 @@ from pyagentspec.adapters._url_validation import (
     maybe_warn_about_unrestricted_templated_url,
     validate_url_against_allow_list,
 )
-from pyagentspec.adapters._utils import render_nested_object_template, render_template
+from pyagentspec.adapters._utils import (
+    _compile_template,
+    render_nested_object_template,
+    render_template,
+)
 from pyagentspec.adapters.langgraph._types import (
     BaseChatModel,
     BaseMessage,
@@ -64,6 +70,8 @@ if TYPE_CHECKING:
         ImageContentBlock,
         TextContentBlock,
     )
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
 else:
     httpx = LazyLoader("httpx")
 
@@ -72,10 +80,83 @@ MessageLike = Union[BaseMessage, List[str], Tuple[str, str], str, Dict[str, Any]
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_langgraph_converter_class() -> "type[AgentSpecToLangGraphConverter]":
+    # The converter module imports this one, so it can only be imported lazily. It is done once,
+    # instead of every time an agent node is executed
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+
+    return AgentSpecToLangGraphConverter
+
+
+def _cast_to_string(value: Any) -> Any:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _cast_to_boolean(value: Any) -> Any:
+    return bool(value) if isinstance(value, (int, float)) else value
+
+
+def _cast_to_integer(value: Any) -> Any:
+    if isinstance(value, (float, bool)):
+        return int(value)
+    if isinstance(value, str):
+        # Try converting numeric strings to integers; if it fails, leave as-is
+        try:
+            return int(value.strip())
+        except ValueError as e:
+            if not str(e).startswith("could not convert string to int:"):
+                raise e
+    return value
+
+
+def _cast_to_number(value: Any) -> Any:
+    if isinstance(value, (int, bool)):
+        return float(value)
+    if isinstance(value, str):
+        # Try converting numeric strings to floats; if it fails, leave as-is
+        try:
+            return float(value.strip())
+        except ValueError as e:
+            if not str(e).startswith("could not convert string to float:"):
+                raise e
+    return value
+
+
+# How the values of properties are cast, by type of the property
+_PROPERTY_VALUE_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "string": _cast_to_string,
+    "boolean": _cast_to_boolean,
+    "integer": _cast_to_integer,
+    "number": _cast_to_number,
+}
+
+# Title, cast of the values (if any) and default value of a property
+_PropertySpec = Tuple[str, Optional[Callable[[Any], Any]], Any]
+
+
+def _get_property_specs(properties: List[AgentSpecProperty]) -> Tuple[_PropertySpec, ...]:
+    return tuple(
+        (
+            property_.title,
+            (
+                _PROPERTY_VALUE_CASTS.get(property_.type)
+                if isinstance(property_.type, str)
+                else None
+            ),
+            property_.default,
+        )
+        for property_ in properties
+    )
+
+
 class NodeExecutor(ABC):
     def __init__(self, node: Node) -> None:
         self.node = node
         self.edges: List[DataFlowEdge] = []
+        # The properties of the node are read once, instead of on every execution
+        self._input_specs = _get_property_specs(node.inputs or [])
+        self._output_specs = _get_property_specs(node.outputs or [])
 
     def __call__(self, state: FlowStateSchema) -> Any:
         inputs = self._get_inputs(state)
@@ -125,42 +206,19 @@ class NodeExecutor(ABC):
     def _cast_values_and_add_defaults(
         self,
         values_dict: Dict[str, Any],
-        properties: List[AgentSpecProperty],
+        property_specs: Tuple[_PropertySpec, ...],
     ) -> Dict[str, Any]:
         results_dict: Dict[str, Any] = {}
-        for property_ in properties:
-            key = property_.title
+        for key, cast_value, default in property_specs:
             if key in values_dict:
-                value = values_dict.get(key)
-                if property_.type == "string" and not isinstance(value, str):
-                    value = json.dumps(value)
-                elif property_.type == "boolean" and isinstance(value, (int, float)):
-                    value = bool(value)
-                elif property_.type == "integer" and isinstance(value, (float, bool)):
-                    value = int(value)
-                elif property_.type == "integer" and isinstance(value, str):
-                    # Try converting numeric strings to integers; if it fails, leave as-is
-                    try:
-                        value = int(value.strip())
-                    except ValueError as e:
-                        if not str(e).startswith("could not convert string to int:"):
-                            raise e
-                elif property_.type == "number" and isinstance(value, (int, bool)):
-                    value = float(value)
-                elif property_.type == "number" and isinstance(value, str):
-                    # Try converting numeric strings to floats; if it fails, leave as-is
-                    try:
-                        value = float(value.strip())
-                    except ValueError as e:
-                        if not str(e).startswith("could not convert string to float:"):
-                            raise e
-                results_dict[key] = value
-            elif property_.default is not pyagentspec_empty_default:
-                results_dict[key] = property_.default
+                value = values_dict[key]
+                results_dict[key] = value if cast_value is None else cast_value(value)
+            elif default is not pyagentspec_empty_default:
+                results_dict[key] = default
             else:
                 raise ValueError(
                     f"Expected node `{self.node.name}` to have a value "
-                    f"for property `{property_.title}`, but none was found."
+                    f"for property `{key}`, but none was found."
                 )
         return results_dict
 
@@ -170,21 +228,14 @@ class NodeExecutor(ABC):
         Nodes that can perform true async work should override this to avoid
         thread offloading.
         """
-        return await anyio.to_thread.run_sync(lambda: self._execute(inputs, messages))
+        return await anyio.to_thread.run_sync(self._execute, inputs, messages)
 
     def _get_inputs(self, state: FlowStateSchema) -> Dict[str, Any]:
         """Retrieve the inputs for this node, adding default values when missing, and casting to right type."""
-        inputs = self.node.inputs or []
-        # We retrieve the inputs related to this node
-        io_inputs = {
-            input_name: value
-            for node_id, node_inputs in state["inputs"].items()
-            if node_id == self.node.id
-            for input_name, value in node_inputs.items()
-            # We select only the entries that are generated for specific steps
-            # i.e., the key is a tuple (node_name, node_input)
-        }
-        return self._cast_values_and_add_defaults(io_inputs, inputs)
+        # We retrieve the inputs related to this node, which are stored under its id. They are only
+        # read when casting them, so they do not need to be copied
+        io_inputs = state["inputs"].get(self.node.id, {})
+        return self._cast_values_and_add_defaults(io_inputs, self._input_specs)
 
     def _update_status(
         self,
@@ -193,7 +244,7 @@ class NodeExecutor(ABC):
         previous_state: FlowStateSchema,
     ) -> FlowStateSchema:
         """Updates the status of the flow with the given information"""
-        outputs = self._cast_values_and_add_defaults(outputs, self.node.outputs or [])
+        outputs = self._cast_values_and_add_defaults(outputs, self._output_specs)
         next_node_inputs = previous_state.get("inputs", {})
 
         for edge in self.edges:
@@ -233,8 +284,6 @@ class StartNodeExecutor(NodeExecutor):
         For the StartNode this works in a slightly different way, because inputs do not have the node id
         in their name, as when flows are first invoked they just have the input name as key.
         """
-        inputs = self.node.inputs or []
-
         state_inputs = state.get("inputs", {})
         # The start node takes the key entries that have no node name (i.e., they are not a tuple)
         io_inputs = {
@@ -247,7 +296,7 @@ class StartNodeExecutor(NodeExecutor):
         for node_input in io_inputs:
             state_inputs.pop(node_input)
 
-        return self._cast_values_and_add_defaults(io_inputs, inputs)
+        return self._cast_values_and_add_defaults(io_inputs, self._input_specs)
 
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
         return inputs, NodeExecutionDetails()
@@ -502,7 +551,7 @@ class AgentNodeExecutor(NodeExecutor):
     def _create_react_agent_with_given_input_values(
         self, inputs: Dict[str, Any]
     ) -> CompiledStateGraph[Any, Any]:
-        from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+        AgentSpecToLangGraphConverter = _get_langgraph_converter_class()
 
         if not isinstance(self.node.agent, AgentSpecAgent):
             raise TypeError("AgentNodeExecutor can only be used with AgentSpecAgent agents")
@@ -585,8 +634,12 @@ class InputMessageNodeExecutor(NodeExecutor):
 class OutputMessageNodeExecutor(NodeExecutor):
     node: AgentSpecOutputMessageNode
 
+    def __init__(self, node: AgentSpecOutputMessageNode) -> None:
+        super().__init__(node)
+        self._render_message = _compile_template(self.node.message)
+
     def _execute(self, inputs: Dict[str, Any], messages: Messages) -> ExecuteOutput:
-        message = render_template(self.node.message, inputs)
+        message = self._render_message(inputs)
         generated_messages: List[MessageLike] = [{"role": "assistant", "content": message}]
         return {}, NodeExecutionDetails(generated_messages=generated_messages)
 
@@ -607,6 +660,7 @@ class LlmNodeExecutor(NodeExecutor):
             raise TypeError("Llm can only be initialized with a BaseChatModel")
 
         self.llm: BaseChatModel = llm
+        self._render_prompt_template = _compile_template(self.node.prompt_template)
 
         node_outputs = self.node.outputs or []
         self.requires_structured_generation = not (
@@ -625,8 +679,7 @@ class LlmNodeExecutor(NodeExecutor):
             self.structured_llm = self.llm.with_structured_output(json_schema)
 
     def _build_invoke_inputs(self, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
-        prompt_template = self.node.prompt_template
-        rendered_prompt = render_template(prompt_template, inputs)
+        rendered_prompt = self._render_prompt_template(inputs)
         return [{"role": "user", "content": rendered_prompt}]
 
     def _format_structured_output(
@@ -813,8 +866,6 @@ class CatchExceptionNodeExecutor(NodeExecutor):
             )
         except Exception as e:
             # On exception: default subflow outputs + caught_exception_info
-            import traceback
-
             current_span = get_current_span()
             if current_span:
                 current_span.add_event(
@@ -899,7 +950,7 @@ class MapNodeExecutor(NodeExecutor):
         subflow_inputs_list: List[Dict[str, Any]] = []
         for i in range(num_inputs_to_iterate):
             sub_inputs = {
-                input_.title.replace("iterated_", ""): (
+                input_.title.removeprefix("iterated_"): (
                     inputs[input_.title][i]
                     if input_.title in self.inputs_to_iterate
                     else inputs[input_.title]
@@ -7,7 +7,7 @@
 """This module defines the base class for the definition of inputs and outputs in Components."""
 
 from collections import defaultdict
-from typing import Any, ClassVar, Dict, List, Optional, Set, Union
+from typing import Any, ClassVar, Dict, Hashable, List, Optional, Set, Union
 
 from jsonschema.validators import Draft202012Validator
 from pydantic import (
@@ -436,6 +436,67 @@ def json_schemas_have_same_type(
     return True
 
 
+# Type signature of schemas that do not constrain the type (e.g., ``{}``)
+_ANY_TYPE_SIGNATURE = ("any",)
+
+
+def _json_schema_type_signature(json_schema: JsonSchemaValue) -> Optional[Hashable]:
+    """
+    Return a hashable signature of the type defined by a schema without unions.
+
+    Two such schemas have the same type according to ``json_schemas_have_same_type`` if and only
+    if their signatures are equal. Schemas that use ``anyOf``, ``oneOf``, ``allOf`` or a list of
+    types at any level have no signature (``None``), and should be compared with
+    ``json_schemas_have_same_type`` instead.
+    """
+    json_schema_type = json_schema.get("type")
+    if isinstance(json_schema_type, list) or any(
+        key in json_schema for key in ("anyOf", "oneOf", "allOf")
+    ):
+        return None
+    # Missing inner schemas are compared as empty schemas
+    items_signature = (
+        _json_schema_type_signature(json_schema["items"])
+        if "items" in json_schema
+        else _ANY_TYPE_SIGNATURE
+    )
+    properties_signature = tuple(
+        sorted(
+            (property_name, _json_schema_type_signature(property_json_schema))
+            for property_name, property_json_schema in json_schema.get("properties", {}).items()
+        )
+    )
+    additional_properties = json_schema.get("additionalProperties", None)
+    additional_properties_signature: Optional[Hashable] = (
+        _ANY_TYPE_SIGNATURE
+        if additional_properties is None
+        else (
+            additional_properties
+            if isinstance(additional_properties, bool)
+            else _json_schema_type_signature(additional_properties)
+        )
+    )
+    if (
+        items_signature is None
+        or additional_properties_signature is None
+        or any(signature is None for _, signature in properties_signature)
+    ):
+        return None
+    if (
+        json_schema_type is None
+        and items_signature == _ANY_TYPE_SIGNATURE
+        and not properties_signature
+        and additional_properties_signature == _ANY_TYPE_SIGNATURE
+    ):
+        return _ANY_TYPE_SIGNATURE
+    return (
+        json_schema_type,
+        items_signature,
+        properties_signature,
+        additional_properties_signature,
+    )
+
+
 def property_is_castable_to(property_a: Property, property_b: Property) -> bool:
     return json_schema_is_castable_to(
         property_a.json_schema,
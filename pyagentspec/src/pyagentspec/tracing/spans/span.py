@@ -124,6 +124,16 @@ class Span(BaseModelWithSensitiveInfo):
         """The list of SpanProcessors to which this Span should be forwarded"""
         return self._trace.span_processors if self._trace else []
 
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Whether the span was started with at least one SpanProcessor.
+
+        Events added to a span that is not enabled are not forwarded to anyone, so callers can skip
+        building them.
+        """
+        return len(self._started_span_processors) > 0
+
     def __enter__(self) -> Self:
         self.start()
         return self
@@ -84,3 +84,66 @@ async def test_outputmessagenode_can_be_executed_async(output_message_flow: Flow
     assert len(messages) == 1
     assert isinstance(messages[0], AIMessage)
     assert messages[0].content == "Hey custom"
+
+
+@pytest.fixture()
+def output_message_flow_without_data_flow_edges() -> Flow:
+    custom_input_property = StringProperty(title="custom_input")
+    output_message_node = OutputMessageNode(
+        name="output_message",
+        message="Hey {{custom_input}}",
+        inputs=[custom_input_property],
+    )
+    start_node = StartNode(name="start", inputs=[custom_input_property])
+    end_node = EndNode(name="end")
+    return Flow(
+        name="flow",
+        start_node=start_node,
+        nodes=[start_node, output_message_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(
+                name="start_to_node", from_node=start_node, to_node=output_message_node
+            ),
+            ControlFlowEdge(name="node_to_end", from_node=output_message_node, to_node=end_node),
+        ],
+        inputs=[custom_input_property],
+    )
+
+
+def test_outputmessagenode_receives_inputs_from_derived_data_flow_edges(
+    output_message_flow_without_data_flow_edges: Flow,
+) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    flow = output_message_flow_without_data_flow_edges
+    assert flow.data_flow_connections is None
+
+    agent = AgentSpecLoader().load_component(flow)
+    result = agent.invoke({"inputs": {"custom_input": "custom"}})
+
+    assert result["messages"][-1].content == "Hey custom"
+
+
+def test_flow_conversion_plan_is_reused_until_the_flow_topology_changes(
+    output_message_flow_without_data_flow_edges: Flow,
+) -> None:
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+
+    flow = output_message_flow_without_data_flow_edges
+    plan = AgentSpecToLangGraphConverter()._get_flow_conversion_plan(flow)
+    assert "start-output_message-custom_input" in {edge.name for edge in plan.data_flow_connections}
+    assert AgentSpecToLangGraphConverter()._get_flow_conversion_plan(flow) is plan
+
+    start_node, output_message_node, _ = flow.nodes
+    flow.data_flow_connections = [
+        DataFlowEdge(
+            name="input_edge",
+            source_node=start_node,
+            source_output="custom_input",
+            destination_node=output_message_node,
+            destination_input="custom_input",
+        )
+    ]
+    new_plan = AgentSpecToLangGraphConverter()._get_flow_conversion_plan(flow)
+    assert new_plan is not plan
+    assert new_plan.data_flow_connections == flow.data_flow_connections
@@ -54,6 +54,8 @@ def test_vllm_conversion_maps_url_and_generation_config(default_generation_param
     assert isinstance(base, str) and base.endswith("/v1") and base.startswith("http://")
     assert model.use_responses_api is False
     assert model.temperature == default_generation_parameters.temperature
+    # Local vLLM servers usually do not require an API key
+    assert model.openai_api_key.get_secret_value() == "EMPTY"
 
 
 @pytest.mark.parametrize(
@@ -149,6 +149,20 @@ def test_non_mtls_remote_connections_enable_tls_verification(client_transport, e
     assert connection["httpx_client_factory"].verify.check_hostname is True
 
 
+def test_non_mtls_remote_connections_share_their_httpx_client_factory():
+    converter = AgentSpecToLangGraphConverter()
+    sse_connection = converter._client_transport_convert_to_langgraph(
+        SSETransport(name="my server 2", url="https://example.com/sse")
+    )
+    streamable_http_connection = converter._client_transport_convert_to_langgraph(
+        StreamableHTTPTransport(name="my server 5", url="https://example.com/mcp")
+    )
+
+    assert (
+        sse_connection["httpx_client_factory"] is streamable_http_connection["httpx_client_factory"]
+    )
+
+
 @pytest.fixture(scope="function")
 def agentspec_agent_with_mcp_toolbox(sse_client_transport, big_llama):
     return Agent(
@@ -370,3 +384,370 @@ async def test_flow_with_mcp_tool_with_interrupt(sse_client_transport):
 
     # Server fooza: a*2 + b*3 - 1 => 2*2 + 5*3 - 1 = 18
     assert result["outputs"]["my_result"] == 18
+
+
+def test_tools_of_several_mcp_servers_are_loaded_concurrently(monkeypatch):
+    import asyncio
+    from unittest.mock import patch
+
+    from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+    from langchain_core.messages import AIMessage
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+
+    servers = ["server_a", "server_b"]
+    started_loads = []
+    all_loads_started = asyncio.Event()
+
+    async def load_mcp_tools(session, connection):
+        server = connection["url"].rsplit("/", 1)[-1]
+        started_loads.append(server)
+        if len(started_loads) == len(servers):
+            all_loads_started.set()
+        # Each load only completes once every load started, so sequential loading would hang
+        await asyncio.wait_for(all_loads_started.wait(), timeout=5)
+        return [
+            StructuredTool.from_function(
+                func=lambda: server, name=f"{server}_tool", description=f"Tool of {server}"
+            )
+        ]
+
+    monkeypatch.setattr(_langgraphconverter, "_get_load_mcp_tools", lambda: load_mcp_tools)
+    agent = Agent(
+        name="agent",
+        system_prompt="You are a helpful agent.",
+        llm_config=OpenAiCompatibleConfig(name="llm", model_id="fake", url="null"),
+        toolboxes=[
+            MCPToolBox(
+                name=f"{server}_box",
+                client_transport=SSETransport(name=server, url=f"https://example.com/{server}"),
+            )
+            for server in servers
+        ],
+    )
+    fake_model = FakeMessagesListChatModel(responses=[AIMessage(content="Done")])
+    with patch.object(
+        AgentSpecToLangGraphConverter, "_llm_convert_to_langgraph", return_value=fake_model
+    ):
+        langgraph_agent = AgentSpecLoader().load_component(agent)
+
+    assert sorted(started_loads) == servers
+    assert set(langgraph_agent.builder.nodes["tools"].runnable.tools_by_name) == {
+        "server_a_tool",
+        "server_b_tool",
+    }
+
+
+def test_session_tools_are_found_again_without_scanning_the_tool_registry(monkeypatch):
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+
+    tools = [
+        StructuredTool.from_function(func=lambda: name, name=name, description=name)
+        for name in ("fooza_tool", "bwip_tool")
+    ]
+    tool_registry = {"my_server_tool": lambda: "server"}
+    converter = AgentSpecToLangGraphConverter()
+    assert converter._add_session_tools(tool_registry, tools, "transport::") == {
+        "fooza_tool": tools[0],
+        "bwip_tool": tools[1],
+    }
+    assert set(tool_registry) == {"my_server_tool", "transport::fooza_tool", "transport::bwip_tool"}
+
+    scanned_prefixes = []
+    original_scan = _langgraphconverter._get_session_tools_from_tool_registry
+
+    def scan(tool_registry, conn_prefixes):
+        scanned_prefixes.extend(conn_prefixes)
+        return original_scan(tool_registry, conn_prefixes)
+
+    monkeypatch.setattr(_langgraphconverter, "_get_session_tools_from_tool_registry", scan)
+    assert converter._get_session_tools(tool_registry, "transport::") == {
+        "fooza_tool": tools[0],
+        "bwip_tool": tools[1],
+    }
+    assert scanned_prefixes == []
+
+    # Tools removed from the registry are not returned anymore
+    del tool_registry["transport::bwip_tool"]
+    assert converter._get_session_tools(tool_registry, "transport::") == {"fooza_tool": tools[0]}
+    assert scanned_prefixes == ["transport::"]
+
+
+def test_session_tools_of_several_connections_are_found_in_a_single_pass():
+    from pyagentspec.adapters.langgraph._langgraphconverter import (
+        _get_session_tools_from_tool_registry,
+    )
+
+    tool_registry = {
+        "my_server_tool": "server_tool",
+        "a::fooza_tool": "a_fooza_tool",
+        "a::b::bwip_tool": "a_b_bwip_tool",
+        "b::zbuk_tool": "b_zbuk_tool",
+    }
+    assert _get_session_tools_from_tool_registry(tool_registry, ["a::", "a::b::", "c::"]) == {
+        "a::": {"fooza_tool": "a_fooza_tool", "b::bwip_tool": "a_b_bwip_tool"},
+        "a::b::": {"bwip_tool": "a_b_bwip_tool"},
+        "c::": {},
+    }
+
+
+def _patch_load_mcp_tools(monkeypatch, loaded_connections):
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+
+    async def fooza(a: int, b: int):
+        return f"fooza {a} {b}", None
+
+    async def load_mcp_tools(session, connection):
+        loaded_connections.append(connection)
+        return [
+            StructuredTool(
+                name="fooza_tool",
+                description="Return the result of the fooza operation between a and b.",
+                args_schema={
+                    "type": "object",
+                    "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}},
+                    "required": ["a", "b"],
+                },
+                coroutine=fooza,
+                response_format="content_and_artifact",
+            )
+        ]
+
+    monkeypatch.setattr(_langgraphconverter, "_get_load_mcp_tools", lambda: load_mcp_tools)
+
+
+def test_mcp_tools_without_declared_inputs_keep_the_schema_of_their_server(monkeypatch):
+    import asyncio
+
+    loaded_connections = []
+    _patch_load_mcp_tools(monkeypatch, loaded_connections)
+    fooza_tool = MCPTool(
+        name="fooza_tool",
+        client_transport=SSETransport(name="my server", url="https://example.com/sse"),
+    )
+
+    langgraph_tool = AgentSpecLoader().load_component(fooza_tool)
+
+    assert len(loaded_connections) == 1
+    assert langgraph_tool.description == (
+        "Return the result of the fooza operation between a and b."
+    )
+    assert set(langgraph_tool.args) == {"a", "b"}
+    assert asyncio.run(langgraph_tool.ainvoke({"a": 1, "b": 2})) == "fooza 1 2"
+
+
+def test_mcp_tools_not_exposed_by_their_server_cannot_be_converted(monkeypatch):
+    _patch_load_mcp_tools(monkeypatch, [])
+    zbuk_tool = MCPTool(
+        name="zbuk_tool",
+        client_transport=SSETransport(name="my server", url="https://example.com/sse"),
+    )
+
+    with pytest.raises(ValueError, match="does not expose a tool named 'zbuk_tool'"):
+        AgentSpecLoader().load_component(zbuk_tool)
+
+
+def test_number_of_mcp_servers_loaded_concurrently_is_bounded(monkeypatch):
+    import asyncio
+    from unittest.mock import patch
+
+    from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+    from langchain_core.messages import AIMessage
+
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+
+    servers = ["server_a", "server_b", "server_c"]
+    running_loads = 0
+    max_running_loads = 0
+
+    async def load_mcp_tools(session, connection):
+        nonlocal running_loads, max_running_loads
+        running_loads += 1
+        max_running_loads = max(max_running_loads, running_loads)
+        await asyncio.sleep(0.01)
+        running_loads -= 1
+        return []
+
+    monkeypatch.setattr(_langgraphconverter, "_get_load_mcp_tools", lambda: load_mcp_tools)
+    monkeypatch.setattr(_langgraphconverter, "_MAX_CONCURRENT_MCP_TOOLS_LOADS", 2)
+    agent = Agent(
+        name="agent",
+        system_prompt="You are a helpful agent.",
+        llm_config=OpenAiCompatibleConfig(name="llm", model_id="fake", url="null"),
+        toolboxes=[
+            MCPToolBox(
+                name=f"{server}_box",
+                client_transport=SSETransport(name=server, url=f"https://example.com/{server}"),
+            )
+            for server in servers
+        ],
+    )
+    fake_model = FakeMessagesListChatModel(responses=[AIMessage(content="Done")])
+    with patch.object(
+        AgentSpecToLangGraphConverter, "_llm_convert_to_langgraph", return_value=fake_model
+    ):
+        AgentSpecLoader().load_component(agent)
+
+    assert max_running_loads == 2
+
+
+def test_mcp_tool_spec_and_schema_comparisons_are_memoized(monkeypatch):
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph import _langgraphconverter
+
+    # The comparisons are memoized process-wide, other tests may compare the same schemas
+    _langgraphconverter._json_schemas_of_keys_have_same_type.cache_clear()
+    comparisons = []
+    original_comparison = _langgraphconverter.json_schemas_have_same_type
+
+    def json_schemas_have_same_type(json_schema_a, json_schema_b):
+        comparisons.append((json_schema_a, json_schema_b))
+        return original_comparison(json_schema_a, json_schema_b)
+
+    monkeypatch.setattr(
+        _langgraphconverter, "json_schemas_have_same_type", json_schemas_have_same_type
+    )
+    remote_tool = StructuredTool(
+        name="zbuk_tool",
+        description="zbuk",
+        args_schema={
+            "type": "object",
+            "properties": {
+                "a": {"title": "A", "type": "integer"},
+                "b": {"title": "B", "type": "integer"},
+            },
+        },
+        coroutine=lambda a, b: None,
+    )
+    spec = MCPToolSpec(
+        name="zbuk_tool", inputs=[IntegerProperty(title="a"), IntegerProperty(title="b")]
+    )
+    same_spec = MCPToolSpec(
+        name="zbuk_tool", inputs=[IntegerProperty(title="a"), IntegerProperty(title="b")]
+    )
+    other_spec = MCPToolSpec(name="zbuk_tool", inputs=[IntegerProperty(title="a")])
+
+    are_equal = _langgraphconverter._are_mcp_tool_spec_and_langchain_schemas_equal
+    assert are_equal(spec, remote_tool)
+    assert are_equal(same_spec, remote_tool)
+    assert len(comparisons) == 1
+    # Specs with other inputs are compared again
+    are_equal(other_spec, remote_tool)
+    assert len(comparisons) == 2
+    # Tools with the same canonical schemas as the spec are not compared
+    identical_remote_tool = StructuredTool(
+        name="zbuk_tool",
+        description="zbuk",
+        args_schema={
+            "type": "object",
+            "properties": {property_.title: property_.json_schema for property_ in spec.inputs},
+        },
+        coroutine=lambda a, b: None,
+    )
+    assert are_equal(spec, identical_remote_tool)
+    assert len(comparisons) == 2
+
+
+def test_json_schemas_are_only_copied_to_normalize_their_title():
+    from pyagentspec.adapters.langgraph._langgraphconverter import _normalize_title
+
+    lowercase_title_schema = {"title": "a", "type": "integer"}
+    untitled_schema = {"type": "integer"}
+    uppercase_title_schema = {"title": "A", "type": "integer"}
+
+    assert _normalize_title(lowercase_title_schema) is lowercase_title_schema
+    assert _normalize_title(untitled_schema) is untitled_schema
+    assert _normalize_title(uppercase_title_schema) == {"title": "a", "type": "integer"}
+    assert uppercase_title_schema == {"title": "A", "type": "integer"}
+
+
+def test_session_tools_already_in_the_tool_registry_are_not_added_again():
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import _add_session_tools_to_registry
+
+    fooza_tool, bwip_tool = (
+        StructuredTool.from_function(func=lambda: name, name=name, description=name)
+        for name in ("fooza_tool", "bwip_tool")
+    )
+    tool_registry = {"transport::bwip_tool": bwip_tool}
+
+    with pytest.raises(ValueError, match="Tools already registered: transport::bwip_tool"):
+        _add_session_tools_to_registry(tool_registry, [fooza_tool, bwip_tool], "transport::")
+    # Nothing is added when some tool is already registered
+    assert tool_registry == {"transport::bwip_tool": bwip_tool}
+
+
+def test_inputs_of_the_tools_loaded_from_mcp_servers_are_shared_by_their_arguments():
+    from pyagentspec.adapters.langgraph._langgraphconverter import (
+        _get_mcp_tool_args_key,
+        _get_mcp_tool_inputs,
+    )
+
+    tool_args = {"a": {"title": "A", "type": "integer"}, "b": {"title": "B", "type": "string"}}
+
+    inputs = _get_mcp_tool_inputs(_get_mcp_tool_args_key(tool_args))
+    assert [property_.title for property_ in inputs] == ["a", "b"]
+    assert [property_.type for property_ in inputs] == ["integer", "string"]
+    same_tool_args = {k: dict(v) for k, v in tool_args.items()}
+    assert _get_mcp_tool_inputs(_get_mcp_tool_args_key(same_tool_args)) is inputs
+    # The order of the arguments is kept
+    reordered_inputs = _get_mcp_tool_inputs(
+        _get_mcp_tool_args_key({"b": tool_args["b"], "a": tool_args["a"]})
+    )
+    assert [property_.title for property_ in reordered_inputs] == ["b", "a"]
+    assert _get_mcp_tool_inputs.cache_info().maxsize is not None
+
+
+def test_names_of_the_session_tools_added_to_the_tool_registry_are_interned():
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import (
+        _add_session_tools_to_registry,
+        _get_session_tools_from_tool_registry,
+    )
+
+    tool_name = "".join(["snorf", "_tool"])
+    tool = StructuredTool.from_function(func=lambda: None, name=tool_name, description="snorf")
+    tool_registry = {}
+
+    session_tools = _add_session_tools_to_registry(tool_registry, [tool], "transport::")
+
+    assert next(iter(session_tools)) is sys.intern("snorf_tool")
+    assert next(iter(tool_registry)) is sys.intern("transport::snorf_tool")
+    scanned_session_tools = _get_session_tools_from_tool_registry(tool_registry, ["transport::"])
+    assert next(iter(scanned_session_tools["transport::"])) is sys.intern("snorf_tool")
+
+
+def test_specs_of_the_tools_loaded_from_mcp_servers_are_shared_by_their_loads():
+    from langchain_core.tools import StructuredTool
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import (
+        _MCP_TOOL_OUTPUT_PROPERTY,
+        _get_loaded_mcp_tool_spec,
+    )
+
+    def load_tool(description: str = "glim") -> StructuredTool:
+        return StructuredTool(
+            name="glim_tool",
+            description=description,
+            args_schema={"type": "object", "properties": {"a": {"type": "integer"}}},
+            coroutine=lambda a: None,
+        )
+
+    client_transport = SSETransport(name="glim transport", url="http://localhost/sse")
+    other_client_transport = SSETransport(name="glim transport", url="http://localhost/sse")
+
+    spec = _get_loaded_mcp_tool_spec(client_transport, load_tool())
+    assert spec.client_transport is client_transport
+    assert [property_.title for property_ in spec.inputs] == ["a"]
+    assert spec.outputs[0] is _MCP_TOOL_OUTPUT_PROPERTY
+    assert _get_loaded_mcp_tool_spec(client_transport, load_tool()) is spec
+    assert _get_loaded_mcp_tool_spec(client_transport, load_tool("glom")) is not spec
+    assert _get_loaded_mcp_tool_spec(other_client_transport, load_tool()) is not spec
@@ -84,3 +84,73 @@ def test_agentspec_agent_can_be_converted_to_langgraph() -> None:
     )
     assert isinstance(langgraph_assistant, CompiledStateGraph)
     assert langgraph_assistant.get_name() == "langgraph_assistant"
+
+
+def test_agent_state_typed_dict_is_shared_by_agents_with_same_inputs() -> None:
+    from typing import get_type_hints
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import _create_agent_state_typed_dict
+
+    state_schema = _create_agent_state_typed_dict(
+        "AgentState", [StringProperty(title="user_name"), StringProperty(title="topic", default="")]
+    )
+
+    assert state_schema is _create_agent_state_typed_dict(
+        "AgentState", [StringProperty(title="user_name"), StringProperty(title="topic", default="")]
+    )
+    assert state_schema is not _create_agent_state_typed_dict(
+        "AgentState", [StringProperty(title="user_name"), StringProperty(title="topic")]
+    )
+    assert {"user_name", "topic", "remaining_steps"} <= set(get_type_hints(state_schema))
+    assert "topic" in state_schema.__optional_keys__
+
+
+def test_component_shared_by_several_parents_is_converted_once() -> None:
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+
+    llm_config = OllamaConfig(name="agi_model", model_id="agi_model", url="url_to_my_agi_model")
+    converter = AgentSpecToLangGraphConverter()
+    converted_components = {}
+
+    model = converter.convert(
+        llm_config, {}, converted_components=converted_components, checkpointer=InMemorySaver()
+    )
+
+    assert converted_components == {llm_config.id: model}
+    assert (
+        converter.convert(
+            llm_config, {}, converted_components=converted_components, checkpointer=InMemorySaver()
+        )
+        is model
+    )
+
+
+def test_agents_with_same_inputs_and_outputs_share_their_schemas() -> None:
+    from unittest.mock import patch
+
+    import langchain.agents
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def make_agent() -> Agent:
+        return Agent(
+            name="langgraph_assistant",
+            llm_config=OllamaConfig(
+                name="agi_model", model_id="agi_model", url="url_to_my_agi_model"
+            ),
+            system_prompt="Answer questions about {{topic}}.",
+            inputs=[StringProperty(title="topic")],
+            outputs=[StringProperty(title="answer")],
+        )
+
+    with patch.object(
+        langchain.agents, "create_agent", wraps=langchain.agents.create_agent
+    ) as create_agent:
+        AgentSpecLoader().load_component(make_agent())
+        AgentSpecLoader().load_component(make_agent())
+
+    first_call, second_call = create_agent.call_args_list
+    assert first_call.kwargs["response_format"] is second_call.kwargs["response_format"]
+    assert first_call.kwargs["state_schema"] is second_call.kwargs["state_schema"]
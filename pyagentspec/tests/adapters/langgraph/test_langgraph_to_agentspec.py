@@ -432,3 +432,61 @@ def test_conditional_graph(agentspec_exporter: "AgentSpecExporter") -> None:
         BranchingNode.DEFAULT_BRANCH,
         *typing.get_args(Conditionals),
     }
+
+
+@pytest.mark.parametrize(
+    "connection, expected_transport_type",
+    [
+        pytest.param(
+            {"transport": "stdio", "command": "python", "args": ["server.py"], "cwd": "."},
+            "StdioTransport",
+            id="stdio",
+        ),
+        pytest.param(
+            {"transport": "sse", "url": "http://localhost:8080/sse"},
+            "SSETransport",
+            id="sse",
+        ),
+        pytest.param(
+            {"transport": "streamable_http", "url": "http://localhost:8080/mcp"},
+            "StreamableHTTPTransport",
+            id="streamable_http",
+        ),
+    ],
+)
+def test_convert_mcp_connection_to_agentspec_client_transport(
+    connection: dict[str, Any], expected_transport_type: str
+) -> None:
+    from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
+
+    transport = (
+        LangGraphToAgentSpecConverter()._langgraph_mcp_connection_to_agentspec_client_transport(
+            cast(Any, {**connection, "session_kwargs": {"read_timeout_seconds": 5}})
+        )
+    )
+
+    assert type(transport).__name__ == expected_transport_type
+    assert transport.session_parameters.read_timeout_seconds == 5.0
+
+
+def test_convert_mcp_connection_with_unsupported_transport_raises() -> None:
+    from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
+
+    with pytest.raises(ValueError, match="Unsupported transport: websocket"):
+        LangGraphToAgentSpecConverter()._langgraph_mcp_connection_to_agentspec_client_transport(
+            cast(Any, {"transport": "websocket", "url": "ws://localhost:8080"})
+        )
+
+
+def test_convert_mcp_stdio_connection_without_cwd_keeps_cwd_unset() -> None:
+    from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
+    from pyagentspec.mcp.clienttransport import StdioTransport
+
+    transport = (
+        LangGraphToAgentSpecConverter()._langgraph_mcp_connection_to_agentspec_client_transport(
+            cast(Any, {"transport": "stdio", "command": "python", "args": ["server.py"]})
+        )
+    )
+
+    assert isinstance(transport, StdioTransport)
+    assert transport.cwd is None
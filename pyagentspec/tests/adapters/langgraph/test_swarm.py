@@ -4,6 +4,8 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from typing import Any
+
 from pydantic import SecretStr
 
 from ..conftest import llama70bv33_api_url
@@ -106,3 +108,55 @@ def test_langgraph_swarm_is_converted() -> None:
 
     assert "transfer_to_multiply_agent" in sum_tools_node.tools_by_name
     assert "transfer_to_sum_agent" in multiply_tools_node.tools_by_name
+
+
+def test_reused_converter_does_not_keep_state_across_conversions() -> None:
+
+    from langchain.agents import create_agent
+    from langchain_openai import ChatOpenAI
+    from langgraph_swarm import create_handoff_tool, create_swarm
+
+    from pyagentspec.adapters.langgraph._agentspecconverter import LangGraphToAgentSpecConverter
+    from pyagentspec.swarm import Swarm as AgentSpecSwarm
+
+    model = ChatOpenAI(
+        base_url=llama70bv33_api_url,
+        model="/storage/models/Llama-3.3-70B-Instruct",
+        api_key=SecretStr("t"),
+    )
+
+    def create_swarm_agent(name: str, handoff_to: str) -> Any:
+        return create_agent(
+            model,
+            tools=[create_handoff_tool(agent_name=handoff_to)],
+            system_prompt=f"You are {name}.",
+            name=name,
+        )
+
+    swarm_builder = create_swarm(
+        [create_swarm_agent("a_agent", "b_agent"), create_swarm_agent("b_agent", "a_agent")],
+        default_active_agent="a_agent",
+    )
+    converter = LangGraphToAgentSpecConverter()
+    first_swarm = converter.convert(swarm_builder)
+    assert isinstance(first_swarm, AgentSpecSwarm)
+    assert not converter._keepalive
+    assert not converter._compiled_swarm_cache
+    assert not converter._model_and_prompt_cache
+    assert not converter._agent_names_cache
+
+    # Converting again with the same converter gives an equivalent swarm, computed from scratch
+    second_swarm = converter.convert(swarm_builder)
+    assert isinstance(second_swarm, AgentSpecSwarm)
+    assert second_swarm is not first_swarm
+    assert second_swarm.first_agent.name == first_swarm.first_agent.name == "a_agent"
+    assert len(second_swarm.relationships) == len(first_swarm.relationships) == 2
+    assert not converter._keepalive
+    assert not converter._compiled_swarm_cache
+
+    # Components referenced by id in a dictionary owned by the caller are kept alive
+    referenced_objects = {}
+    third_swarm = converter.convert(swarm_builder, referenced_objects)
+    assert referenced_objects[id(swarm_builder)] is third_swarm
+    assert any(component is swarm_builder for component in converter._keepalive)
+    assert not converter._compiled_swarm_cache
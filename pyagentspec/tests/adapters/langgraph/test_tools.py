@@ -13,6 +13,7 @@ import pytest
 
 from pyagentspec.adapters.langgraph._langgraphconverter import (
     AgentSpecToLangGraphConverter,
+    _add_tool_callback_handler,
 )
 from pyagentspec.agent import Agent
 from pyagentspec.flows.edges.controlflowedge import ControlFlowEdge
@@ -503,6 +504,11 @@ def test_server_tool_confirmation_flow_approve_executes() -> None:
     )
     assert interrupt_payload["action_requests"][0]["name"] == "double_tool"
     assert interrupt_payload["action_requests"][0]["arguments"] == {"x": 5}
+    assert interrupt_payload["action_requests"][0]["description"] == (
+        "Tool execution pending approval\n\nTool: double_tool\nArgs: {'x': 5}"
+    )
+    assert interrupt_payload["review_configs"][0]["action_name"] == "double_tool"
+    assert interrupt_payload["review_configs"][0]["allowed_decisions"] == ["approve", "reject"]
 
     result = langgraph_agent.invoke(_approve_command(), config=config)
     assert result["outputs"] == {"result": 10}
@@ -622,6 +628,122 @@ def test_client_tool_converts_to_structured_tool_with_func_and_coroutine() -> No
     assert inspect.iscoroutinefunction(lang_tool.coroutine)
 
 
+def test_client_tools_with_same_inputs_share_their_args_schema() -> None:
+    from langgraph.checkpoint.memory import MemorySaver
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def load_client_tool(x_default: int) -> Any:
+        client_tool = ClientTool(
+            name="client_double",
+            description="Client doubles the number",
+            inputs=[IntegerProperty(title="x", default=x_default)],
+        )
+        return AgentSpecLoader(checkpointer=MemorySaver()).load_component(client_tool)
+
+    lang_tool = load_client_tool(1)
+
+    assert load_client_tool(1).args_schema is lang_tool.args_schema
+    other_args_schema = load_client_tool(2).args_schema
+    assert other_args_schema is not lang_tool.args_schema
+    assert other_args_schema.model_fields["x"].default == 2
+
+
+def test_conversions_of_the_same_server_tool_share_their_tracing_callback() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def double(x: int) -> int:
+        return x * 2
+
+    server_tool = ServerTool(
+        name="double", inputs=[IntegerProperty(title="x")], outputs=[IntegerProperty(title="y")]
+    )
+    other_server_tool = server_tool.model_copy()
+
+    lang_tool = AgentSpecLoader(tool_registry={"double": double}).load_component(server_tool)
+    same_lang_tool = AgentSpecLoader(tool_registry={"double": double}).load_component(server_tool)
+    other_lang_tool = AgentSpecLoader(tool_registry={"double": double}).load_component(
+        other_server_tool
+    )
+
+    assert same_lang_tool is not lang_tool
+    assert same_lang_tool.callbacks[0] is lang_tool.callbacks[0]
+    assert other_lang_tool.callbacks[0] is not lang_tool.callbacks[0]
+    assert other_lang_tool.callbacks[0].tool is other_server_tool
+
+
+def test_conversions_of_the_same_confirmed_server_tool_share_their_wrapper() -> None:
+    from langgraph.checkpoint.memory import MemorySaver
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    def double(x: int) -> int:
+        return x * 2
+
+    def load_server_tool(name: str) -> Any:
+        server_tool = ServerTool(
+            name=name,
+            inputs=[IntegerProperty(title="x")],
+            outputs=[IntegerProperty(title="y")],
+            requires_confirmation=True,
+        )
+        return AgentSpecLoader(
+            tool_registry={name: double}, checkpointer=MemorySaver()
+        ).load_component(server_tool)
+
+    lang_tool = load_server_tool("double")
+
+    assert lang_tool.func is not double
+    assert load_server_tool("double").func is lang_tool.func
+    assert load_server_tool("twice").func is not lang_tool.func
+
+
+@pytest.mark.parametrize("callbacks_kind", ["none", "list", "handler", "manager"])
+def test_tool_callback_handler_is_added_to_any_kind_of_tool_callbacks(callbacks_kind: str) -> None:
+    from langchain_core.callbacks import BaseCallbackHandler, CallbackManager
+    from langchain_core.tools import StructuredTool
+
+    existing_handler, handler = BaseCallbackHandler(), BaseCallbackHandler()
+    callbacks: Any = {
+        "none": None,
+        "list": [existing_handler],
+        "handler": existing_handler,
+        "manager": CallbackManager(handlers=[existing_handler]),
+    }[callbacks_kind]
+    tool = StructuredTool.from_function(func=lambda x: x, name="identity", description="Identity")
+    tool.callbacks = callbacks
+
+    _add_tool_callback_handler(tool, handler)
+
+    handlers = tool.callbacks.handlers if callbacks_kind == "manager" else tool.callbacks
+    expected_handlers = [handler] if callbacks_kind == "none" else [existing_handler, handler]
+    assert handlers == expected_handlers
+
+
+@pytest.mark.parametrize(
+    "tool, error_message",
+    [
+        (
+            ServerTool(
+                name="double", inputs=[IntegerProperty(title="x")], requires_confirmation=True
+            ),
+            "A Checkpointer is required for tool 'double' because requires_confirmation=True",
+        ),
+        (
+            ClientTool(name="double", inputs=[IntegerProperty(title="x")]),
+            "A Checkpointer is required when using ClientTool 'double'.",
+        ),
+    ],
+)
+def test_tools_needing_a_checkpointer_cannot_be_loaded_without_one(
+    tool: Any, error_message: str
+) -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    with pytest.raises(ValueError, match=error_message):
+        AgentSpecLoader(tool_registry={"double": lambda x: x * 2}).load_component(tool)
+
+
 def test_flow_with_remote_tool_confirmation_approve_executes_http_request() -> None:
     from langchain_core.runnables import RunnableConfig
     from langgraph.checkpoint.memory import MemorySaver
@@ -1159,6 +1281,40 @@ async def test_async_server_tool_callable_converts_to_structured_tool_coroutine(
     assert called["n"] == 1
 
 
+@pytest.mark.anyio
+async def test_async_server_tool_confirmation_flow_approve_executes_via_ainvoke() -> None:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.checkpoint.memory import MemorySaver
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+
+    called = {"n": 0}
+
+    async def double_tool_func(x: int) -> int:
+        called["n"] += 1
+        return x * 2
+
+    server_tool = ServerTool(
+        name="double_tool",
+        description="Doubles the input number",
+        inputs=[IntegerProperty(title="x")],
+        outputs=[Property(title="result", json_schema={})],
+        requires_confirmation=True,
+    )
+    langgraph_agent = AgentSpecLoader(
+        tool_registry={"double_tool": double_tool_func}, checkpointer=MemorySaver()
+    ).load_component(_make_simple_flow_with_tool(ToolNode(name="n", tool=server_tool)))
+    config = RunnableConfig({"configurable": {"thread_id": "async_confirmation"}})
+
+    result = await langgraph_agent.ainvoke({"inputs": {"x": 5}}, config=config)
+    assert result["__interrupt__"][0].value["action_requests"][0]["arguments"] == {"x": 5}
+    assert called["n"] == 0
+
+    result = await langgraph_agent.ainvoke(_approve_command(), config=config)
+    assert result["outputs"] == {"result": 10}
+    assert called["n"] == 1
+
+
 @pytest.mark.anyio
 async def test_async_server_structured_tool_registry_entry_uses_coroutine() -> None:
     from pydantic import BaseModel
@@ -459,3 +459,85 @@ def test_langgraph_flow_tracing_collects_tool_inputs() -> None:
     assert tool_request_events[0].inputs == {"city": "Agadir"}
     assert len(tool_response_events) == 1
     assert tool_response_events[0].outputs == {"forecast": {"city": "Agadir", "condition": "sunny"}}
+
+
+def test_langgraph_agent_execution_span_is_only_started_with_span_processors() -> None:
+    from unittest.mock import patch
+
+    from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+    from langchain_core.messages import AIMessage
+
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.adapters.langgraph._langgraphconverter import AgentSpecToLangGraphConverter
+    from pyagentspec.agent import Agent
+    from pyagentspec.llms import OpenAiCompatibleConfig
+
+    agent = Agent(
+        name="agent",
+        system_prompt="You are a helpful agent.",
+        llm_config=OpenAiCompatibleConfig(name="llm", model_id="fake", url="null"),
+    )
+    fake_model = FakeMessagesListChatModel(responses=[AIMessage(content="Done")] * 2)
+    with patch.object(
+        AgentSpecToLangGraphConverter, "_llm_convert_to_langgraph", return_value=fake_model
+    ):
+        app = AgentSpecLoader().load_component(agent)
+
+    inputs = {"messages": [{"role": "user", "content": "Hi"}]}
+    proc = DummySpanProcessor()
+    with Trace(name="langgraph_agent_trace_test", span_processors=[proc]):
+        response = app.invoke(inputs)
+    assert response["messages"][-1].content == "Done"
+    assert sum(isinstance(span, AgentExecutionSpan) for span in proc.starts) == 1
+    assert [type(event) for (event, _span) in proc.events] == [
+        AgentExecutionStart,
+        AgentExecutionEnd,
+    ]
+
+    with patch(
+        "pyagentspec.adapters.langgraph._langgraphconverter.AgentSpecAgentExecutionSpan"
+    ) as span_cls:
+        response = app.invoke(inputs)
+    assert response["messages"][-1].content == "Done"
+    span_cls.assert_not_called()
+
+
+def test_langgraph_flow_streamed_in_values_mode_reports_its_outputs() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.flows.edges import ControlFlowEdge, DataFlowEdge
+    from pyagentspec.flows.flow import Flow
+    from pyagentspec.flows.nodes import EndNode, StartNode
+    from pyagentspec.property import StringProperty
+
+    city_property = StringProperty(title="city")
+    start_node = StartNode(name="start", inputs=[city_property])
+    end_node = EndNode(name="end", outputs=[city_property])
+    flow = Flow(
+        name="echo_flow",
+        start_node=start_node,
+        nodes=[start_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_end", from_node=start_node, to_node=end_node),
+        ],
+        data_flow_connections=[
+            DataFlowEdge(
+                name="city_edge",
+                source_node=start_node,
+                source_output="city",
+                destination_node=end_node,
+                destination_input="city",
+            ),
+        ],
+    )
+    app = AgentSpecLoader().load_component(flow)
+
+    proc = DummySpanProcessor()
+    with Trace(name="langgraph_flow_values_stream_test", span_processors=[proc]):
+        chunks = list(app.stream({"inputs": {"city": "Agadir"}}, stream_mode="values"))
+
+    assert chunks[-1]["outputs"] == {"city": "Agadir"}
+    flow_end_events = [
+        event for (event, _span) in proc.events if isinstance(event, FlowExecutionEnd)
+    ]
+    assert len(flow_end_events) == 1
+    assert flow_end_events[0].outputs == {"city": "Agadir"}
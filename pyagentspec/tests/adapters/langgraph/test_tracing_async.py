@@ -423,3 +423,44 @@ async def test_langgraph_ainvoke_tracing_emits_agent_llm_and_async_server_tool_e
         assert "sunny" in str(response).lower()
 
     _assert_agent_llm_tool_async(proc)
+
+
+@pytest.mark.anyio
+async def test_langgraph_ainvoke_tracing_remembers_sync_only_flow_span_processors() -> None:
+    from pyagentspec.adapters.langgraph import AgentSpecLoader
+    from pyagentspec.flows.edges.controlflowedge import ControlFlowEdge
+    from pyagentspec.flows.flow import Flow
+    from pyagentspec.flows.nodes.endnode import EndNode
+    from pyagentspec.flows.nodes.startnode import StartNode
+
+    class SyncOnlyFlowSpanProcessor(DummySpanProcessor):
+        async_start_attempts = 0
+
+        async def on_start_async(self, span: Span) -> None:
+            if isinstance(span, FlowExecutionSpan):
+                SyncOnlyFlowSpanProcessor.async_start_attempts += 1
+                raise NotImplementedError
+            await super().on_start_async(span)
+
+    start_node = StartNode(name="start")
+    end_node = EndNode(name="end")
+    flow = Flow(
+        name="flow",
+        start_node=start_node,
+        nodes=[start_node, end_node],
+        control_flow_connections=[
+            ControlFlowEdge(name="start_to_end", from_node=start_node, to_node=end_node),
+        ],
+    )
+    app = AgentSpecLoader().load_component(flow)
+
+    for _ in range(2):
+        proc = SyncOnlyFlowSpanProcessor()
+        async with Trace(name="langgraph_tracing_sync_only_flow_test", span_processors=[proc]):
+            await app.ainvoke(input={"inputs": {}})
+
+        assert sum(isinstance(span, FlowExecutionSpan) for span in proc.starts) == 1
+        assert sum(isinstance(span, FlowExecutionSpan) for span in proc.ends_async) == 1
+
+    # The asynchronous start is not attempted again once it is known to be unsupported
+    assert SyncOnlyFlowSpanProcessor.async_start_attempts == 1
@@ -8,7 +8,11 @@ from typing import Any, Dict
 
 import pytest
 
-from pyagentspec.adapters._utils import render_nested_object_template, render_template
+from pyagentspec.adapters._utils import (
+    _compile_template,
+    render_nested_object_template,
+    render_template,
+)
 
 
 @pytest.mark.parametrize(
@@ -112,3 +116,23 @@ def test_json_template_are_properly_rendered(
     template: str, inputs: Dict[str, Any], expected: str
 ) -> None:
     assert render_nested_object_template(template, inputs) == expected
+
+
+@pytest.mark.parametrize(
+    "template, inputs, expected",
+    [
+        ("a", {}, "a"),
+        ("{{ a}} {{b }}", {"a": 1, "b": 2}, "1 2"),
+        ("{{a}}{{b}}{{a}}{{a}}", {"a": 1, "b": 2}, "1211"),
+        ("{{a}}{{b}}", {"a": "{{b}}", "b": 2}, "{{b}}2"),
+        ("pre {{a}} mid {{c}} suf", {"a": 1}, "pre 1 mid {{c}} suf"),
+        (12, {"a": 1}, "12"),
+    ],
+)
+def test_compiled_templates_are_rendered_like_templates(
+    template: Any, inputs: Dict[str, Any], expected: str
+) -> None:
+    render = _compile_template(template)
+    assert render(inputs) == expected == render_template(template, inputs)
+    # The compiled template can be rendered again with other inputs
+    assert render({}) == render_template(template, {})
@@ -24,6 +24,7 @@ from pyagentspec.property import (
     Property,
     StringProperty,
     UnionProperty,
+    _json_schema_type_signature,
     deduplicate_properties_by_title_and_type,
     json_schema_is_castable_to,
     json_schemas_have_same_type,
@@ -544,6 +545,62 @@ def test_json_schemas_have_same_type(
     assert json_schemas_have_same_type(json_schema_a, json_schema_b) == expected_match
 
 
+@pytest.mark.parametrize(
+    "json_schema_a, json_schema_b, expected_match",
+    [
+        (StringProperty(title="p_a").json_schema, StringProperty(title="p_b").json_schema, True),
+        (StringProperty(title="p_a").json_schema, NumberProperty(title="p_b").json_schema, False),
+        (
+            ListProperty(item_type=StringProperty(title="p_a")).json_schema,
+            ListProperty(item_type=StringProperty(title="p_b")).json_schema,
+            True,
+        ),
+        (
+            ListProperty(item_type=StringProperty()).json_schema,
+            ListProperty(item_type=IntegerProperty()).json_schema,
+            False,
+        ),
+        ({"type": "array"}, {"type": "array", "items": {}}, True),
+        (
+            ObjectProperty(properties={"a": StringProperty(), "b": FloatProperty()}).json_schema,
+            ObjectProperty(properties={"b": FloatProperty(), "a": StringProperty()}).json_schema,
+            True,
+        ),
+        (
+            ObjectProperty(properties={"a": StringProperty()}).json_schema,
+            ObjectProperty(properties={"a": BooleanProperty()}).json_schema,
+            False,
+        ),
+        (
+            DictProperty(value_type=StringProperty()).json_schema,
+            DictProperty(value_type=StringProperty(title="p_b")).json_schema,
+            True,
+        ),
+        ({"type": "object", "additionalProperties": True}, {"type": "object"}, False),
+    ],
+)
+def test_json_schema_type_signatures_match_json_schemas_have_same_type(
+    json_schema_a: JsonSchemaValue, json_schema_b: JsonSchemaValue, expected_match: bool
+) -> None:
+    assert json_schemas_have_same_type(json_schema_a, json_schema_b) == expected_match
+    signature_a = _json_schema_type_signature(json_schema_a)
+    signature_b = _json_schema_type_signature(json_schema_b)
+    assert signature_a is not None and signature_b is not None
+    assert (signature_a == signature_b) == expected_match
+
+
+@pytest.mark.parametrize(
+    "json_schema",
+    [
+        UnionProperty(any_of=[StringProperty(), NullProperty()]).json_schema,
+        {"type": ["string", "null"]},
+        ListProperty(item_type=UnionProperty(any_of=[StringProperty()])).json_schema,
+    ],
+)
+def test_json_schemas_with_unions_have_no_type_signature(json_schema: JsonSchemaValue) -> None:
+    assert _json_schema_type_signature(json_schema) is None
+
+
 @pytest.mark.parametrize(
     "json_schema_a, json_schema_b, expected_match",
     [
@@ -206,6 +206,18 @@ def test_spanprocessor_hooks_called_by_span(dummy_span_processor: DummySpanProce
     assert get_trace() is None
 
 
+def test_span_is_enabled_only_with_started_span_processors(
+    dummy_span_processor: DummySpanProcessor,
+) -> None:
+    with Span() as s:
+        assert not s.is_enabled
+    with Trace(span_processors=[dummy_span_processor]):
+        s = Span()
+        assert not s.is_enabled
+        with s:
+            assert s.is_enabled
+
+
 def test_trace_startup_shutdown_and_nesting(dummy_span_processor: DummySpanProcessor) -> None:
     with Trace(span_processors=[dummy_span_processor]):
         assert dummy_span_processor.started_up is True